@@ -1,15 +1,47 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-import pandas as pd
+from tkinter import filedialog, messagebox, simpledialog, ttk
 import os
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
-import re
-import io
+import sys
+import threading
+import time
 from datetime import datetime
 
+PROGRAM_BASLANGICI = time.perf_counter()
+
+
+def agir_modulleri_yukle():
+    """
+    pandas, numpy, matplotlib ve bunlara dayanan analiz modüllerini içe aktarıp modül adlarına bağlar.
+    Toplam ~1 s süren bu içe aktarmalar, pencere gösterildikten sonra arka plan iş parçacığında yapılır;
+    adlar ana iş parçacığında ancak iş parçacığı bittikten sonra (bkz. DataAnalyzerApp._moduller_hazir) kullanılır.
+    """
+    global pd, np, Figure, FigureCanvasTkAgg, HESAPLAMA_TANIMLARI_DOSYASI, AnalizOturumu, dosyalari_esle, excel_raporu_yaz, excel_sayfalari
+    global grafik_resmi_olustur, VERI_BICIMLERI, veri_bicimi, veri_dosyasi_yaz, satir_secimi
+    global grid_ayarla, gruplama_kurallarini_yukle, kullanici_hesaplamalarini_yukle, varsayilan_hesaplamalar
+    global FormulHatasi, TuretilmisKanallar, hesaplama_tanimi, tanimlari_kaydet, hesaplama_uygulanir_mi
+    global GERILME_CIKTILARI, GERINIM_CIKTILARI, ROZET_TIPLERI, excel_kitabi_yaz, VARSAYILAN_SN_EGIMI, histogram_tablosu, ozet_tablosu
+    global tahmin_dosyasi_oku, VARSAYILAN_TOLERANSLAR
+    import numpy as np
+    import pandas as pd
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from analiz_cekirdegi import (HESAPLAMA_TANIMLARI_DOSYASI, VERI_BICIMLERI, AnalizOturumu, dosyalari_esle, excel_kitabi_yaz,
+                                  excel_raporu_yaz, excel_sayfalari, grafik_resmi_olustur, grid_ayarla, gruplama_kurallarini_yukle,
+                                  kullanici_hesaplamalarini_yukle, satir_secimi, varsayilan_hesaplamalar, veri_bicimi, veri_dosyasi_yaz)
+    from formul_motoru import FormulHatasi, TuretilmisKanallar, hesaplama_tanimi, tanimlari_kaydet
+    from gruplama_kurallari import hesaplama_uygulanir_mi
+    from rozet_analizi import GERILME_CIKTILARI, GERINIM_CIKTILARI, ROZET_TIPLERI
+    from tahmin_karsilastirma import VARSAYILAN_TOLERANSLAR, tahmin_dosyasi_oku
+    from yorulma_analizi import VARSAYILAN_SN_EGIMI, histogram_tablosu, ozet_tablosu
+
+
 class DataAnalyzerApp:
+    TABLO_SATIR_PENCERESI = 200  # Treeview'e aynı anda yazılan en fazla satır sayısı.
+    GRAFIK_NOKTA_SINIRI = 5000   # Bir çizgide çizilen en fazla nokta; fazlası eşit aralıklı seyreltilir (tablo/aktarma tam veriyi kullanır).
+    # Dışa aktarma modları; 'gorunum' ve sonrası o an grafikte gösterilen (kesilmiş olabilen) veriye göre çalışır.
+    DISA_AKTARMA_MODLARI = {"tam": "tüm veri", "gorunum": "grafikteki görünüm (kesilmişse sadece yükleme)",
+                            "yakinlastirma": "grafikte yakınlaştırılan yük aralığı", "seyrek": "görünümün N noktaya seyreltilmiş hali"}
+
     def __init__(self, master):
         self.master = master
         self.master.title("Strain Gauge Veri Analiz ve Görselleştirme Aracı")
@@ -18,40 +50,107 @@ class DataAnalyzerApp:
         self.file_map = {}
         self.annot = None
         self.popup_info = {}
+        self.hover_indeksi = None  # Ana grafiğin tüm noktaları tek dizide; ayrı pencereler de aynı indeksi kullanır.
         
         # --- NİHAİ MİMARİ: TEK GERÇEKLİK KAYNAĞI & DURUM YÖNETİMİ ---
-        self.original_df = None
-        self.prediction_df = None
+        # Veri, SG listeleri, gruplar ve türetilmiş kanallar arayüzden bağımsız analiz oturumunda tutulur.
+        self.oturum = None
+        self.tahmin_verisi = None  # TahminVerisi: SG adıyla indekslenmiş, sütun düzenli tahmin eğrileri
+        self.tahmin_yolu = None    # Toplu model korelasyonunda tüm ID'ler için kullanılabilir
         self.plotted_sgs = []
         self.is_view_trimmed = False
-        
-        self.physical_sg_columns = []
-        self.all_sg_columns = []
-        self.shear_rosettes = {}
-        self.average_pairs = {}
-
-        self.calculations = {
-            "Shear (S = 2B - A - C)": { "inputs": ['A', 'B', 'C'], "output_suffix": 'S', "formula": lambda A, B, C: 2 * B - A - C },
-            "Average (Avg = (D+E)/2)": { "inputs": ['D', 'E'], "output_suffix": 'Avg', "formula": lambda D, E: (D + E) / 2 },
-        }
+        self.cevrim_secimi = {}  # Seçili yük çevrimi/kolu: {'cevrim': 0 tabanlı no, 'kol': 'yukleme'/'bosaltma'}
+        self.cevrim_secenekleri = {}
+        self.gruplama_kurallari = None
+
+        # Tablo, sadece 'Veri Tablosu' sekmesi açıkken ve sadece görünen satır penceresi için doldurulur.
+        self.table_columns = []
+        self.table_offset = 0
+        self.table_dirty = True
+        self.rozet_ayarlari = None  # Son rozet analizinin (tip, E, nu) değerleri; toplu raporda tekrar uygulanır.
+
+        # Hesaplamalar ve kurallar ağır modüller yüklendiğinde doldurulur (bkz. _moduller_hazir).
+        self.calculations = {}
+        self.user_calculations = {}
+        self.sureler = {}  # Başlangıç aşamalarının program başlangıcından itibaren süreleri (s)
+        self.moduller_hazir = False
         self.create_widgets()
+        # Pencere hemen çizilir; analiz modülleri arka planda yüklenirken dosya seçimi devre dışı kalır.
+        self._moduller_yuklendi = False  # Arka plan içe aktarması hatasız bittiyse True.
+        self._agir_yukleyici = threading.Thread(target=self._agir_modulleri_al, daemon=True)
+        self._agir_yukleyici.start()
+        self.master.after(20, self._moduller_yuklendi_mi)
+        self.master.after_idle(lambda: self.sureler.setdefault("pencere", time.perf_counter() - PROGRAM_BASLANGICI))
+
+    def _agir_modulleri_al(self):
+        try: agir_modulleri_yukle(); self._moduller_yuklendi = True
+        except Exception as e: self.master.after(0, self._moduller_yuklenemedi, e)  # Hata ana iş parçacığında gösterilir.
+
+    def _moduller_yuklendi_mi(self):
+        if self._agir_yukleyici.is_alive(): self.master.after(20, self._moduller_yuklendi_mi); return
+        if self._moduller_yuklendi: self._moduller_hazir()
+
+    def _moduller_yuklenemedi(self, hata):
+        self.lbl_durum.config(text="Analiz modülleri yüklenemedi.")
+        messagebox.showerror("Başlatma Hatası", f"Analiz modülleri yüklenemedi; program bu haliyle kullanılamaz:\n{type(hata).__name__}: {hata}")
+
+    def _moduller_hazir(self):
+        """Ağır modüller yüklendikten sonra (ana iş parçacığında) grafik alanını ve hesaplama menüsünü kurar."""
+        if self.moduller_hazir: return
+        self._agir_yukleyici.join()
+        if not self._moduller_yuklendi: return  # Yükleme başarısız; hata _moduller_yuklenemedi ile gösterildi.
+        self.moduller_hazir = True
+        self.gruplama_kurallari = gruplama_kurallarini_yukle()
+        self.calculations = varsayilan_hesaplamalar()
+        # Kullanıcının tanımlayıp kaydettiği formüller; her açılışta dosyadan geri yüklenir.
+        self.user_calculations = kullanici_hesaplamalarini_yukle()
+        self.calculations.update(self.user_calculations)
+        self._hesaplama_menusunu_olustur()
+        self._grafik_alanini_olustur()
+        for btn in (self.btn_dosya_sec, self.btn_klasor_sec, self.btn_tahmin, self.btn_popup, self.btn_export_excel, self.btn_toplu_rapor, self.btn_temizle): btn.config(state="normal")
+        self.lbl_durum.config(text="Hazır.")
+        self.sureler["hazir"] = time.perf_counter() - PROGRAM_BASLANGICI
+
+    # --- ANALİZ OTURUMU ERİŞİMİ (salt okunur) ---
+
+    @property
+    def original_df(self):
+        return self.oturum.df if self.oturum else None
+
+    @property
+    def physical_sg_columns(self):
+        return self.oturum.fiziksel_sgler if self.oturum else []
+
+    @property
+    def all_sg_columns(self):
+        return self.oturum.tum_sgler if self.oturum else []
+
+    @property
+    def sg_gruplari(self):
+        return self.oturum.sg_gruplari if self.oturum else {}
+
+    @property
+    def shear_rosettes(self):
+        return self.oturum.shear_rosettes if self.oturum else {}
+
+    @property
+    def average_pairs(self):
+        return self.oturum.average_pairs if self.oturum else {}
+
+    @property
+    def turetilmis_kanallar(self):
+        return self.oturum.turetilmis if self.oturum else TuretilmisKanallar()
 
     # --- MERKEZİ FONKSİYONLAR ---
 
     def get_display_df(self):
         """O an görüntülenmesi gereken DataFrame'i ana kaynaktan anlık olarak oluşturur."""
         if self.original_df is None: return None
-        if self.is_view_trimmed:
-            load_column = self._get_load_column()
-            if load_column and load_column in self.original_df.columns:
-                try:
-                    max_load_index = self.original_df[load_column].idxmax()
-                    return self.original_df.loc[:max_load_index]
-                except ValueError: return self.original_df
-        return self.original_df
+        return self.oturum.goruntu(self.is_view_trimmed, **self.cevrim_secimi)
 
     def _redraw_all_plots(self):
         """Grafiği ve tabloyu SIFIRDAN çizen TEK sorumlu fonksiyondur."""
+        self._sanal_kolonlari_hazirla(self.plotted_sgs)
         while self.ax.lines: self.ax.lines[0].remove()
         if self.ax.get_legend() is not None: self.ax.get_legend().remove()
         
@@ -62,13 +161,18 @@ class DataAnalyzerApp:
         else:
             x_column = self._get_load_column()
             if x_column:
+                secim = satir_secimi(display_df, x_column, nokta_sayisi=self.GRAFIK_NOKTA_SINIRI)
+                x_data = display_df[x_column].to_numpy(dtype=float)[secim]
+                tahmin = self.tahmin_verisi
                 for sg_name in self.plotted_sgs:
                     if sg_name in display_df.columns:
-                        self.ax.plot(display_df[x_column], display_df[sg_name], marker='o', linestyle='-', label=sg_name)
-                if self.prediction_df is not None:
-                    self.ax.plot(self.prediction_df['Load'], self.prediction_df['Predicted_Strain'], marker='x', linestyle='--', label='Tahmini Değerler')
+                        cizgi, = self.ax.plot(x_data, display_df[sg_name].to_numpy(dtype=float)[secim], marker='o', linestyle='-', label=sg_name)
+                        egri = tahmin.egri(sg_name) if tahmin is not None and not tahmin.tek_egri else None
+                        if egri is not None: self.ax.plot(tahmin.yuk, egri, marker='x', linestyle='--', color=cizgi.get_color(), label=f"{sg_name} (tahmin)")
+                if tahmin is not None and tahmin.tek_egri:
+                    self.ax.plot(tahmin.yuk, tahmin.matris[:, 0], marker='x', linestyle='--', label='Tahmini Değerler')
 
-                if self.plotted_sgs or self.prediction_df is not None:
+                if self.plotted_sgs or tahmin is not None:
                     self.ax.legend()
                 else:
                     self.ax.set_title(f"Yük Oranına Karşı Strain ({self.combo_id.get() or 'ID Seçilmedi'})")
@@ -76,18 +180,59 @@ class DataAnalyzerApp:
         
         self.ax.relim(); self.ax.autoscale_view()
         self._setup_grid(self.ax)
+        self.hover_indeksi = self._hover_indeksi_olustur(self.ax.get_lines())
         self.canvas.draw()
         self._update_main_table()
 
     def _update_main_table(self):
-        """Grafikte o an çizili olan TÜM strain gauge'leri ana tabloda gösterir."""
-        if not self.plotted_sgs or self.original_df is None: self.guncelle_tablo(None); return
-        load_column = self._get_load_column()
-        if not load_column: self.guncelle_tablo(None); return
-        columns_to_show = [load_column] + self.plotted_sgs
-        try:
-            self.guncelle_tablo(self.original_df[columns_to_show])
-        except KeyError: self.guncelle_tablo(None)
+        """Tabloyu kirli olarak işaretler; yeniden oluşturma sadece 'Veri Tablosu' sekmesi görünürken yapılır."""
+        self.table_columns = []
+        if self.plotted_sgs and self.original_df is not None:
+            load_column = self._get_load_column()
+            if load_column:
+                columns_to_show = [load_column] + self.plotted_sgs
+                if all(col in self.original_df.columns or col in self.turetilmis_kanallar for col in columns_to_show): self.table_columns = columns_to_show
+        # Kaydırma konumu korunur (SG ekleme/çıkarma, kesme); _tabloyu_yenile onu geçerli aralığa sıkıştırır.
+        # Sadece veri kaynağı değişince (id_secildi, process_files) başa alınır.
+        self.table_dirty = True
+        if self._tablo_sekmesi_gorunur_mu(): self._tabloyu_yenile()
+
+    def _tablo_sekmesi_gorunur_mu(self):
+        return self.notebook.select() == str(self.tablo_cerceve)
+
+    def on_tab_changed(self, event=None):
+        if self._tablo_sekmesi_gorunur_mu() and self.table_dirty: self._tabloyu_yenile()
+
+    def _tabloyu_yenile(self):
+        """Tablonun sadece görünen satır penceresini (table_offset'ten itibaren) Treeview'e yazar."""
+        self.table_dirty = False
+        if not self.table_columns or self.original_df is None:
+            self.guncelle_tablo(None); self.tree_vsb.set(0, 1); return
+        self._sanal_kolonlari_hazirla(self.table_columns)
+        display_df = self.get_display_df()
+        toplam = len(display_df)
+        self.table_offset = max(0, min(self.table_offset, toplam - self.TABLO_SATIR_PENCERESI))
+        son = min(self.table_offset + self.TABLO_SATIR_PENCERESI, toplam)
+        self.guncelle_tablo(display_df.iloc[self.table_offset:son][self.table_columns])
+        if toplam: self.tree_vsb.set(self.table_offset / toplam, son / toplam)
+        else: self.tree_vsb.set(0, 1)
+
+    def _tablo_kaydir(self, *args):
+        """Dikey kaydırma çubuğu komutu: Treeview yerine satır penceresini kaydırır."""
+        if not self.table_columns or self.original_df is None: return
+        toplam = len(self.get_display_df())
+        if args[0] == 'moveto': yeni_offset = int(float(args[1]) * toplam)
+        elif args[0] == 'scroll':
+            adim = self.TABLO_SATIR_PENCERESI if args[2] == 'pages' else 1
+            yeni_offset = self.table_offset + int(args[1]) * adim
+        else: return
+        yeni_offset = max(0, min(yeni_offset, toplam - self.TABLO_SATIR_PENCERESI))
+        if yeni_offset != self.table_offset: self.table_offset = yeni_offset; self._tabloyu_yenile()
+
+    def _tablo_fare_tekerlegi(self, event):
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0: self._tablo_kaydir('scroll', -3, 'units')
+        else: self._tablo_kaydir('scroll', 3, 'units')
+        return "break"
 
     # --- KULLANICI EYLEM FONKSİYONLARI ---
 
@@ -98,7 +243,15 @@ class DataAnalyzerApp:
         self._redraw_all_plots()
         self.sg_secildi()
         self.btn_trim.config(state="normal"); self.btn_reset_view.config(state="normal")
-        self.lbl_durum.config(text=f"'{selected_sg}' eklendi."); self.notebook.select(0)
+        self.lbl_durum.config(text=f"'{selected_sg}' eklendi.{self._tahmin_ozeti(selected_sg)}"); self.notebook.select(0)
+
+    def _tahmin_ozeti(self, sg_name):
+        """SG'nin eşleşen tahmini varsa o anki görünümde karşılaştırma özeti (durum satırı için), yoksa boş metin."""
+        if self.tahmin_verisi is None or self.tahmin_verisi.sutun_no(sg_name) is None: return ""
+        try: tablo = self._tahmin_karsilastirmasi(dict(sadece_yukleme=self.is_view_trimmed, **self.cevrim_secimi), [sg_name])
+        except ValueError as e: return f" Tahmin: {e}"
+        satir = tablo.iloc[0]
+        return f" Tahmin RMSE: {satir['RMSE (μstrain)']:.1f} μstrain, maks. hata: {satir['Maks. Hata (μstrain)']:.1f} μstrain (yük {satir['Maks. Hata Yükü']:.4g})."
 
     def grafigden_cikar(self):
         selected_sg = self.combo_sg.get()
@@ -111,38 +264,76 @@ class DataAnalyzerApp:
     def sadece_yuklemeyi_goster(self):
         if self.original_df is None: return
         self.is_view_trimmed = True
+        if "cevrim" in self.cevrim_secimi:  # Seçili çevrim varsa onun yükleme koluna geçilir.
+            self.cevrim_secimi = {"cevrim": self.cevrim_secimi["cevrim"], "kol": "yukleme"}
+            self.combo_cevrim.set(next(ad for ad, secim in self.cevrim_secenekleri.items() if secim == self.cevrim_secimi))
         self._redraw_all_plots()
         self.lbl_durum.config(text="Sadece yükleme gösteriliyor.")
 
     def tum_veriyi_goster(self):
         if self.original_df is None: return
-        self.is_view_trimmed = False
+        self.is_view_trimmed = False; self.cevrim_secimi = {}
+        if self.cevrim_secenekleri: self.combo_cevrim.set("Tüm veri")
         self._redraw_all_plots()
         self.lbl_durum.config(text="Tüm veri aralığı gösteriliyor.")
 
+    def _cevrim_secenekleri_olustur(self):
+        """Dosyanın çevrim indeksinden (bir kez hesaplanır) çevrim/kol seçeneklerini oluşturur."""
+        self.cevrim_secimi = {}
+        self.cevrim_secenekleri = {"Tüm veri": {}}
+        cevrimler = self.oturum.cevrimler if self.oturum else None
+        for no in range(len(cevrimler) if cevrimler is not None else 0):
+            tepe = cevrimler.tepe_yuku[no]
+            self.cevrim_secenekleri[f"Çevrim {no + 1} (tepe {tepe:g})"] = {"cevrim": no}
+            self.cevrim_secenekleri[f"Çevrim {no + 1} - Yükleme"] = {"cevrim": no, "kol": "yukleme"}
+            self.cevrim_secenekleri[f"Çevrim {no + 1} - Boşaltma"] = {"cevrim": no, "kol": "bosaltma"}
+        self.combo_cevrim.config(values=list(self.cevrim_secenekleri), state="readonly" if cevrimler is not None else "disabled")
+        self.combo_cevrim.set("Tüm veri")
+        return len(cevrimler) if cevrimler is not None else 0
+
+    def cevrim_secildi(self, event=None):
+        """Seçilen çevrim/kol, saklanan indeksten slice olarak alınır; veri yeniden taranmaz."""
+        if self.original_df is None: return
+        self.cevrim_secimi = self.cevrim_secenekleri.get(self.combo_cevrim.get(), {})
+        self.is_view_trimmed = False
+        self._redraw_all_plots()
+        self.lbl_durum.config(text=f"{self.combo_cevrim.get()} gösteriliyor.")
+
     def perform_calculation(self, calc_name):
         if self.original_df is None: return
         calculation = self.calculations.get(calc_name)
-        formula, output_suffix = calculation["formula"], calculation["output_suffix"]
-        gruplar = self.shear_rosettes if "Shear" in calc_name else self.average_pairs
-        if not gruplar: messagebox.showwarning("Grup Bulunamadı", f"'{calc_name}' için uygun gruplar bulunamadı."); return
-        calculated_count, newly_added_sgs = 0, []
-        for prefix, gauges in gruplar.items():
-            new_col_name = f"{prefix}{output_suffix}:{gauges.get('suffix', 'SG')}"
-            if new_col_name in self.original_df.columns: continue
-            try:
-                input_data = {inp: self.original_df[gauges[inp]] for inp in calculation["inputs"]}
-                self.original_df[new_col_name] = formula(**input_data)
-                newly_added_sgs.append(new_col_name); calculated_count += 1
-            except KeyError as e: print(f"Uyarı: {prefix} için {e} bulunamadı, atlanıyor.")
-        if calculated_count > 0:
-            self.all_sg_columns.extend(newly_added_sgs); self.filtrele_sg()
-            self._redraw_all_plots()
-            messagebox.showinfo("Başarılı", f"{calculated_count} adet '{calc_name}' sonucu hesaplandı.")
+        formula = calculation["formula"]
+        eksik_sgler = [sg for sg in formula.sg_adlari if sg not in self.original_df.columns and sg not in self.turetilmis_kanallar]
+        if eksik_sgler: messagebox.showwarning("SG Bulunamadı", f"Formüldeki şu SG'ler veride yok: {', '.join(eksik_sgler)}"); return
+        if formula.harfler and not any(hesaplama_uygulanir_mi(g, calculation["output_suffix"]) and all(h in g for h in formula.harfler) for g in self.sg_gruplari.values()):
+            messagebox.showwarning("Grup Bulunamadı", f"'{calc_name}' için uygun gruplar bulunamadı."); return
+        calculated_count = self._hesaplamalari_uygula({calc_name: calculation})
+        if calculated_count > 0: messagebox.showinfo("Başarılı", f"{calculated_count} adet '{calc_name}' kanalı eklendi (değerler ilk kullanımda hesaplanır).")
         else: messagebox.showinfo("Bilgi", "Hesaplanacak yeni veri bulunmuyor.")
 
+    def tum_hesaplamalari_uygula(self):
+        """Menüdeki tüm hesaplamaları tüm uygun gruplar için sanal kanal olarak tek seferde kaydeder."""
+        if self.original_df is None: return
+        calculated_count = self._hesaplamalari_uygula(self.calculations)
+        if calculated_count > 0: messagebox.showinfo("Başarılı", f"Toplam {calculated_count} adet hesaplanmış kanal eklendi.")
+        else: messagebox.showinfo("Bilgi", "Hesaplanacak yeni veri bulunmuyor.")
+
+    def _hesaplamalari_uygula(self, tanimlar):
+        """Hesaplamaların çıktılarını oturumda sanal kanal olarak kaydeder; değerler ilk kullanımda hesaplanır."""
+        return self._kanal_kaydini_yansit(*self.oturum.hesaplamalari_uygula(tanimlar))
+
+    def _kanal_kaydini_yansit(self, sayi, etkilenen):
+        """Oturumdaki kanal kaydının sonucunu arayüze yansıtır: SG listesi ve değeri değişen çizimler/tablo."""
+        if sayi: self.filtrele_sg()
+        if etkilenen.intersection(self.plotted_sgs) or etkilenen.intersection(self.table_columns): self._redraw_all_plots()
+        return sayi
+
+    def _sanal_kolonlari_hazirla(self, kolonlar):
+        if self.oturum: self.oturum.kolonlari_hazirla(kolonlar)
+
     def grafigi_temizle(self):
-        self.plotted_sgs.clear(); self.prediction_df = None; self.is_view_trimmed = False
+        self.plotted_sgs.clear(); self.tahmin_verisi = None; self.is_view_trimmed = False; self.cevrim_secimi = {}
+        if self.cevrim_secenekleri: self.combo_cevrim.set("Tüm veri")
         self._redraw_all_plots()
         self.ax.set_title("Grafik Temizlendi"); self.canvas.draw()
         if self.annot: self.annot.set_visible(False)
@@ -152,40 +343,323 @@ class DataAnalyzerApp:
         if hasattr(self, 'calculate_menubutton'): self.calculate_menubutton.config(state=state)
         self.lbl_durum.config(text="Grafik temizlendi.")
 
-    def tabloyu_excele_aktar(self):
+    def yeni_hesaplama_tanimla(self):
+        """Kullanıcıdan ad, formül ve çıktı eki alır; formülü doğrulayıp kaydeder ve menüye ekler."""
+        ad = simpledialog.askstring("Yeni Hesaplama", "Hesaplamanın adı:", parent=self.master)
+        if not ad: return
+        if ad in self.calculations and ad not in self.user_calculations:
+            messagebox.showerror("Hata", f"'{ad}' yerleşik bir hesaplamanın adıdır."); return
+        ifade = simpledialog.askstring("Yeni Hesaplama", "Formül (ör. (A - C)/2 veya sqrt((A-C)**2 + (2B-A-C)**2))\nTam SG adı için ters tırnak kullanın: `1001A:MON1`", parent=self.master)
+        if not ifade: return
+        cikti_eki = simpledialog.askstring("Yeni Hesaplama", "Çıktı sütunu eki (ör. Tmax):", parent=self.master)
+        if not cikti_eki: return
+        try: tanim = hesaplama_tanimi(ad, ifade, cikti_eki)
+        except FormulHatasi as e: messagebox.showerror("Formül Hatası", str(e)); return
+        self.user_calculations[ad] = tanim; self.calculations[ad] = tanim
+        try: tanimlari_kaydet(HESAPLAMA_TANIMLARI_DOSYASI, self.user_calculations)
+        except OSError as e: messagebox.showwarning("Kayıt Hatası", f"Hesaplama tanımı dosyaya kaydedilemedi: {e}")
+        self._hesaplama_menusunu_olustur()
+        if self.original_df is not None: self.perform_calculation(ad)
+
+    def _hesaplama_menusunu_olustur(self):
+        self.calc_menu.delete(0, tk.END)
+        for calc_name in self.calculations: self.calc_menu.add_command(label=calc_name, command=lambda n=calc_name: self.perform_calculation(n))
+        self.calc_menu.add_command(label="Tüm Hesaplamaları Uygula", command=self.tum_hesaplamalari_uygula)
+        self.calc_menu.add_separator(); self.calc_menu.add_command(label="Rozet Analizi (Asal Gerinim/Gerilme)...", command=self.rozet_analizi_yap)
+        self.calc_menu.add_command(label="Yorulma Analizi (Rainflow)...", command=self.rainflow_analizi_yap)
+        self.calc_menu.add_command(label="Histerezis / Kalıcı Gerinim Analizi", command=self.histerezis_analizi_yap)
+        self.calc_menu.add_command(label="Doğrusallık Analizi (Eğim / R²)", command=self.dogrusallik_analizi_yap)
+        self.calc_menu.add_command(label="Tahmin Karşılaştırması (RMSE / Maks. Hata)", command=self.tahmin_karsilastirmasi_yap)
+        self.calc_menu.add_command(label="Toplu Model Korelasyonu (Tüm ID'ler)...", command=self.toplu_korelasyon_olustur)
+        self.calc_menu.add_command(label="Yeni Hesaplama Tanımla...", command=self.yeni_hesaplama_tanimla)
+
+    def rozet_analizi_yap(self):
+        """Tüm A/B/C rozetleri için asal gerinim, maks. kayma, asal açı ve (E, ν verilirse) gerilme kanalları ekler."""
+        if self.original_df is None: return
+        if not self.shear_rosettes: messagebox.showwarning("Grup Bulunamadı", "A/B/C rozet grubu bulunamadı."); return
+        tip = simpledialog.askstring("Rozet Analizi", f"Rozet tipi ({' / '.join(ROZET_TIPLERI)}):", initialvalue="dik", parent=self.master)
+        if not tip: return
+        tip = tip.strip().lower()
+        if tip not in ROZET_TIPLERI: messagebox.showerror("Hata", f"Bilinmeyen rozet tipi: '{tip}'."); return
+        E = simpledialog.askfloat("Rozet Analizi", "Elastisite modülü E (MPa)\nGerilme hesaplanmayacaksa boş bırakıp İptal'e basın:", parent=self.master, minvalue=0)
+        nu = simpledialog.askfloat("Rozet Analizi", "Poisson oranı ν:", initialvalue=0.33, parent=self.master, minvalue=0, maxvalue=0.5) if E else None
+        # Her çıktı sanal kanal olarak kaydedilir; ilk istendiğinde tüm rozetler tek bir vektörel çağrıda çözülür.
+        ekler = list(GERINIM_CIKTILARI) + (list(GERILME_CIKTILARI) if E and nu is not None else [])
+        eklenen = self._kanal_kaydini_yansit(*self.oturum.rozet_analizi(tip, E, nu))
+        self.rozet_ayarlari = (tip, E, nu)
+        if not eklenen: messagebox.showinfo("Bilgi", "Hesaplanacak yeni veri bulunmuyor."); return
+        messagebox.showinfo("Başarılı", f"{len(self.shear_rosettes)} rozet için {eklenen} adet kanal eklendi/güncellendi ({', '.join(ekler)}).")
+
+    def rainflow_analizi_yap(self):
+        """Grafikteki SG'ler (türetilmiş kanallar dahil) için mevcut görünümde rainflow çevrim sayımı ve hasar toplamı."""
+        if self.original_df is None: return
+        if not self.plotted_sgs: messagebox.showwarning("SG Seçilmedi", "Önce analiz edilecek SG'leri grafiğe ekleyin."); return
+        m = simpledialog.askfloat("Yorulma Analizi", "Hasar toplamı için S-N eğimi m (Σ n·Δε^m):", initialvalue=VARSAYILAN_SN_EGIMI,
+                                  minvalue=0.1, parent=self.master)
+        if not m: return
+        sg_names, secim = list(self.plotted_sgs), {"sadece_yukleme": self.is_view_trimmed, **self.cevrim_secimi}
+        # Sanal kanallar ana iş parçacığında hazırlanır; arka planda sadece sayım yapılır.
+        self._sanal_kolonlari_hazirla(sg_names)
+        # Sayım sürerken başka dosya seçilebilir; sonuç ve süre sayımı başlatan oturumdan okunur.
+        oturum, dosya_id = self.oturum, self.combo_id.get()
+        durum = {"sonuc": None, "hata": None}
+        def say():
+            try: durum["sonuc"] = oturum.rainflow_say(sg_names, **secim)
+            except Exception as e: durum["hata"] = e
+        sayici = threading.Thread(target=say, daemon=True); sayici.start()
+        self.lbl_durum.config(text=f"{len(sg_names)} kanal için rainflow sayımı yapılıyor...")
+        def izle():
+            if sayici.is_alive(): self.master.after(100, izle); return
+            if durum["hata"]:
+                self.lbl_durum.config(text="Yorulma analizi sırasında bir hata oluştu.")
+                messagebox.showerror("Yorulma Analizi Hatası", str(durum["hata"])); return
+            sonuclar = durum["sonuc"]; ozet = ozet_tablosu(sonuclar, m)
+            self.lbl_durum.config(text=f"Rainflow sayımı tamamlandı ({oturum.sureler['rainflow']:.2f} s).")
+            self._sonuc_tablosu_goster(f"Yorulma Analizi (Rainflow, m = {m:g}) - {dosya_id}", ozet, f"Rainflow_{dosya_id}.xlsx",
+                                       lambda: [("Ozet", ozet, None), ("Histogram", histogram_tablosu(sonuclar), None)])
+        izle()
+
+    def histerezis_analizi_yap(self):
+        """Seçili çevrimin (yoksa en yüksek tepenin) yükleme/boşaltma kolları arasındaki histerezisi tüm fiziksel SG'ler için hesaplar."""
+        if self.original_df is None: return
+        cevrim = self.cevrim_secimi.get("cevrim")
+        try: tablo = self.oturum.histerezis(cevrim=cevrim)
+        except ValueError as e: messagebox.showerror("Histerezis Analizi", str(e)); return
+        kapsam = f"Çevrim {cevrim + 1}" if cevrim is not None else "en yüksek tepenin çevrimi"
+        self.lbl_durum.config(text=f"Histerezis analizi tamamlandı: {len(tablo)} SG, {kapsam} ({self.oturum.sureler['histerezis'] * 1000:.0f} ms).")
+        self._sonuc_tablosu_goster(f"Histerezis ve Kalıcı Gerinim ({kapsam}) - {self.combo_id.get()}", tablo,
+                                   f"Histerezis_{self.combo_id.get()}.xlsx", lambda: [("Histerezis", tablo, None)])
+
+    def dogrusallik_analizi_yap(self):
+        """Seçili çevrimin (yoksa en yüksek tepeyi içeren çevrimin) yükleme kolunda tüm fiziksel SG'lerin doğrusallığını sıralar."""
+        if self.original_df is None: return
+        cevrim = self.cevrim_secimi.get("cevrim")
+        try: tablo = self.oturum.dogrusallik(cevrim=cevrim)
+        except ValueError as e: messagebox.showerror("Doğrusallık Analizi", str(e)); return
+        kapsam = f"Çevrim {cevrim + 1} yükleme kolu" if cevrim is not None else "en yüksek tepenin yükleme kolu"
+        self.lbl_durum.config(text=f"Doğrusallık analizi tamamlandı: {len(tablo)} SG, {kapsam} ({self.oturum.sureler['dogrusallik'] * 1000:.0f} ms).")
+        self._sonuc_tablosu_goster(f"Doğrusallık (en az doğrusal önce, {kapsam}) - {self.combo_id.get()}", tablo,
+                                   f"Dogrusallik_{self.combo_id.get()}.xlsx", lambda: [("Dogrusallik", tablo, None)])
+
+    def _tahmin_karsilastirmasi(self, secim, sg_names=None):
+        """Tahmini olan SG'leri (varsayılan: grafiktekiler) seçili satırlarda tahminleriyle karşılaştırır (eşleşen yoksa None)."""
+        if self.tahmin_verisi is None: return None
+        sg_names = self.tahmin_verisi.eslesenler(self.plotted_sgs if sg_names is None else sg_names)
+        if not sg_names: return None
+        # Seyreltme sadece görüntü içindir; hatalar her zaman tam çözünürlükte hesaplanır.
+        secim = {k: v for k, v in secim.items() if k != "nokta_sayisi"}
+        return self.oturum.tahmin_karsilastir(sg_names, self.tahmin_verisi.yuk, self.tahmin_verisi.tahminler(sg_names), **secim)
+
+    def tahmin_karsilastirmasi_yap(self):
+        """Grafikteki SG'lerin tahminden sapmasını (RMSE, maks. hata, sınır yükte bağıl hata) o anki görünümde sıralar."""
+        if self.tahmin_verisi is None: messagebox.showwarning("Eksik Bilgi", "Lütfen önce bir tahmin dosyası yükleyin."); return
+        if not self.plotted_sgs: messagebox.showwarning("Eksik Bilgi", "Lütfen önce grafiğe en az bir çizgi ekleyin."); return
+        try: tablo = self._tahmin_karsilastirmasi(dict(sadece_yukleme=self.is_view_trimmed, **self.cevrim_secimi))
+        except ValueError as e: messagebox.showerror("Tahmin Karşılaştırması", str(e)); return
+        if tablo is None: messagebox.showwarning("Eşleşme Yok", "Grafikteki SG'lerin hiçbiri için tahmin sütunu bulunamadı."); return
+        self.lbl_durum.config(text=f"Tahmin karşılaştırması tamamlandı: {len(tablo)} SG ({self.oturum.sureler['karsilastir'] * 1000:.0f} ms).")
+        self._sonuc_tablosu_goster(f"Tahmin Karşılaştırması (en büyük RMSE önce) - {self.combo_id.get()}", tablo,
+                                   f"Karsilastirma_{self.combo_id.get()}.xlsx", lambda: [("Karsilastirma", tablo, None)])
+
+    def _sonuc_tablosu_goster(self, baslik, df, dosya_adi=None, sayfalar=None):
+        """
+        Analiz sonucunu ayrı pencerede, başlığa tıklanarak sıralanabilen bir tabloda gösterir. sayfalar() verilirse
+        [(sayfa adı, DataFrame, grafik|None)] listesi 'Excel'e Kaydet' ile tek çalışma kitabına yazılır.
+        """
+        pencere = tk.Toplevel(self.master); pencere.title(baslik); pencere.geometry("850x400")
+        if sayfalar:
+            def kaydet():
+                filepath = filedialog.asksaveasfilename(parent=pencere, defaultextension=".xlsx", filetypes=[("Excel Dosyaları", "*.xlsx")],
+                                                        initialfile=dosya_adi)
+                if not filepath: return
+                try: excel_kitabi_yaz(filepath, sayfalar())
+                except Exception as e: messagebox.showerror("Kaydetme Hatası", str(e), parent=pencere); return
+                self.lbl_durum.config(text=f"Sonuçlar '{os.path.basename(filepath)}' dosyasına kaydedildi.")
+            ttk.Button(pencere, text="Excel'e Kaydet", command=kaydet).pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
+        cerceve = ttk.Frame(pencere, padding=5); cerceve.pack(fill=tk.BOTH, expand=True)
+        tree = ttk.Treeview(cerceve, show='headings', columns=list(df.columns)); vsb = ttk.Scrollbar(cerceve, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=vsb.set); vsb.pack(side='right', fill='y'); tree.pack(side='left', fill='both', expand=True)
+        durum = {"df": df, "kolon": None, "artan": True}
+        def doldur():
+            tree.delete(*tree.get_children())
+            for satir in durum["df"].itertuples(index=False): tree.insert("", tk.END, values=[f"{v:.6g}" if isinstance(v, float) else v for v in satir])
+        def sirala(kolon):
+            durum["artan"] = not durum["artan"] if durum["kolon"] == kolon else True
+            durum["kolon"], durum["df"] = kolon, durum["df"].sort_values(kolon, ascending=durum["artan"], kind="stable")
+            doldur()
+        for kolon in df.columns: tree.heading(kolon, text=kolon, command=lambda k=kolon: sirala(k)); tree.column(kolon, width=110, anchor='center')
+        doldur()
+        return pencere
+
+    def sg_secildi(self, event=None):
+        """Sadece +/- butonlarının durumunu günceller; tablo burada yeniden oluşturulmaz."""
+        selected_sg = self.combo_sg.get()
+        if not selected_sg or self.original_df is None:
+            self.btn_plus.config(state="disabled"); self.btn_minus.config(state="disabled"); return
+        is_plotted = selected_sg in self.plotted_sgs
+        self.btn_plus.config(state="disabled" if is_plotted else "normal")
+        self.btn_minus.config(state="normal" if is_plotted else "disabled")
+        self.lbl_durum.config(text=f"'{selected_sg}' seçildi.")
+
+    def tabloyu_disa_aktar(self):
         if not self.plotted_sgs or self.original_df is None:
-            messagebox.showwarning("Veri Yok", "Excel'e aktarılacak veri bulunmuyor."); return
+            messagebox.showwarning("Veri Yok", "Dışa aktarılacak veri bulunmuyor."); return
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         initial_filename = f"Analiz_Raporu_{timestamp}.xlsx"
+        veri_dosya_tipleri = [(f"{ad} Dosyaları", f"*{uzanti}") for uzanti, (ad, _) in VERI_BICIMLERI.items()]
         filepath = filedialog.asksaveasfilename(
-            title="Excel Raporunu Kaydet", initialfile=initial_filename,
-            defaultextension=".xlsx", filetypes=[("Excel Dosyaları", "*.xlsx"), ("Tüm Dosyalar", "*.*")]
+            title="Raporu / Veriyi Kaydet", initialfile=initial_filename, defaultextension=".xlsx",
+            filetypes=[("Excel Dosyaları", "*.xlsx")] + veri_dosya_tipleri + [("Tüm Dosyalar", "*.*")]
         )
         if not filepath: return
+        excel_mi = filepath.lower().endswith(".xlsx")
+        uzanti, ima_edilen = veri_bicimi(filepath)
+        if not excel_mi and uzanti not in VERI_BICIMLERI:
+            messagebox.showerror("Hata", f"Desteklenmeyen dosya biçimi: '{uzanti}'."); return
+        secim = self._disa_aktarma_secimi()
+        if secim is None: return
+        if not excel_mi:
+            ad, sikistirmalar = VERI_BICIMLERI[uzanti]
+            sikistirma = simpledialog.askstring("Dışa Aktar", f"{ad} sıkıştırması ({' / '.join(sikistirmalar)}):",
+                                                initialvalue=ima_edilen or sikistirmalar[0], parent=self.master)
+            if not sikistirma: return
+            sikistirma = sikistirma.strip().lower()
+            if sikistirma not in sikistirmalar: messagebox.showerror("Hata", f"{ad} için geçersiz sıkıştırma: '{sikistirma}'."); return
         try:
-            load_column = self._get_load_column()
-            if not load_column: messagebox.showerror("Hata", "Yük verisi sütunu bulunamadı."); return
-            columns_to_show = [load_column] + self.plotted_sgs
-            export_df = self.original_df[columns_to_show]
-            graph_image_stream = self._create_graph_image()
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-                sheet_name = 'Rapor'
-                export_df.to_excel(writer, sheet_name=sheet_name, index=False)
-                if graph_image_stream:
-                    from openpyxl.drawing.image import Image
-                    from openpyxl.utils import get_column_letter
-                    workbook = writer.book; worksheet = workbook[sheet_name]
-                    image_col_num = len(export_df.columns) + 2
-                    image_col_letter = get_column_letter(image_col_num)
-                    image_anchor_cell = f'{image_col_letter}1'
-                    img = Image(graph_image_stream)
-                    worksheet.add_image(img, image_anchor_cell)
-                else: messagebox.showwarning("Grafik Hatası", "Grafik oluşturulamadığı için rapora eklenemedi.")
-            self.lbl_durum.config(text=f"Rapor başarıyla '{os.path.basename(filepath)}' dosyasına aktarıldı.")
-            messagebox.showinfo("Başarılı", "Veri ve grafik içeren Excel raporu başarıyla oluşturuldu!")
+            if not self._get_load_column(): messagebox.showerror("Hata", "Yük verisi sütunu bulunamadı."); return
+            # Sanal kanallar ve grafik burada (ana iş parçacığında) hazırlanır; sadece dosya yazımı arka plana alınır.
+            export_df, graph_image_stream = self.oturum.rapor_hazirla(self.plotted_sgs, grafik_basligi=self._grafik_basligi() if excel_mi else None,
+                                                                      grafik_sg_sayisi=len(self.plotted_sgs), **secim)
         except Exception as e:
-            self.lbl_durum.config(text="Excel'e aktarma sırasında bir hata oluştu.")
-            messagebox.showerror("Aktarma Hatası", f"Rapor oluşturulurken bir hata oluştu:\n{e}")
+            self.lbl_durum.config(text="Dışa aktarma sırasında bir hata oluştu.")
+            messagebox.showerror("Aktarma Hatası", f"Rapor oluşturulurken bir hata oluştu:\n{e}"); return
+        # Karşılaştırma raporun eki: hesaplanamazsa (ör. tahmin yük aralığı seçimle örtüşmüyor) sayfa atlanır, rapor yine yazılır.
+        karsilastirma, uyari = None, None
+        try: karsilastirma = self._tahmin_karsilastirmasi(secim) if excel_mi else None
+        except ValueError as e: uyari = f"'Karsilastirma' sayfası eklenmedi: {e}"
+        if excel_mi and karsilastirma is not None:
+            sayfalar = [("Rapor", export_df, graph_image_stream), ("Karsilastirma", karsilastirma, None)]
+            self._dosya_yazimini_baslat(filepath, export_df, lambda ilerleme: excel_kitabi_yaz(filepath, sayfalar, ilerleme), graph_image_stream)
+        elif excel_mi: self._dosya_yazimini_baslat(filepath, export_df, lambda ilerleme: excel_raporu_yaz(filepath, export_df, graph_image_stream, ilerleme=ilerleme),
+                                                   graph_image_stream, uyari=uyari)
+        else: self._dosya_yazimini_baslat(filepath, export_df, lambda ilerleme: veri_dosyasi_yaz(filepath, export_df, sikistirma))
+
+    def _disa_aktarma_secimi(self):
+        """Kullanıcıya aktarma modunu sorar; oturum.rapor_hazirla için satır seçimi argümanlarını döner (iptalde None)."""
+        secenekler = "\n".join(f"  {mod}: {aciklama}" for mod, aciklama in self.DISA_AKTARMA_MODLARI.items())
+        mod = simpledialog.askstring("Dışa Aktar", f"Aktarma modu:\n{secenekler}", parent=self.master,
+                                     initialvalue="gorunum" if self.is_view_trimmed else "tam")
+        if not mod: return None
+        mod = mod.strip().lower()
+        if mod not in self.DISA_AKTARMA_MODLARI: messagebox.showerror("Hata", f"Bilinmeyen aktarma modu: '{mod}'."); return None
+        if mod == "tam": return {}
+        secim = {"sadece_yukleme": self.is_view_trimmed, **self.cevrim_secimi}
+        if mod == "yakinlastirma": secim["x_araligi"] = self.ax.get_xlim()
+        elif mod == "seyrek":
+            nokta_sayisi = simpledialog.askinteger("Dışa Aktar", "SG başına nokta sayısı:", initialvalue=1000, minvalue=2, parent=self.master)
+            if not nokta_sayisi: return None
+            secim["nokta_sayisi"] = nokta_sayisi
+        return secim
+
+    def _dosya_yazimini_baslat(self, filepath, export_df, yazici_fonksiyon, graph_image_stream=None, uyari=None):
+        """
+        yazici_fonksiyon(ilerleme) çağrısını arka plan iş parçacığında çalıştırır; ilerleme durum satırında gösterilir.
+        graph_image_stream sadece Excel raporlarında verilir; uyari başarı mesajının ardından durum satırına eklenir.
+        """
+        excel_mi = filepath.lower().endswith(".xlsx")
+        # Toplam yazıcının bildirdiğiyle güncellenir: çok sayfalı kitapta (ör. Karsilastirma) export_df'ten fazla satır yazılır.
+        durum = {"yazilan": 0, "toplam": len(export_df), "hata": None}
+        def yaz():
+            try: yazici_fonksiyon(lambda yazilan, toplam: durum.update(yazilan=yazilan, toplam=toplam))
+            except Exception as e: durum["hata"] = e
+        # daemon değil: pencere kapatılsa bile yarım kalmış bir dosya bırakılmaz.
+        yazici = threading.Thread(target=yaz); yazici.start()
+        self.btn_export_excel.config(state="disabled")
+        def izle():
+            if yazici.is_alive():
+                yuzde = 100 * durum["yazilan"] / durum["toplam"] if durum["toplam"] else 100
+                if excel_mi: self.lbl_durum.config(text=f"Excel raporu yazılıyor... {durum['yazilan']:,}/{durum['toplam']:,} satır (%{yuzde:.0f})")
+                else: self.lbl_durum.config(text=f"'{os.path.basename(filepath)}' yazılıyor... ({durum['toplam']:,} satır)")
+                self.master.after(100, izle); return
+            self.btn_export_excel.config(state="normal")
+            if durum["hata"]:
+                self.lbl_durum.config(text="Dışa aktarma sırasında bir hata oluştu.")
+                messagebox.showerror("Aktarma Hatası", f"Rapor oluşturulurken bir hata oluştu:\n{durum['hata']}"); return
+            if not excel_mi:
+                self.lbl_durum.config(text=f"Veri başarıyla '{os.path.basename(filepath)}' dosyasına aktarıldı.")
+                messagebox.showinfo("Başarılı", f"{len(export_df):,} satır x {len(export_df.columns)} sütun dışa aktarıldı."); return
+            if not graph_image_stream: messagebox.showwarning("Grafik Hatası", "Grafik oluşturulamadığı için rapora eklenemedi.")
+            sayfa_sayisi = len(excel_sayfalari(len(export_df)))  # Sadece veri ('Rapor') sayfasının bölünmesi
+            self.lbl_durum.config(text=f"Rapor başarıyla '{os.path.basename(filepath)}' dosyasına aktarıldı." + (f" {uyari}" if uyari else ""))
+            ek = f"\nVeri Excel satır sınırı nedeniyle {sayfa_sayisi} sayfaya bölündü." if sayfa_sayisi > 1 else ""
+            messagebox.showinfo("Başarılı", f"Veri ve grafik içeren Excel raporu başarıyla oluşturuldu!{ek}")
+        izle()
+
+    def toplu_rapor_olustur(self):
+        """Grafikteki SG listesi için file_map'teki tüm ID'lerin raporlarını süreç havuzunda üretir."""
+        if not self.file_map: messagebox.showwarning("Veri Yok", "Önce bir dosya veya klasör seçin."); return
+        if not self.plotted_sgs: messagebox.showwarning("Eksik Bilgi", "Rapora alınacak SG'leri önce grafiğe ekleyin."); return
+        klasor = filedialog.askdirectory(title="Raporların yazılacağı klasörü seçin")
+        if not klasor: return
+        tek_kitap = messagebox.askyesno("Toplu Rapor", "Tüm ID'ler tek bir çalışma kitabına (her ID ayrı sayfa) yazılsın mı?\n"
+                                                       "Hayır: her ID için ayrı bir Excel dosyası yazılır.")
+        from toplu_analiz import metrik_metni, varsayilan_ayarlar
+        # Türetilmiş kanallar her dosyada aynı tanımlarla yeniden kaydedilir; fiziksel olmayan SG yoksa hesaplama yapılmaz.
+        turetilmis_var = any(sg not in self.physical_sg_columns for sg in self.plotted_sgs)
+        tip, E, nu = self.rozet_ayarlari if turetilmis_var and self.rozet_ayarlari else (None, None, None)
+        ayarlar = varsayilan_ayarlar(cikti_klasoru=klasor, hesaplamalar=["hepsi"] if turetilmis_var else [], rozet=tip, E=E, nu=nu,
+                                     sg=list(self.plotted_sgs), sadece_yukleme=self.is_view_trimmed, grafik=True, **self.cevrim_secimi,
+                                     grafik_sg_sayisi=len(self.plotted_sgs),
+                                     tek_kitap=os.path.join(klasor, f"Toplu_Rapor_{datetime.now():%Y-%m-%d_%H-%M-%S}.xlsx") if tek_kitap else None)
+        self._toplu_isi_baslat("Toplu Rapor", ayarlar, lambda ozetler, metrikler: f"{len(ozetler)} rapor '{klasor}' klasörüne yazıldı.\n{metrik_metni(metrikler)}")
+
+    def toplu_korelasyon_olustur(self):
+        """file_map'teki tüm ID'lerde tahmini olan her SG'yi süreç havuzunda karşılaştırır; tek korelasyon raporu yazar."""
+        if not self.file_map: messagebox.showwarning("Veri Yok", "Önce bir dosya veya klasör seçin."); return
+        tahmin = self.tahmin_yolu if self.tahmin_yolu and messagebox.askyesno(
+            "Model Korelasyonu", f"Yüklü tahmin dosyası ('{os.path.basename(self.tahmin_yolu)}') tüm ID'ler için kullanılsın mı?\n"
+                                 "Hayır: ID başına tahmin dosyalarını (ör. TAHMIN_<ID>_FE.dat) içeren klasörü seçin.") else None
+        tahmin = tahmin or filedialog.askdirectory(title="ID başına tahmin dosyalarını içeren klasörü seçin")
+        if not tahmin: return
+        bagil_hata = simpledialog.askfloat("Tolerans Bandı", "Sınır yükte izin verilen |bağıl hata| (%):", parent=self.master,
+                                           initialvalue=VARSAYILAN_TOLERANSLAR["bagil_hata"], minvalue=0.0)
+        if bagil_hata is None: return
+        klasor = filedialog.askdirectory(title="Korelasyon raporunun yazılacağı klasörü seçin")
+        if not klasor: return
+        from toplu_analiz import varsayilan_ayarlar
+        ayarlar = varsayilan_ayarlar(cikti_klasoru=klasor, tahmin=tahmin, sadece_yukleme=self.is_view_trimmed, **self.cevrim_secimi,
+                                     toleranslar={**VARSAYILAN_TOLERANSLAR, "bagil_hata": bagil_hata})
+        def sonuc_metni(ozetler, metrikler):
+            if not ozetler or not ozetler[0]["cikti"]: return "Tahmini olan SG bulunamadı; korelasyon raporu yazılmadı."
+            gecen, toplam = sum(ozet["gecen"] for ozet in ozetler), sum(ozet["karsilastirilan"] for ozet in ozetler)
+            return f"{toplam} karşılaştırmanın {gecen} tanesi toleransta.\nRapor: {ozetler[0]['cikti']}"
+        self._toplu_isi_baslat("Model Korelasyonu", ayarlar, sonuc_metni)
+
+    def _toplu_isi_baslat(self, baslik, ayarlar, sonuc_metni):
+        """file_map'teki tüm dosyalar için toplu_isle'yi arka planda çalıştırır; ilerleme durum satırında, sonuç mesajla gösterilir."""
+        from toplu_analiz import toplu_isle
+        import multiprocessing
+        dosyalar = [self.file_map[file_id] for file_id in sorted(self.file_map)]
+        durum = {"biten": 0, "sonuc": None, "hata": None}
+        def bildir(dosya, ozet, hata): durum["biten"] += 1
+        def calistir():
+            # Tk iş parçacıkları 'fork' ile kopyalanmasın diye alt süreçler 'spawn' ile başlatılır.
+            try: durum["sonuc"] = toplu_isle(dosyalar, ayarlar, os.cpu_count() or 1, bildir, multiprocessing.get_context("spawn"))
+            except Exception as e: durum["hata"] = e
+        isci = threading.Thread(target=calistir); isci.start()
+        self.btn_toplu_rapor.config(state="disabled")
+        def izle():
+            if isci.is_alive():
+                self.lbl_durum.config(text=f"{baslik} oluşturuluyor... {durum['biten']}/{len(dosyalar)} dosya")
+                self.master.after(200, izle); return
+            self.btn_toplu_rapor.config(state="normal")
+            if durum["hata"]: messagebox.showerror(f"{baslik} Hatası", str(durum["hata"])); self.lbl_durum.config(text=f"{baslik} başarısız."); return
+            ozetler, hatalar, metrikler = durum["sonuc"]
+            hata_metni = "".join(f"\n  {os.path.basename(dosya)}: {hata}" for dosya, hata in hatalar.items())
+            self.lbl_durum.config(text=f"{baslik} tamamlandı: {len(ozetler)} başarılı, {len(hatalar)} hatalı.")
+            (messagebox.showwarning if hatalar else messagebox.showinfo)(
+                baslik, sonuc_metni(ozetler, metrikler) + (f"\n\nHatalı dosyalar:{hata_metni}" if hatalar else ""))
+        izle()
 
     # --- YARDIMCI VE ARAYÜZ FONKSİYONLARI ---
 
@@ -193,131 +667,114 @@ class DataAnalyzerApp:
         main_frame = ttk.Frame(self.master, padding=10); main_frame.pack(fill=tk.BOTH, expand=True)
         kontrol_cerceve = ttk.LabelFrame(main_frame, text="Kontrol Paneli", padding=10); kontrol_cerceve.pack(fill=tk.X, pady=5)
         kontrol_cerceve.columnconfigure(1, weight=1); kontrol_cerceve.columnconfigure(3, weight=1)
-        self.btn_dosya_sec = ttk.Button(kontrol_cerceve, text="Tek Dosya Seç", command=self.dosya_sec); self.btn_dosya_sec.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
-        self.btn_klasor_sec = ttk.Button(kontrol_cerceve, text="Veri Klasörü Seç", command=self.klasor_sec); self.btn_klasor_sec.grid(row=0, column=1, columnspan=3, padx=5, pady=5, sticky="ew")
+        self.btn_dosya_sec = ttk.Button(kontrol_cerceve, text="Tek Dosya Seç", command=self.dosya_sec, state="disabled"); self.btn_dosya_sec.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+        self.btn_klasor_sec = ttk.Button(kontrol_cerceve, text="Veri Klasörü Seç", command=self.klasor_sec, state="disabled"); self.btn_klasor_sec.grid(row=0, column=1, columnspan=3, padx=5, pady=5, sticky="ew")
         self.lbl_kaynak_yolu = ttk.Label(kontrol_cerceve, text="Dosya veya klasör seçilmedi..."); self.lbl_kaynak_yolu.grid(row=1, column=0, columnspan=4, padx=5, pady=5, sticky="w")
         lbl_id = ttk.Label(kontrol_cerceve, text="Dosya ID:"); lbl_id.grid(row=2, column=0, padx=5, pady=5, sticky="w")
         self.combo_id = ttk.Combobox(kontrol_cerceve, state="readonly", width=30); self.combo_id.grid(row=2, column=1, padx=5, pady=5, sticky="ew"); self.combo_id.bind("<<ComboboxSelected>>", self.id_secildi)
         lbl_sg_search = ttk.Label(kontrol_cerceve, text="Strain Gauge Ara:"); lbl_sg_search.grid(row=2, column=2, padx=(10, 5), pady=5, sticky="w")
         self.entry_search_sg = ttk.Entry(kontrol_cerceve); self.entry_search_sg.grid(row=2, column=3, padx=5, pady=5, sticky="ew"); self.entry_search_sg.bind("<KeyRelease>", self.filtrele_sg); self.entry_search_sg.bind("<Return>", self.on_search_enter)
+        lbl_cevrim = ttk.Label(kontrol_cerceve, text="Yük Çevrimi:"); lbl_cevrim.grid(row=3, column=0, padx=5, pady=5, sticky="w")
+        self.combo_cevrim = ttk.Combobox(kontrol_cerceve, state="disabled", width=30); self.combo_cevrim.grid(row=3, column=1, padx=5, pady=5, sticky="ew"); self.combo_cevrim.bind("<<ComboboxSelected>>", self.cevrim_secildi)
         sg_frame = ttk.Frame(kontrol_cerceve); sg_frame.grid(row=3, column=2, columnspan=2, sticky="ew")
         lbl_sg = ttk.Label(sg_frame, text="Strain Gauge Seç:"); lbl_sg.pack(side=tk.LEFT, padx=(10, 5))
         self.combo_sg = ttk.Combobox(sg_frame, state="readonly"); self.combo_sg.pack(side=tk.LEFT, fill=tk.X, expand=True); self.combo_sg.bind("<<ComboboxSelected>>", self.sg_secildi)
         self.btn_plus = ttk.Button(sg_frame, text="+", command=self.grafige_ekle, width=3, state="disabled"); self.btn_plus.pack(side=tk.LEFT, padx=(5, 0))
         self.btn_minus = ttk.Button(sg_frame, text="-", command=self.grafigden_cikar, width=3, state="disabled"); self.btn_minus.pack(side=tk.LEFT, padx=(2, 0))
-        self.btn_tahmin = ttk.Button(kontrol_cerceve, text="Tahmin Verisi Yükle (.dat)", command=self.tahmin_verisi_yukle); self.btn_tahmin.grid(row=4, column=0, padx=5, pady=10, sticky="ew")
+        self.btn_tahmin = ttk.Button(kontrol_cerceve, text="Tahmin Verisi Yükle (.dat)", command=self.tahmin_verisi_yukle, state="disabled"); self.btn_tahmin.grid(row=4, column=0, padx=5, pady=10, sticky="ew")
         self.calculate_menubutton = ttk.Menubutton(kontrol_cerceve, text="Hesaplamalar", state="disabled"); self.calculate_menubutton.grid(row=4, column=1, padx=5, pady=10, sticky="ew")
-        calc_menu = tk.Menu(self.calculate_menubutton, tearoff=0); self.calculate_menubutton["menu"] = calc_menu
-        for calc_name in self.calculations: calc_menu.add_command(label=calc_name, command=lambda n=calc_name: self.perform_calculation(n))
-        self.btn_temizle = ttk.Button(kontrol_cerceve, text="TÜM GRAFİĞİ TEMİZLE", command=self.grafigi_temizle); self.btn_temizle.grid(row=4, column=2, columnspan=2, padx=5, pady=10, sticky="ew")
-        self.btn_popup = ttk.Button(kontrol_cerceve, text="Grafiği Ayrı Pencerede Aç", command=self.grafik_popup); self.btn_popup.grid(row=5, column=0, padx=5, pady=5, sticky="ew")
-        self.btn_export_excel = ttk.Button(kontrol_cerceve, text="Tabloyu Excel'e Aktar", command=self.tabloyu_excele_aktar); self.btn_export_excel.grid(row=5, column=1, padx=5, pady=5, sticky="ew")
+        self.calc_menu = tk.Menu(self.calculate_menubutton, tearoff=0); self.calculate_menubutton["menu"] = self.calc_menu
+        self._hesaplama_menusunu_olustur()
+        self.btn_temizle = ttk.Button(kontrol_cerceve, text="TÜM GRAFİĞİ TEMİZLE", command=self.grafigi_temizle, state="disabled"); self.btn_temizle.grid(row=4, column=2, columnspan=2, padx=5, pady=10, sticky="ew")
+        self.btn_popup = ttk.Button(kontrol_cerceve, text="Grafiği Ayrı Pencerede Aç", command=self.grafik_popup, state="disabled"); self.btn_popup.grid(row=5, column=0, padx=5, pady=5, sticky="ew")
+        self.btn_export_excel = ttk.Button(kontrol_cerceve, text="Tabloyu Dışa Aktar", command=self.tabloyu_disa_aktar, state="disabled"); self.btn_export_excel.grid(row=5, column=1, padx=5, pady=5, sticky="ew")
         self.btn_trim = ttk.Button(kontrol_cerceve, text="Sadece Yüklemeyi Göster", command=self.sadece_yuklemeyi_goster, state="disabled"); self.btn_trim.grid(row=5, column=2, padx=5, pady=5, sticky="ew")
         self.btn_reset_view = ttk.Button(kontrol_cerceve, text="Tüm Veriyi Göster", command=self.tum_veriyi_goster, state="disabled"); self.btn_reset_view.grid(row=5, column=3, padx=5, pady=5, sticky="ew")
-        self.lbl_durum = ttk.Label(kontrol_cerceve, text="Hazır."); self.lbl_durum.grid(row=6, column=0, columnspan=4, sticky="w", padx=5)
+        self.btn_toplu_rapor = ttk.Button(kontrol_cerceve, text="Tüm ID'ler İçin Toplu Rapor", command=self.toplu_rapor_olustur, state="disabled"); self.btn_toplu_rapor.grid(row=6, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        self.lbl_durum = ttk.Label(kontrol_cerceve, text="Analiz modülleri yükleniyor..."); self.lbl_durum.grid(row=7, column=0, columnspan=4, sticky="w", padx=5)
         self.notebook = ttk.Notebook(main_frame); self.notebook.pack(fill=tk.BOTH, expand=True, pady=10)
-        grafik_cerceve = ttk.Frame(self.notebook, padding=10); self.notebook.add(grafik_cerceve, text="Ana Grafik")
-        tablo_cerceve = ttk.Frame(self.notebook, padding=10); self.notebook.add(tablo_cerceve, text="Veri Tablosu")
-        self.fig, self.ax = plt.subplots(dpi=100); self._setup_grid(self.ax)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=grafik_cerceve); self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        self.tree = ttk.Treeview(tablo_cerceve, show='headings'); vsb = ttk.Scrollbar(tablo_cerceve, orient="vertical", command=self.tree.yview); hsb = ttk.Scrollbar(tablo_cerceve, orient="horizontal", command=self.tree.xview); self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set); vsb.pack(side='right', fill='y'); hsb.pack(side='bottom', fill='x'); self.tree.pack(side='left', fill='both', expand=True)
+        self.grafik_cerceve = ttk.Frame(self.notebook, padding=10); self.notebook.add(self.grafik_cerceve, text="Ana Grafik")
+        self.tablo_cerceve = tablo_cerceve = ttk.Frame(self.notebook, padding=10); self.notebook.add(tablo_cerceve, text="Veri Tablosu")
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        self.tree = ttk.Treeview(tablo_cerceve, show='headings'); self.tree_vsb = vsb = ttk.Scrollbar(tablo_cerceve, orient="vertical", command=self._tablo_kaydir); hsb = ttk.Scrollbar(tablo_cerceve, orient="horizontal", command=self.tree.xview); self.tree.configure(xscrollcommand=hsb.set); vsb.pack(side='right', fill='y'); hsb.pack(side='bottom', fill='x'); self.tree.pack(side='left', fill='both', expand=True)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"): self.tree.bind(sequence, self._tablo_fare_tekerlegi)
+
+    def _grafik_alanini_olustur(self):
+        # pyplot yerine doğrudan Figure: pyplot'un figür yöneticisi ve içe aktarma maliyeti gerekmez.
+        self.fig = Figure(dpi=100); self.ax = self.fig.add_subplot(); self._setup_grid(self.ax)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.grafik_cerceve); self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         self.annot = self.ax.annotate("", xy=(0, 0), xytext=(20, 20), textcoords="offset points", bbox=dict(boxstyle="round", fc="yellow", alpha=0.7), arrowprops=dict(arrowstyle="->")); self.annot.set_visible(False)
         self.fig.canvas.mpl_connect("motion_notify_event", self.on_hover)
 
-    def _read_dat_file_with_fallback(self, filepath, **kwargs):
-        """Dosyayı önce UTF-8, sonra 'latin-1' ile okumayı dener."""
-        try:
-            return pd.read_csv(filepath, encoding='utf-8', **kwargs)
-        except UnicodeDecodeError:
-            print(f"Uyarı: '{os.path.basename(filepath)}' UTF-8 ile okunamadı. 'latin-1' deneniyor...")
-            return pd.read_csv(filepath, encoding='latin-1', **kwargs)
-
     def id_secildi(self, event=None):
         self.grafigi_temizle()
         selected_id = self.combo_id.get();
         if not selected_id: return
         filepath = self.file_map[selected_id]
         try:
-            header_df = self._read_dat_file_with_fallback(filepath, sep=r'\s+', header=None, nrows=2, engine='python')
-            header_row, unit_row = header_df.iloc[0], header_df.iloc[1]
-            sg_columns = [h for h, u in zip(header_row, unit_row) if u == 'μstrain']
-            self.original_df = self._read_dat_file_with_fallback(filepath, sep=r'\s+', header=0, skiprows=[1], engine='python')
-            for col in self.original_df.columns: self.original_df[col] = pd.to_numeric(self.original_df[col], errors='coerce').fillna(0)
+            self.oturum = AnalizOturumu.dosyadan(filepath, self.gruplama_kurallari); self.table_offset = 0
             self.calculate_menubutton.config(state="normal")
-            self.physical_sg_columns = sg_columns[:]; self.all_sg_columns = sg_columns[:]
-            self._tespit_et_hesaplama_gruplarini()
+            cevrim_sayisi = self._cevrim_secenekleri_olustur()
             self.filtrele_sg()
             self._redraw_all_plots()
-            self.lbl_durum.config(text=f"{selected_id} yüklendi.")
+            self.lbl_durum.config(text=f"{selected_id} yüklendi ({cevrim_sayisi} yük çevrimi).")
         except Exception as e:
             messagebox.showerror("Veri Okuma Hatası", f"'{os.path.basename(filepath)}' okunurken hata: {e}")
-            self.original_df = None; self.guncelle_tablo(None)
+            self.oturum = None; self.guncelle_tablo(None)
 
-    def on_hover(self, event):
-        if event.inaxes != self.ax: return
-        vis = self.annot.get_visible()
-        lines = self.ax.get_lines()
-        if not lines: return
-        min_dist = float('inf'); closest_point = None
-        for line in lines:
-            x_data, y_data = line.get_data()
-            if len(x_data) == 0 or event.xdata is None: continue
-            distances = np.hypot(x_data - event.xdata, y_data - event.ydata)
-            idx = np.argmin(distances); dist = distances[idx]
-            if dist < min_dist: min_dist = dist; closest_point = (x_data[idx], y_data[idx], line)
-        if closest_point:
-            xlim = self.ax.get_xlim(); ylim = self.ax.get_ylim()
+    @staticmethod
+    def _hover_indeksi_olustur(lines):
+        """Çizgilerin noktalarını tek dizide birleştirir: (x, y, çizgi no, renkler). Fare hareketinde tek bir vektörel arama yapılır."""
+        veriler = [line.get_data() for line in lines]
+        if not veriler: return None
+        x = np.concatenate([np.asarray(x_data, dtype=float) for x_data, _ in veriler])
+        y = np.concatenate([np.asarray(y_data, dtype=float) for _, y_data in veriler])
+        cizgi_no = np.repeat(np.arange(len(veriler)), [len(x_data) for x_data, _ in veriler])
+        return x, y, cizgi_no, [line.get_color() for line in lines]
+
+    def _yakin_noktayi_goster(self, event, ax, annot, canvas, indeks):
+        vis = annot.get_visible()
+        if indeks is None or event.xdata is None or event.ydata is None or not len(indeks[0]): return
+        x_data, y_data, cizgi_no, renkler = indeks
+        distances = np.hypot(x_data - event.xdata, y_data - event.ydata)
+        idx = np.nanargmin(distances) if not np.isnan(distances).all() else None
+        if idx is not None:
+            xlim = ax.get_xlim(); ylim = ax.get_ylim()
             if xlim[1] == xlim[0] or ylim[1] == ylim[0]: return
             tolerance = 0.05 * np.sqrt((xlim[1] - xlim[0])**2 + (ylim[1] - ylim[0])**2)
-            if min_dist < tolerance:
-                x, y, line = closest_point; self.annot.xy = (x, y)
-                self.annot.set_text(f"Load: {x:.2f}\nStrain: {y:.2f}"); self.annot.get_bbox_patch().set_facecolor(line.get_color()); self.annot.set_visible(True)
+            if distances[idx] < tolerance:
+                x, y = x_data[idx], y_data[idx]; annot.xy = (x, y)
+                annot.set_text(f"Load: {x:.2f}\nStrain: {y:.2f}"); annot.get_bbox_patch().set_facecolor(renkler[cizgi_no[idx]]); annot.set_visible(True)
             else:
-                if vis: self.annot.set_visible(False)
+                if vis: annot.set_visible(False)
         else:
-            if vis: self.annot.set_visible(False)
-        self.canvas.draw_idle()
-        
+            if vis: annot.set_visible(False)
+        canvas.draw_idle()
+
+    def on_hover(self, event):
+        if event.inaxes != self.ax: return
+        self._yakin_noktayi_goster(event, self.ax, self.annot, self.canvas, self.hover_indeksi)
+
+    def on_popup_hover(self, event):
+        canvas = event.canvas
+        if canvas not in self.popup_info: return
+        info = self.popup_info[canvas]
+        if event.inaxes != info['ax']:
+            if info['annot'].get_visible(): info['annot'].set_visible(False); canvas.draw_idle()
+            return
+        self._yakin_noktayi_goster(event, info['ax'], info['annot'], canvas, info['hover_indeksi'])
+
     def _get_load_column(self):
-        if self.original_df is None: return None
-        return next((col for col in self.original_df.columns if 'Load_Ratio' in col), None)
-
-    def _tespit_et_hesaplama_gruplarini(self):
-        self.shear_rosettes, self.average_pairs = {}, {}
-        gecici_gruplar = {}
-        pattern = re.compile(r"(\d+)([A-Z])$")
-        for sg_name in self.physical_sg_columns:
-            if ":" in sg_name:
-                base_name, suffix_part = sg_name.split(':', 1)
-                match = pattern.match(base_name)
-                if match:
-                    prefix, letter = match.group(1), match.group(2)
-                    if prefix not in gecici_gruplar: gecici_gruplar[prefix] = {"suffix": suffix_part}
-                    gecici_gruplar[prefix][letter] = sg_name
-        for prefix, gauges in gecici_gruplar.items():
-            if 'A' in gauges and 'B' in gauges and 'C' in gauges: self.shear_rosettes[prefix] = gauges
-            if 'D' in gauges and 'E' in gauges: self.average_pairs[prefix] = gauges
-            
+        return self.oturum.yuk_kolonu if self.oturum else None
+
+    def _grafik_basligi(self):
+        return f"Yük Oranına Karşı Strain ({self.combo_id.get() or 'ID Seçilmedi'})"
+
     def _create_graph_image(self):
-        display_df = self.get_display_df()
-        if display_df is None or not self.plotted_sgs: return None
-        x_column = self._get_load_column()
-        if not x_column: return None
-        fig, ax = plt.subplots(figsize=(8, 6), dpi=150)
-        for sg_name in self.plotted_sgs:
-            if sg_name in display_df.columns:
-                ax.plot(display_df[x_column], display_df[sg_name], marker='o', linestyle='-', label=sg_name)
-        ax.set_title(f"Yük Oranına Karşı Strain ({self.combo_id.get() or 'ID Seçilmedi'})")
-        ax.set_xlabel("Yük Oranı (%)"); ax.set_ylabel("Strain (μstrain)"); self._setup_grid(ax); ax.legend()
-        img_io = io.BytesIO()
-        fig.savefig(img_io, format='png', bbox_inches='tight'); img_io.seek(0)
-        plt.close(fig)
-        return img_io
+        return grafik_resmi_olustur(self.get_display_df(), self._get_load_column(), self.plotted_sgs, self._grafik_basligi())
 
     def _setup_grid(self, ax):
-        ax.grid(which='major', linestyle='-', linewidth='0.6', color='grey', alpha=0.7)
-        ax.grid(which='minor', linestyle=':', linewidth='0.5', color='grey', alpha=0.4)
-        ax.minorticks_on()
+        grid_ayarla(ax)
 
     def on_search_enter(self, event=None):
         if self.combo_sg.get(): self.sg_secildi(); self.btn_plus.focus()
@@ -342,12 +799,10 @@ class DataAnalyzerApp:
     def process_files(self, file_paths):
         self.file_map.clear()
         self.combo_id.set(''); self.combo_id['values'] = []; self.combo_sg.set(''); self.combo_sg['values'] = []
-        self.original_df = None; self.prediction_df = None; self.physical_sg_columns = []
+        self.oturum = None; self.tahmin_verisi = None; self.table_offset = 0
         self.grafigi_temizle()
         self.ax.set_title("Veri Yüklenmedi"); self.canvas.draw(); self.guncelle_tablo(None)
-        for path in file_paths:
-            filename = os.path.basename(path); parts = filename.split('_')
-            if len(parts) > 2: self.file_map[parts[1]] = path
+        self.file_map.update(dosyalari_esle(file_paths))
         if not self.file_map:
             messagebox.showwarning("Dosya Bulunamadı", "Belirtilen formatta geçerli dosya adı bulunamadı."); return
         sorted_ids = sorted(list(self.file_map.keys()))
@@ -369,23 +824,68 @@ class DataAnalyzerApp:
         self.process_files(dat_files)
 
     def tahmin_verisi_yukle(self):
+        """
+        Tahmin dosyasını yükler: 'Load' + SG başına bir sütun (geniş biçim) veya eski 'Load' + 'Predicted_Strain'.
+        Grafikteki ve sonradan eklenen her SG'nin eşleşen tahmini otomatik çizilir ve karşılaştırılır.
+        """
         if self.original_df is None: messagebox.showwarning("Uyarı", "Lütfen önce bir ölçüm verisi yükleyin."); return
         path = filedialog.askopenfilename(title="Tahmin Değerlerini İçeren .dat Dosyasını Seçin", filetypes=(("DAT Dosyaları", "*.dat"),("Tüm Dosyalar", "*.*")))
         if not path: return
-        try:
-            self.prediction_df = pd.read_csv(path, sep=r'\s+', engine='python')
-            if not all(col in self.prediction_df.columns for col in ['Load', 'Predicted_Strain']):
-                 messagebox.showerror("Sütun Hatası", "'Load' ve 'Predicted_Strain' sütunlarını içermelidir."); self.prediction_df = None; return
-            self._redraw_all_plots()
-            self.lbl_durum.config(text=f"Tahmin verisi yüklendi ve grafiğe eklendi.")
-        except Exception as e:
-            messagebox.showerror("Okuma Hatası", f"Tahmin dosyası okunurken hata: {e}"); self.prediction_df = None
-            
+        try: tahmin = tahmin_dosyasi_oku(path)
+        except Exception as e: messagebox.showerror("Okuma Hatası", f"Tahmin dosyası okunurken hata: {e}"); return
+        eslesen = len(tahmin.eslesenler(self.all_sg_columns))
+        if not eslesen: messagebox.showerror("Sütun Hatası", "Tahmin dosyasındaki sütunların hiçbiri bu dosyadaki SG'lerle eşleşmiyor."); return
+        self.tahmin_verisi, self.tahmin_yolu = tahmin, path
+        self._redraw_all_plots()
+        kapsam = "tek eğri, tüm SG'ler" if tahmin.tek_egri else f"{len(tahmin)} tahmin sütunu, {eslesen} SG eşleşti"
+        self.lbl_durum.config(text=f"Tahmin verisi yüklendi ({kapsam}); hatalar: Hesaplamalar > Tahmin Karşılaştırması.")
+
     def grafik_popup(self):
+        """
+        Ana grafiğin o anki halini ayrı pencerede açar (ör. başka bir ID ile karşılaştırmak için). DataFrame'e dönülmez:
+        çizgiler ana grafiğin seyreltilmiş (en fazla GRAFIK_NOKTA_SINIRI noktalık) dizilerinden kurulur ve hover indeksi
+        aynen paylaşılır; açılış maliyeti veri boyutundan bağımsızdır. Eksen sınırları ana grafikle eşlenir (paylaşılan
+        eksen grubu kurulmaz, ana grafiğin otomatik ölçeği pencerenin verisinden etkilenmez); birinde yakınlaştırma/kaydırma
+        diğerine de uygulanır, pencere kapanınca eşleme kaldırılır.
+        """
         if not self.plotted_sgs: messagebox.showwarning("Eksik Bilgi", "Lütfen önce grafiğe en az bir çizgi ekleyin."); return
-        pass # Bu fonksiyon, ana mimariyle uyumlu olacak şekilde yeniden yazılabilir.
+        selected_id = self.combo_id.get()
+        popup_win = tk.Toplevel(self.master); popup_win.title(f"Grafik: {selected_id} - Karşılaştırma"); popup_win.geometry("600x500")
+        fig_popup = Figure(dpi=100); ax_popup = fig_popup.add_subplot()
+        canvas_popup = FigureCanvasTkAgg(fig_popup, master=popup_win); canvas_popup.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        for line in self.ax.get_lines():
+            x_data, y_data = line.get_data()
+            ax_popup.plot(x_data, y_data, color=line.get_color(), marker=line.get_marker(), linestyle=line.get_linestyle(), label=line.get_label())
+        annot_popup = ax_popup.annotate("", xy=(0,0), xytext=(20,20), textcoords="offset points", bbox=dict(boxstyle="round", fc="yellow", alpha=0.7), arrowprops=dict(arrowstyle="->"))
+        annot_popup.set_visible(False)
+        self.popup_info[canvas_popup] = {'fig': fig_popup, 'ax': ax_popup, 'annot': annot_popup, 'hover_indeksi': self.hover_indeksi}
+        ax_popup.set_xlim(self.ax.get_xlim()); ax_popup.set_ylim(self.ax.get_ylim())
+        def esle(kaynak, hedef, eksen, hedef_canvas):
+            # Sınır zaten aynıysa atlanır; böylece iki yönlü geri çağırmalar birbirini tetiklemeye devam etmez.
+            def guncelle(_ax):
+                sinir = getattr(kaynak, f"get_{eksen}lim")()
+                if tuple(getattr(hedef, f"get_{eksen}lim")()) != tuple(sinir): getattr(hedef, f"set_{eksen}lim")(sinir); hedef_canvas.draw_idle()
+            return kaynak.callbacks.connect(f"{eksen}lim_changed", guncelle)
+        baglantilar = [(ax, esle(ax, diger, eksen, canvas)) for ax, diger, canvas in ((self.ax, ax_popup, canvas_popup), (ax_popup, self.ax, self.canvas))
+                       for eksen in ("x", "y")]
+        def on_close():
+            for ax, baglanti in baglantilar: ax.callbacks.disconnect(baglanti)
+            if canvas_popup in self.popup_info: del self.popup_info[canvas_popup]
+            popup_win.destroy()
+        popup_win.protocol("WM_DELETE_WINDOW", on_close)
+        ax_popup.set_title(f"Yük Oranına Karşı Strain ({selected_id})"); ax_popup.set_xlabel("Yük Oranı (%)"); ax_popup.set_ylabel("Strain (μstrain)")
+        ax_popup.legend(); self._setup_grid(ax_popup)
+        fig_popup.canvas.mpl_connect("motion_notify_event", self.on_popup_hover); canvas_popup.draw_idle()
 
 if __name__ == "__main__":
+    # '--baslangic-suresi': pencerenin görünme ve uygulamanın kullanıma hazır olma sürelerini yazıp çıkar.
+    baslangic_olcumu = "--baslangic-suresi" in sys.argv[1:]
     root = tk.Tk()
     app = DataAnalyzerApp(root)
+    if baslangic_olcumu:
+        def _olcumu_bitir():
+            if not app.moduller_hazir: root.after(20, _olcumu_bitir); return
+            print(f"Pencere: {app.sureler.get('pencere', 0) * 1000:.0f} ms, kullanıma hazır: {app.sureler['hazir'] * 1000:.0f} ms")
+            root.destroy()
+        root.after(20, _olcumu_bitir)
     root.mainloop()
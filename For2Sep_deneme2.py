@@ -4,10 +4,19 @@ import pandas as pd
 import os
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
+from matplotlib.tri import Triangulation
 import numpy as np
 import re
 
 class DataAnalyzerApp:
+    ALAN_IZGARASI = (160, 80)  # Enterpole gerinim alanının ızgarası (x, y nokta sayısı)
+    ALAN_SEVIYELERI = np.linspace(0, 1, 11)  # Normalize değerler üzerinde sabit kontur çizgisi seviyeleri
+    ALAN_CIZGI_GECIKMESI = 300  # ms; kontur çizgileri ancak adım bu süre değişmeden kalınca (kaydırma/oynatma bitince) çizilir
+    # Sensör kenar stilleri (RGBA, kalınlık): vurgusuz, grafikte çizili SG'ler ve o an seçili SG.
+    KENAR_STILLERI = {None: ((0, 0, 0, 1.0), 0.5), "cizili": ((1, 0, 0, 1.0), 2.0), "secili": ((1, 0.85, 0, 1.0), 3.0)}
+
     def __init__(self, master):
         self.master = master
         self.master.title("Strain Gauge Veri Analiz ve Görselleştirme Aracı")
@@ -27,6 +36,27 @@ class DataAnalyzerApp:
         self.sensor_plot_ax = None
         self.sensor_plot_canvas = None
         self.sensor_points_scatter = None
+        # Yük adımı haritası: (adım x sensör) değerler bir kez [0, 1]'e normalize edilir; her adımda sadece set_array + blit yapılır.
+        self.sensor_degerleri = None
+        self.sensor_yukleri = None
+        self.sensor_renk_araligi = None
+        self.sensor_colorbar = None
+        self.sensor_arka_plan = None
+        self.sensor_adimi = 0
+        self.animasyon_id = None
+        # Enterpole alan: Delaunay üçgenlemesi ve ızgara noktalarının barisentrik ağırlıkları sensörler yüklenince bir kez kurulur.
+        self.sensor_eslesen = None
+        # Vurgulama: ad/sütun -> sensör indeksi sözlüğü ve yerinde güncellenen kenar RGBA/kalınlık dizileri.
+        self.sensor_sutunlari = None
+        self.sensor_indeksi = {}
+        self.sensor_kenar_renkleri = None
+        self.sensor_kenar_kalinliklari = None
+        self.sensor_vurgulari = {}
+        self.alan_agirliklari = None
+        # Alan tek bir 'animated' resimle gösterilir (her adımda set_data + blit); kontur çizgileri sadece durulan adımda.
+        self.alan_resmi = None
+        self.alan_cizgileri = None
+        self.alan_cizgi_id = None
         
         self.calculations = {
             "Shear (S = 2B - A - C)": { "inputs": ['A', 'B', 'C'], "output_suffix": 'S', "formula": lambda A, B, C: 2 * B - A - C },
@@ -114,9 +144,18 @@ class DataAnalyzerApp:
         self.canvas = FigureCanvasTkAgg(self.fig, master=grafik_cerceve)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+        adim_cerceve = ttk.Frame(konum_cerceve); adim_cerceve.pack(side=tk.BOTTOM, fill=tk.X, pady=(5, 0))
+        self.btn_oynat = ttk.Button(adim_cerceve, text="▶ Oynat", command=self.animasyonu_degistir, width=10, state="disabled"); self.btn_oynat.pack(side=tk.LEFT)
+        self.scale_adim = ttk.Scale(adim_cerceve, from_=0, to=1, orient="horizontal", command=self.sensor_adimi_goster, state="disabled")
+        self.scale_adim.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.lbl_adim = ttk.Label(adim_cerceve, text="Yük adımı: -", width=32); self.lbl_adim.pack(side=tk.LEFT)
+        self.alan_goster = tk.BooleanVar(value=False)
+        self.chk_alan = ttk.Checkbutton(adim_cerceve, text="Gerinim Alanı", variable=self.alan_goster, command=self.draw_sensor_locations, state="disabled")
+        self.chk_alan.pack(side=tk.LEFT, padx=(5, 0))
         fig_sensor, self.sensor_plot_ax = plt.subplots(dpi=100)
         self.sensor_plot_canvas = FigureCanvasTkAgg(fig_sensor, master=konum_cerceve)
         self.sensor_plot_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.sensor_plot_canvas.mpl_connect("draw_event", self._sensor_arka_plani_kaydet)
 
         self.tree = ttk.Treeview(tablo_cerceve, show='headings'); vsb = ttk.Scrollbar(tablo_cerceve, orient="vertical", command=self.tree.yview); hsb = ttk.Scrollbar(tablo_cerceve, orient="horizontal", command=self.tree.xview)
         self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set); vsb.pack(side='right', fill='y'); hsb.pack(side='bottom', fill='x'); self.tree.pack(side='left', fill='both', expand=True)
@@ -145,20 +184,159 @@ class DataAnalyzerApp:
         except Exception as e: messagebox.showerror("Resim Hatası", f"Resim dosyası okunurken hata: {e}"); self.wing_image = None
     def draw_sensor_locations(self):
         if self.sensor_locations_df is None or self.wing_image is None: return
+        self.animasyonu_durdur(); self._alan_cizgilerini_sil(); self.sensor_arka_plan = None; self.alan_resmi = None
         ax = self.sensor_plot_ax; ax.clear()
+        if self.sensor_colorbar is not None: self.sensor_colorbar.remove(); self.sensor_colorbar = None
         extent = [self.sensor_locations_df['X'].min(), self.sensor_locations_df['X'].max(), self.sensor_locations_df['Y'].min(), self.sensor_locations_df['Y'].max()]
         ax.imshow(self.wing_image, extent=extent, aspect='auto')
-        self.sensor_points_scatter = ax.scatter(self.sensor_locations_df['X'], self.sensor_locations_df['Y'], c='cyan', s=15, alpha=0.7, edgecolors='black', linewidths=0.5)
+        self._sensor_indeksini_kur(); self._sensor_degerlerini_hazirla(); self._alan_agirliklarini_hazirla()
+        self.chk_alan.config(state="normal" if self.alan_agirliklari is not None else "disabled")
+        if self.sensor_degerleri is None:
+            self.sensor_points_scatter = ax.scatter(self.sensor_locations_df['X'], self.sensor_locations_df['Y'], c='cyan', s=15, alpha=0.7, edgecolors='black', linewidths=0.5,
+                                                    animated=True)
+            self.scale_adim.config(state="disabled"); self.btn_oynat.config(state="disabled"); self.lbl_adim.config(text="Yük adımı: -")
+        else:
+            # Resim ve renk çubuğu arka planda kalır; sadece 'animated' scatter her adımda yeniden çizilir (blit).
+            cmap = plt.get_cmap('coolwarm').with_extremes(bad=(0.6, 0.6, 0.6, 0.5))
+            self.sensor_adimi = min(self.sensor_adimi, len(self.sensor_degerleri) - 1)
+            self.sensor_points_scatter = ax.scatter(self.sensor_locations_df['X'], self.sensor_locations_df['Y'], c=self.sensor_degerleri[self.sensor_adimi], cmap=cmap,
+                                                    norm=Normalize(0, 1), s=30, edgecolors='black', linewidths=0.5, animated=True)
+            self.sensor_colorbar = ax.figure.colorbar(ScalarMappable(norm=Normalize(*self.sensor_renk_araligi), cmap=cmap), ax=ax, label="Strain (μstrain)")
+            if self.alan_goster.get(): self._alan_resmini_olustur(self.sensor_adimi)
+            self.scale_adim.config(state="normal", to=len(self.sensor_degerleri) - 1); self.scale_adim.set(self.sensor_adimi); self.btn_oynat.config(state="normal")
+        n = len(self.sensor_locations_df); renk, kalinlik = self.KENAR_STILLERI[None]
+        self.sensor_kenar_renkleri = np.tile(np.array(renk, dtype=float), (n, 1)); self.sensor_kenar_kalinliklari = np.full(n, kalinlik); self.sensor_vurgulari = {}
+        self.highlight_sensor(self.combo_sg.get())
         ax.set_title("Sensör Konumları"); ax.axis('off'); self.sensor_plot_canvas.draw(); self.notebook.select(2)
+    def _sensor_indeksini_kur(self):
+        names = self.sensor_locations_df['Name'].astype(str).tolist()
+        self.sensor_sutunlari = [None] * len(names)
+        if self.original_df is not None:
+            # Konum adı veri sütunuyla birebir ya da kanal ekinden önceki adla ('1001A' -> '1001A:MON1', tekse) eşleşir.
+            kisa_adlar = {}
+            for sg in self.all_sg_columns: kisa_adlar.setdefault(sg.split(':')[0], []).append(sg)
+            def sutun(name):
+                if name in self.original_df.columns: return name
+                adaylar = kisa_adlar.get(name, [])
+                return adaylar[0] if len(adaylar) == 1 else None
+            self.sensor_sutunlari = [sutun(name) for name in names]
+        # Hem konum adı hem de eşleşen veri sütunu adı sensörün indeksine gider (ilk görülen geçerli).
+        self.sensor_indeksi = {}
+        for i, name in enumerate(names): self.sensor_indeksi.setdefault(name, i)
+        for i, sutun_adi in enumerate(self.sensor_sutunlari):
+            if sutun_adi is not None: self.sensor_indeksi.setdefault(sutun_adi, i)
+    def _sensor_degerlerini_hazirla(self):
+        self.sensor_degerleri = self.sensor_yukleri = self.sensor_renk_araligi = self.sensor_eslesen = None
+        if self.original_df is None or self.sensor_locations_df is None: return
+        sutunlar = self.sensor_sutunlari
+        eslesen = [i for i, sutun in enumerate(sutunlar) if sutun is not None]
+        if not eslesen: return
+        self.sensor_eslesen = np.asarray(eslesen)
+        degerler = np.full((len(self.original_df), len(sutunlar)), np.nan, dtype=np.float32)
+        degerler[:, eslesen] = self.original_df[[sutunlar[i] for i in eslesen]].to_numpy(dtype=np.float32)
+        # Sıfır merkezli simetrik renk aralığı; normalizasyon tüm adımlar için burada bir kez yapılır.
+        sinir = float(np.nanmax(np.abs(degerler))) or 1.0
+        self.sensor_renk_araligi = (-sinir, sinir)
+        self.sensor_degerleri = (degerler + sinir) / (2 * sinir)
+        self.sensor_yukleri = self.original_df['Load_Ratio:MON1'].to_numpy(dtype=float) if 'Load_Ratio:MON1' in self.original_df.columns else np.arange(len(self.original_df), dtype=float)
+    def _alan_agirliklarini_hazirla(self):
+        self.alan_agirliklari = None
+        if self.sensor_eslesen is None or len(self.sensor_eslesen) < 3: return
+        x = self.sensor_locations_df['X'].to_numpy(dtype=float)[self.sensor_eslesen]; y = self.sensor_locations_df['Y'].to_numpy(dtype=float)[self.sensor_eslesen]
+        try: ucgenleme = Triangulation(x, y)
+        except (ValueError, RuntimeError): return  # Aynı doğru üzerindeki sensörler üçgenlenemez.
+        gx, gy = np.meshgrid(np.linspace(x.min(), x.max(), self.ALAN_IZGARASI[0]), np.linspace(y.min(), y.max(), self.ALAN_IZGARASI[1]))
+        px, py = gx.ravel(), gy.ravel()
+        ucgen = ucgenleme.get_trifinder()(px, py); icerde = np.flatnonzero(ucgen >= 0)
+        if not len(icerde): return
+        # Her ızgara noktası için içinde kaldığı üçgenin köşeleri ve barisentrik ağırlıkları; dış bükey örtü dışı boş kalır.
+        kose = ucgenleme.triangles[ucgen[icerde]]; px, py = px[icerde], py[icerde]
+        xa, xb, xc = x[kose].T; ya, yb, yc = y[kose].T
+        det = (yb - yc) * (xa - xc) + (xc - xb) * (ya - yc)
+        w0 = ((yb - yc) * (px - xc) + (xc - xb) * (py - yc)) / det; w1 = ((yc - ya) * (px - xc) + (xa - xc) * (py - yc)) / det
+        self.alan_agirliklari = {"kose": self.sensor_eslesen[kose], "agirlik": np.column_stack((w0, w1, 1 - w0 - w1)).astype(np.float32), "icerde": icerde,
+                                 "gx": gx, "gy": gy, "alan": np.full(gx.size, np.nan, dtype=np.float32)}
+    def sensor_alani(self, adim):
+        # Seyrek (satır başına 3 ağırlıklı) ızgara x sensör matrisi ile adımın değer vektörünün çarpımı.
+        a = self.alan_agirliklari
+        a["alan"][a["icerde"]] = np.einsum('ij,ij->i', a["agirlik"], self.sensor_degerleri[adim][a["kose"]])
+        return np.ma.masked_invalid(a["alan"].reshape(a["gx"].shape))
+    def _alan_resmini_olustur(self, adim):
+        # Izgara düzenli olduğundan alan imshow ile tek resim olarak çizilir; dış bükey örtü dışı (maskeli) saydam kalır.
+        # 'nearest': ızgara zaten ekran pikseline yakın; bilinear yeniden örnekleme her karede contourf'tan da pahalıya gelir.
+        a = self.alan_agirliklari; gx, gy = a["gx"], a["gy"]
+        cmap = self.sensor_points_scatter.get_cmap().with_extremes(bad=(0, 0, 0, 0))
+        self.alan_resmi = self.sensor_plot_ax.imshow(self.sensor_alani(adim), extent=[gx[0, 0], gx[0, -1], gy[0, 0], gy[-1, 0]], origin='lower', aspect='auto',
+                                                     interpolation='nearest', interpolation_stage='data', cmap=cmap, norm=Normalize(0, 1), alpha=0.55, zorder=1, animated=True)
+        self._alan_cizgilerini_ciz()
+    def _alan_cizgilerini_sil(self):
+        if self.alan_cizgi_id is not None: self.master.after_cancel(self.alan_cizgi_id); self.alan_cizgi_id = None
+        if self.alan_cizgileri is not None and self.alan_cizgileri.axes is not None: self.alan_cizgileri.remove()
+        self.alan_cizgileri = None
+    def _alan_cizgilerini_ciz(self):
+        # contour her çağrıda yeni bir ContourSet kurar; bu yüzden her karede değil, adım sabitlenince bir kez çalışır.
+        self.alan_cizgi_id = None
+        if self.alan_resmi is None: return
+        a = self.alan_agirliklari
+        self.alan_cizgileri = self.sensor_plot_ax.contour(a["gx"], a["gy"], self.alan_resmi.get_array(), levels=self.ALAN_SEVIYELERI, colors='k',
+                                                          linewidths=0.4, alpha=0.5, zorder=1.5)
+        self.alan_cizgileri.set_animated(True)
+        self._sensor_haritasini_blitle()
+    def _alan_katmanlarini_ciz(self):
+        ax = self.sensor_plot_ax
+        for artist in (self.alan_resmi, self.alan_cizgileri, self.sensor_points_scatter):
+            if artist is not None: ax.draw_artist(artist)
+    def _sensor_arka_plani_kaydet(self, event=None):
+        if self.sensor_points_scatter is None: self.sensor_arka_plan = None; return
+        canvas = self.sensor_plot_canvas
+        self.sensor_arka_plan = canvas.copy_from_bbox(canvas.figure.bbox)
+        self._alan_katmanlarini_ciz()
+    def sensor_adimi_goster(self, adim):
+        if self.sensor_degerleri is None or self.sensor_points_scatter is None: return
+        adim = int(round(min(max(float(adim), 0), len(self.sensor_degerleri) - 1)))
+        self.sensor_adimi = adim
+        self.sensor_points_scatter.set_array(self.sensor_degerleri[adim])
+        if self.alan_resmi is not None:
+            self.alan_resmi.set_data(self.sensor_alani(adim)); self._alan_cizgilerini_sil()
+            if self.animasyon_id is None: self.alan_cizgi_id = self.master.after(self.ALAN_CIZGI_GECIKMESI, self._alan_cizgilerini_ciz)
+        self.lbl_adim.config(text=f"Adım {adim + 1}/{len(self.sensor_degerleri)} | Yük: {self.sensor_yukleri[adim]:.2f}")
+        self._sensor_haritasini_blitle()
+    def _sensor_haritasini_blitle(self):
+        canvas = self.sensor_plot_canvas
+        if self.sensor_arka_plan is None: canvas.draw_idle(); return
+        canvas.restore_region(self.sensor_arka_plan)
+        self._alan_katmanlarini_ciz(); canvas.blit(canvas.figure.bbox)
+    def animasyonu_degistir(self):
+        if self.animasyon_id is not None: self.animasyonu_durdur(); return
+        if self.sensor_degerleri is None: return
+        if self.sensor_adimi >= len(self.sensor_degerleri) - 1: self.sensor_adimi = 0
+        self.btn_oynat.config(text="■ Durdur"); self._animasyon_adimi()
+    def _animasyon_adimi(self):
+        # Yaklaşık 500 karede tüm yükleme; uzun kayıtlarda adımlar atlanır.
+        son = len(self.sensor_degerleri) - 1
+        adim = min(self.sensor_adimi + max(1, son // 500), son)
+        self.scale_adim.set(adim)  # Scale komutu sensor_adimi_goster'i çağırır.
+        if adim >= son: self.animasyonu_durdur(); return
+        self.animasyon_id = self.master.after(20, self._animasyon_adimi)
+    def animasyonu_durdur(self):
+        oynuyordu = self.animasyon_id is not None
+        if oynuyordu: self.master.after_cancel(self.animasyon_id); self.animasyon_id = None
+        self.btn_oynat.config(text="▶ Oynat")
+        if oynuyordu and self.alan_resmi is not None: self._alan_cizgilerini_ciz()  # Oynatmanın durduğu adımın kontur çizgileri.
     def highlight_sensor(self, selected_sg):
-        if self.sensor_points_scatter is None or self.sensor_locations_df is None: return
-        default_color = (0, 1, 1, 0.3); highlight_color = (1, 0, 0, 1.0)
-        colors = [default_color] * len(self.sensor_locations_df)
-        try:
-            idx = self.sensor_locations_df.index[self.sensor_locations_df['Name'] == selected_sg].tolist()[0]
-            colors[idx] = highlight_color
-        except IndexError: pass
-        self.sensor_points_scatter.set_facecolors(colors); self.sensor_plot_canvas.draw()
+        if self.sensor_points_scatter is None or self.sensor_kenar_renkleri is None: return
+        # Yüzey renkleri yük adımı haritasına ait olduğundan vurgu kenar rengi ve kalınlığıyla yapılır: grafikteki
+        # tüm SG'ler ve seçili SG. Sadece stili değişen sensörlerin dizi satırları güncellenir, sonra blit yapılır.
+        yeni = {self.sensor_indeksi[sg]: "cizili" for sg in self.plotted_sgs if sg in self.sensor_indeksi}
+        if selected_sg in self.sensor_indeksi: yeni[self.sensor_indeksi[selected_sg]] = "secili"
+        degisen = [i for i in self.sensor_vurgulari.keys() | yeni.keys() if self.sensor_vurgulari.get(i) != yeni.get(i)]
+        if not degisen: return
+        for i in degisen:
+            renk, kalinlik = self.KENAR_STILLERI[yeni.get(i)]
+            self.sensor_kenar_renkleri[i] = renk; self.sensor_kenar_kalinliklari[i] = kalinlik
+        self.sensor_vurgulari = yeni
+        self.sensor_points_scatter.set_edgecolors(self.sensor_kenar_renkleri); self.sensor_points_scatter.set_linewidths(self.sensor_kenar_kalinliklari)
+        self._sensor_haritasini_blitle()
     def sg_secildi(self, event=None):
         selected_sg = self.combo_sg.get()
         if not selected_sg or self.current_df is None: self.btn_plus.config(state="disabled"); self.btn_minus.config(state="disabled"); return
@@ -173,6 +351,11 @@ class DataAnalyzerApp:
     def id_secildi(self, event=None):
         self.grafigi_temizle(); self.ax.set_title("Strain Gauge Seçin ve Grafiğe Ekleyin"); self.canvas.draw()
         self.sensor_locations_df = None; self.wing_image = None
+        self.animasyonu_durdur(); self._alan_cizgilerini_sil(); self.sensor_degerleri = self.alan_agirliklari = self.alan_resmi = None; self.sensor_points_scatter = None
+        self.sensor_kenar_renkleri = None; self.sensor_indeksi = {}; self.sensor_vurgulari = {}
+        self.chk_alan.config(state="disabled")
+        if self.sensor_colorbar is not None: self.sensor_colorbar.remove(); self.sensor_colorbar = None
+        self.scale_adim.config(state="disabled"); self.btn_oynat.config(state="disabled"); self.lbl_adim.config(text="Yük adımı: -")
         if self.sensor_plot_ax: self.sensor_plot_ax.clear(); self.sensor_plot_canvas.draw()
         self.btn_load_locations.config(state="normal"); self.btn_load_image.config(state="normal")
         selected_id = self.combo_id.get()
@@ -223,7 +406,7 @@ class DataAnalyzerApp:
             messagebox.showinfo("Hesaplama Tamamlandı", f"{calculated_count} adet '{calc_name}' sonucu hesaplandı ve listeye eklendi.")
         else: messagebox.showwarning("Grup Bulunamadı", f"'{calc_name}' hesaplaması için uygun {required_inputs} sensör grupları bulunamadı.")
     def grafigi_temizle(self):
-        self.plotted_sgs.clear(); self.prediction_df=None
+        self.plotted_sgs.clear(); self.prediction_df=None; self.highlight_sensor(self.combo_sg.get())
         while self.ax.lines: self.ax.lines[0].remove()
         if self.ax.get_legend() is not None: self.ax.get_legend().remove()
         self.ax.set_title("Grafik Temizlendi")
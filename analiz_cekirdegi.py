@@ -0,0 +1,520 @@
+import io
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from formul_motoru import TuretilmisKanallar, hesaplama_plani, hesaplama_tanimi, tanimlari_yukle
+from gruplama_kurallari import VARSAYILAN_KURALLAR, GruplamaKurallari, KuralHatasi, cikti_kolon_adi, hesaplama_uygulanir_mi
+from rozet_analizi import GERILME_CIKTILARI, GERINIM_CIKTILARI, RozetKanali
+from tahmin_karsilastirma import karsilastirma_olculeri, karsilastirma_tablosu
+from yorulma_analizi import RainflowSayaci
+from yuk_cevrimleri import YukCevrimIndeksi, dogrusallik_analizi, histerezis_analizi
+
+# Arayüzden bağımsız analiz adımları: hem Tk uygulaması hem de komut satırı toplu işleyici bunları kullanır.
+
+PROGRAM_KLASORU = os.path.dirname(os.path.abspath(__file__))
+HESAPLAMA_TANIMLARI_DOSYASI = os.path.join(PROGRAM_KLASORU, "hesaplama_tanimlari.json")
+GRUPLAMA_KURALLARI_DOSYASI = os.path.join(PROGRAM_KLASORU, "gruplama_kurallari.json")
+EXCEL_SATIR_SINIRI = 1_048_576  # Bir Excel sayfasındaki en fazla satır (başlık dahil)
+EXCEL_PARCA_SATIR = 20_000      # Akış modunda bir seferde belleğe alınan satır sayısı
+# Excel dışı veri biçimleri: uzantı -> (ad, izinli sıkıştırmalar; ilki varsayılan). Parquet/Feather pyarrow, HDF5 PyTables gerektirir.
+VERI_BICIMLERI = {
+    ".parquet": ("Parquet", ("snappy", "zstd", "gzip", "brotli", "none")),
+    ".feather": ("Feather", ("lz4", "zstd", "uncompressed")),
+    ".h5": ("HDF5", ("blosc", "zlib", "bzip2", "none")),
+    ".csv": ("CSV", ("none", "gzip", "bz2", "zip", "xz", "zstd")),
+}
+CSV_SIKISTIRMA_UZANTILARI = {".gz": "gzip", ".bz2": "bz2", ".zip": "zip", ".xz": "xz", ".zst": "zstd"}
+
+
+def varsayilan_hesaplamalar():
+    return {
+        "Shear (S = 2B - A - C)": hesaplama_tanimi("Shear (S = 2B - A - C)", "2B - A - C", 'S'),
+        "Average (Avg = (D+E)/2)": hesaplama_tanimi("Average (Avg = (D+E)/2)", "(D + E)/2", 'Avg'),
+    }
+
+
+def kullanici_hesaplamalarini_yukle(dosya_yolu=HESAPLAMA_TANIMLARI_DOSYASI):
+    """Kaydedilmiş kullanıcı formüllerini okur; dosya bozuksa uyarı basıp boş sözlük döner."""
+    try: return tanimlari_yukle(dosya_yolu)
+    except (OSError, ValueError) as e: print(f"Uyarı: Hesaplama tanımları okunamadı: {e}"); return {}
+
+
+def gruplama_kurallarini_yukle(dosya_yolu=GRUPLAMA_KURALLARI_DOSYASI):
+    """Kural dosyasını okur; okunamazsa uyarı basıp varsayılan kurala döner."""
+    try: return GruplamaKurallari.dosyadan(dosya_yolu)
+    except KuralHatasi as e:
+        print(f"Uyarı: Gruplama kuralları yüklenemedi, varsayılan kural kullanılıyor: {e}")
+        return GruplamaKurallari(VARSAYILAN_KURALLAR)
+
+
+def kodlama_yedekli_oku(filepath, **kwargs):
+    """Dosyayı önce UTF-8, sonra 'latin-1' ile okumayı dener."""
+    try:
+        return pd.read_csv(filepath, encoding='utf-8', **kwargs)
+    except UnicodeDecodeError:
+        print(f"Uyarı: '{os.path.basename(filepath)}' UTF-8 ile okunamadı. 'latin-1' deneniyor...")
+        return pd.read_csv(filepath, encoding='latin-1', **kwargs)
+
+
+def dat_basligi_oku(filepath):
+    """Sadece başlık ve birim satırlarını okur. Dönüş: (tüm sütunlar, μstrain SG sütunları)."""
+    header_df = kodlama_yedekli_oku(filepath, sep=r'\s+', header=None, nrows=2, engine='python')
+    header_row, unit_row = header_df.iloc[0], header_df.iloc[1]
+    return list(header_row), [h for h, u in zip(header_row, unit_row) if u == 'μstrain']
+
+
+def dat_dosyasi_oku(filepath):
+    """İlk satırı başlık, ikinci satırı birim olan .dat dosyasını okur. Dönüş: (DataFrame, μstrain SG sütunları)."""
+    _, sg_columns = dat_basligi_oku(filepath)
+    df = kodlama_yedekli_oku(filepath, sep=r'\s+', header=0, skiprows=[1], engine='python')
+    for col in df.columns: df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+    return df, sg_columns
+
+
+def dat_parcalari(filepath, kolonlar, parca_satir):
+    """
+    .dat dosyasını belleğe tamamen almadan, sadece istenen sütunlarla 'parca_satir' satırlık DataFrame'ler halinde
+    okur (dat_dosyasi_oku ile aynı sayısal dönüşüm). Veri satırları sayısal olduğundan kodlama hataları yok sayılır.
+    """
+    okuyucu = pd.read_csv(filepath, sep=r'\s+', header=0, skiprows=[1], usecols=list(kolonlar), chunksize=parca_satir,
+                          encoding='utf-8', encoding_errors='replace')
+    for parca in okuyucu:
+        yield parca.apply(pd.to_numeric, errors='coerce').fillna(0)
+
+
+def dosya_kimligi(path):
+    """'TEST_<ID>_RESULTS.dat' biçimindeki dosya adından ID'yi çıkarır; biçim uymazsa None."""
+    parts = os.path.basename(path).split('_')
+    return parts[1] if len(parts) > 2 else None
+
+
+def dosyalari_esle(file_paths):
+    """{ID: dosya yolu} sözlüğü; ID çıkarılamayan dosyalar atlanır."""
+    file_map = {}
+    for path in file_paths:
+        file_id = dosya_kimligi(path)
+        if file_id: file_map[file_id] = path
+    return file_map
+
+
+def yuk_kolonu_bul(df):
+    if df is None: return None
+    return next((col for col in df.columns if 'Load_Ratio' in col), None)
+
+
+def satir_secimi(df, load_column, sadece_yukleme=False, x_araligi=None, nokta_sayisi=None, satir_araligi=None):
+    """
+    Görüntülenecek/dışa aktarılacak satırların konumları: kesme, yük aralığı (yakınlaştırma penceresi) ve
+    N noktaya seyreltme sırayla uygulanır. Sadece konumlar hesaplanır; dönüş bir slice veya tamsayı dizisidir,
+    böylece veri ancak istenen sütunlar seçilirken ve sadece seçilen satırlar için kopyalanır.
+    satir_araligi (ör. çevrim indeksinden gelen slice) verilirse kesme adımının yerine geçer.
+    """
+    secim = satir_araligi if satir_araligi is not None else slice(0, len(df))
+    if not load_column or load_column not in df.columns: return secim
+    yuk = df[load_column].to_numpy()
+    if sadece_yukleme and satir_araligi is None and len(yuk): secim = slice(0, int(np.argmax(yuk)) + 1)
+    if x_araligi is not None:
+        alt, ust = sorted(x_araligi)
+        parca = yuk[secim]
+        secim = np.flatnonzero((parca >= alt) & (parca <= ust)) + secim.start
+    if nokta_sayisi:
+        konumlar = np.arange(secim.start, secim.stop) if isinstance(secim, slice) else secim
+        if len(konumlar) > nokta_sayisi:
+            # Eşit aralıklı örnekleme; ilk ve son nokta her zaman korunur.
+            secim = konumlar[np.unique(np.linspace(0, len(konumlar) - 1, max(nokta_sayisi, 2)).round().astype(int))]
+    return secim
+
+
+def rozet_plani(shear_rosettes, tip, E=None, nu=None):
+    """Rozet analizinin tüm çıktılarını türetilmiş kanal planı olarak döner: [(sütun, RozetKanali, girdiler)]."""
+    ekler = list(GERINIM_CIKTILARI) + (list(GERILME_CIKTILARI) if E and nu is not None else [])
+    return [(cikti_kolon_adi(prefix, gauges, ek), kanal, {h: gauges[h] for h in "ABC"})
+            for kanal, ek in ((RozetKanali(ek, tip, E, nu), ek) for ek in ekler) for prefix, gauges in shear_rosettes.items()]
+
+
+def grid_ayarla(ax):
+    ax.grid(which='major', linestyle='-', linewidth='0.6', color='grey', alpha=0.7)
+    ax.grid(which='minor', linestyle=':', linewidth='0.5', color='grey', alpha=0.4)
+    ax.minorticks_on()
+
+
+class GrafikHavuzu:
+    """
+    Önceden oluşturulmuş ekran dışı (Agg) Figure nesneleri havuzu. Her çizimde figür, eksen, ızgara ve etiketler
+    yeniden kurulmaz; kullanım sonrası sadece çizgiler, lejant ve başlık temizlenir. Kenar boşlukları figür
+    oluşturulurken bir kez sabitlenir, böylece kayıt sırasında 'bbox_inches=tight' için ikinci bir çizim gerekmez.
+    'onceden' kadar figür havuz kurulurken (modül içe aktarılırken) oluşturulur, böylece ilk rapor da figür kurma
+    maliyetini ödemez. İş parçacığı güvenlidir; havuz boşsa yeni figür oluşturulur, en fazla 'boyut' kadarı saklanır.
+    """
+
+    def __init__(self, boyut=2, figsize=(8, 6), dpi=150, onceden=1):
+        self.boyut, self.figsize, self.dpi = boyut, figsize, dpi
+        self._bos = queue.LifoQueue()
+        for _ in range(min(onceden, boyut)): self._bos.put(self._olustur())
+
+    def _olustur(self):
+        fig = Figure(figsize=self.figsize, dpi=self.dpi); FigureCanvasAgg(fig)
+        ax = fig.add_subplot(); fig.subplots_adjust(left=0.11, right=0.97, bottom=0.09, top=0.94)
+        ax.set_xlabel("Yük Oranı (%)"); ax.set_ylabel("Strain (μstrain)"); grid_ayarla(ax)
+        return fig, ax
+
+    @staticmethod
+    def _temizle(ax):
+        for line in list(ax.lines): line.remove()
+        if ax.get_legend() is not None: ax.get_legend().remove()
+        ax.set_title(""); ax.set_prop_cycle(None)  # Renkler her çizimde C0'dan başlasın
+
+    @contextmanager
+    def figur(self):
+        try: fig, ax = self._bos.get_nowait()
+        except queue.Empty: fig, ax = self._olustur()
+        try: yield fig, ax
+        finally:
+            self._temizle(ax)
+            if self._bos.qsize() < self.boyut: self._bos.put((fig, ax))
+
+
+GRAFIK_HAVUZU = GrafikHavuzu()
+GRAFIK_BICIMLERI = ("png", "svg", "pdf")
+
+
+def grafik_resmi_olustur(df, x_column, sg_names, baslik, bicim="png"):
+    """Seçili SG'lerin yük-strain grafiğini havuzdaki bir figürle PNG (veya vektörel SVG/PDF) olarak BytesIO'ya çizer."""
+    if df is None or not x_column or not sg_names: return None
+    if bicim not in GRAFIK_BICIMLERI: raise ValueError(f"Desteklenmeyen grafik biçimi: '{bicim}'. Seçenekler: {', '.join(GRAFIK_BICIMLERI)}")
+    with GRAFIK_HAVUZU.figur() as (fig, ax):
+        for sg_name in sg_names:
+            if sg_name in df.columns:
+                ax.plot(df[x_column], df[sg_name], marker='o', linestyle='-', label=sg_name)
+        ax.set_title(baslik); ax.relim(); ax.autoscale_view(); ax.legend()
+        img_io = io.BytesIO()
+        # Hızlı PNG sıkıştırması: kodlama süresi ~%40 azalır, dosya biraz büyür.
+        fig.savefig(img_io, format=bicim, **({"pil_kwargs": {"compress_level": 1}} if bicim == "png" else {})); img_io.seek(0)
+    return img_io
+
+
+def isi_haritasi_olustur(matris, baslik, renk_etiketi="", vmin=None, vmax=None):
+    """
+    DataFrame matrisini (ör. SG x ID korelasyon) renk ölçekli ısı haritası olarak PNG BytesIO'ya çizer; NaN hücreler
+    boş kalır. Boyutu hücre sayısıyla büyüdüğü için havuz figürü yerine tek kullanımlık bir Agg figürü kullanılır.
+    """
+    if matris is None or matris.empty: return None
+    satir, sutun = matris.shape
+    fig = Figure(figsize=(min(4 + 0.6 * sutun, 40), min(2 + 0.22 * satir, 60)), dpi=100); FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    goruntu = ax.imshow(np.ma.masked_invalid(matris.to_numpy(dtype=float)), aspect="auto", cmap="RdYlGn", vmin=vmin, vmax=vmax, interpolation="nearest")
+    ax.set_xticks(np.arange(sutun), [str(k) for k in matris.columns], rotation=90)
+    ax.set_yticks(np.arange(satir), [str(k) for k in matris.index], fontsize=7 if satir > 40 else None)
+    ax.set_title(baslik); fig.colorbar(goruntu, ax=ax, label=renk_etiketi); fig.tight_layout()
+    img_io = io.BytesIO(); fig.savefig(img_io, format="png", pil_kwargs={"compress_level": 1}); img_io.seek(0)
+    return img_io
+
+
+def excel_sayfalari(satir_sayisi, sheet_name='Rapor'):
+    """Satır sınırına göre sayfa bölümlemesi: [(sayfa adı, başlangıç, bitiş)]; her sayfada bir başlık satırı bulunur."""
+    kapasite = EXCEL_SATIR_SINIRI - 1
+    return [(sheet_name if no == 0 else f"{sheet_name}_{no + 1}", baslangic, min(baslangic + kapasite, satir_sayisi))
+            for no, baslangic in enumerate(range(0, max(satir_sayisi, 1), kapasite))]
+
+
+def _satir_parcalari(df, baslangic, bitis, parca_satir):
+    """Satırları parça parça Python listeleri olarak verir; NaN/inf hücreler boş bırakılır (Excel'de karşılığı yoktur)."""
+    for i in range(baslangic, bitis, parca_satir):
+        parca = df.iloc[i:min(i + parca_satir, bitis)].replace([np.inf, -np.inf], np.nan)
+        yield parca.astype(object).where(parca.notna(), None).to_numpy().tolist()
+
+
+def excel_raporu_yaz(filepath, export_df, graph_image_stream=None, sheet_name='Rapor', ilerleme=None, parca_satir=EXCEL_PARCA_SATIR):
+    """
+    Veriyi akış (sabit bellek) modunda Excel'e parça parça yazar: xlsxwriter kuruluysa 'constant_memory',
+    değilse openpyxl 'write_only' kullanılır. Satır sınırı aşılırsa veri 'Rapor', 'Rapor_2', ... sayfalarına
+    bölünür; grafik ilk sayfada verinin sağına eklenir. ilerleme(yazılan, toplam) her parçadan sonra çağrılır.
+    """
+    excel_kitabi_yaz(filepath, [(sheet_name, export_df, graph_image_stream)], ilerleme, parca_satir)
+
+
+def excel_kitabi_yaz(filepath, sayfalar, ilerleme=None, parca_satir=EXCEL_PARCA_SATIR):
+    """[(sayfa adı, DataFrame, grafik|None)] listesini tek bir çalışma kitabına yazar (ör. her test ID'si için bir sayfa)."""
+    try: import xlsxwriter
+    except ImportError: xlsxwriter = None
+    toplam, yazilan = sum(len(export_df) for _, export_df, _ in sayfalar), 0
+    if xlsxwriter:
+        workbook = xlsxwriter.Workbook(filepath, {'constant_memory': True, 'nan_inf_to_errors': True})
+    else:
+        from openpyxl import Workbook
+        workbook = Workbook(write_only=True)
+    for sheet_name, export_df, graph_image_stream in sayfalar:
+        basliklar = [str(col) for col in export_df.columns]
+        for no, (sayfa_adi, baslangic, bitis) in enumerate(excel_sayfalari(len(export_df), sheet_name)):
+            grafik = graph_image_stream if no == 0 else None
+            if xlsxwriter:
+                worksheet = workbook.add_worksheet(sayfa_adi); worksheet.write_row(0, 0, basliklar)
+                if grafik: worksheet.insert_image(0, len(basliklar) + 1, "grafik.png", {"image_data": grafik})
+                satir_no = 1
+            else:
+                from openpyxl.drawing.image import Image
+                from openpyxl.utils import get_column_letter
+                worksheet = workbook.create_sheet(sayfa_adi); worksheet.append(basliklar)
+                if grafik: worksheet.add_image(Image(grafik), f'{get_column_letter(len(basliklar) + 2)}1')
+            for satirlar in _satir_parcalari(export_df, baslangic, bitis, parca_satir):
+                if xlsxwriter:
+                    for satir in satirlar: worksheet.write_row(satir_no, 0, satir); satir_no += 1
+                else:
+                    for satir in satirlar: worksheet.append(satir)
+                yazilan += len(satirlar)
+                if ilerleme: ilerleme(yazilan, toplam)
+    if xlsxwriter: workbook.close()
+    else: workbook.save(filepath)
+
+
+def veri_bicimi(filepath):
+    """Dosya adından (biçim uzantısı, dosya adının ima ettiği sıkıştırma) çıkarır; ör. 'x.csv.gz' -> ('.csv', 'gzip')."""
+    govde, uzanti = os.path.splitext(filepath.lower())
+    if uzanti in CSV_SIKISTIRMA_UZANTILARI and govde.endswith(".csv"): return ".csv", CSV_SIKISTIRMA_UZANTILARI[uzanti]
+    return uzanti, None
+
+
+def veri_dosyasi_yaz(filepath, export_df, sikistirma=None):
+    """
+    Veriyi uzantısına göre Parquet, Feather, HDF5 veya CSV olarak yazar. Arrow tabanlı biçimlerde sütunlar pandas'ın
+    sayısal dizilerinden doğrudan Arrow tablosuna alınır (satır satır dönüştürme yoktur), bu da Excel'den kat kat hızlıdır.
+    sikistirma verilmezse biçimin (veya 'x.csv.gz' gibi dosya adının) varsayılanı kullanılır.
+    """
+    uzanti, ima_edilen = veri_bicimi(filepath)
+    if uzanti not in VERI_BICIMLERI: raise ValueError(f"Desteklenmeyen dosya biçimi: '{uzanti}'. Seçenekler: {', '.join(VERI_BICIMLERI)}, .xlsx")
+    ad, sikistirmalar = VERI_BICIMLERI[uzanti]
+    sikistirma = sikistirma or ima_edilen or sikistirmalar[0]
+    if sikistirma not in sikistirmalar: raise ValueError(f"{ad} için geçersiz sıkıştırma: '{sikistirma}'. Seçenekler: {', '.join(sikistirmalar)}")
+    yok = sikistirma in ("none", "uncompressed")
+    if uzanti == ".parquet": export_df.to_parquet(filepath, index=False, compression=None if yok else sikistirma)
+    elif uzanti == ".feather": export_df.reset_index(drop=True).to_feather(filepath, compression=sikistirma)
+    elif uzanti == ".h5": export_df.to_hdf(filepath, key="veri", mode="w", format="fixed", complevel=0 if yok else 5, complib=None if yok else sikistirma)
+    else: export_df.to_csv(filepath, index=False, compression=None if yok else sikistirma)
+
+
+class AnalizOturumu:
+    """
+    Tek bir ölçüm dosyasının arayüzden bağımsız analiz durumu: veri, SG listeleri, hesaplama grupları ve
+    türetilmiş (sanal) kanallar. Tk uygulaması, komut satırı işleyici ve süreç havuzu işçileri aynı API'yi
+    kullanır: dosyadan -> sg_listesi -> hesaplamalari_uygula / rozet_analizi -> goruntu / veri -> excele_aktar.
+    Her aşamanın son süresi 'sureler' sözlüğünde tutulur (profil ve benchmark için).
+    """
+
+    def __init__(self, df, sg_columns, kurallar=None, kaynak=None):
+        self.df = df
+        self.kaynak = kaynak
+        self.fiziksel_sgler = list(sg_columns)
+        self.tum_sgler = list(sg_columns)  # Fiziksel SG'ler + kaydedilen türetilmiş kanallar
+        self.turetilmis = TuretilmisKanallar()
+        self.kurallar = kurallar or gruplama_kurallarini_yukle()
+        self.sureler = {}
+        self._cevrimler = None
+        self.gruplari_tespit_et()
+
+    @classmethod
+    def dosyadan(cls, filepath, kurallar=None):
+        baslangic = time.perf_counter()
+        df, sg_columns = dat_dosyasi_oku(filepath)
+        oturum = cls(df, sg_columns, kurallar, kaynak=filepath)
+        oturum.sureler["yukle"] = time.perf_counter() - baslangic
+        return oturum
+
+    @classmethod
+    def basliktan(cls, filepath, kurallar=None):
+        """Sadece başlıktan (veri okunmadan) oturum: gruplar ve türetilmiş kanal kayıtları akış analizleri için hazırlanır."""
+        kolonlar, sg_columns = dat_basligi_oku(filepath)
+        return cls(pd.DataFrame(columns=kolonlar, dtype=float), sg_columns, kurallar, kaynak=filepath)
+
+    @contextmanager
+    def sure_olc(self, asama):
+        baslangic = time.perf_counter()
+        try: yield
+        finally: self.sureler[asama] = time.perf_counter() - baslangic
+
+    @property
+    def yuk_kolonu(self):
+        return yuk_kolonu_bul(self.df)
+
+    @property
+    def cevrimler(self):
+        """Yük çevrimi/segment indeksi; dosya başına bir kez hesaplanır (yük sütunu yoksa None)."""
+        if self._cevrimler is None and self.yuk_kolonu:
+            with self.sure_olc("cevrim_indeksi"): self._cevrimler = YukCevrimIndeksi(self.df[self.yuk_kolonu].to_numpy())
+        return self._cevrimler
+
+    def satirlar(self, sadece_yukleme=False, x_araligi=None, nokta_sayisi=None, cevrim=None, kol=None):
+        """
+        Seçilen satırların konumları. cevrim (0 tabanlı) ve kol ('yukleme'/'bosaltma') çevrim indeksinden alınır;
+        sadece_yukleme, kol verilmemişse yükleme kolu demektir (çevrim yoksa en yüksek tepeye kadar).
+        """
+        satir_araligi = None
+        if (sadece_yukleme or cevrim is not None or kol) and self.cevrimler is not None:
+            satir_araligi = self.cevrimler.aralik(cevrim, kol or ("yukleme" if sadece_yukleme else None))
+        return satir_secimi(self.df, self.yuk_kolonu, sadece_yukleme, x_araligi, nokta_sayisi, satir_araligi)
+
+    def sg_listesi(self):
+        return list(self.tum_sgler)
+
+    def gruplari_tespit_et(self):
+        """SG'leri kural setine göre gruplar; A/B/C rozetleri ve D/E çiftleri ayrıca tutulur."""
+        with self.sure_olc("grupla"):
+            self.sg_gruplari = self.kurallar.grupla(self.fiziksel_sgler)
+            self.shear_rosettes, self.average_pairs = {}, {}
+            for prefix, gauges in self.sg_gruplari.items():
+                if 'A' in gauges and 'B' in gauges and 'C' in gauges and hesaplama_uygulanir_mi(gauges, "ROZET"): self.shear_rosettes[prefix] = gauges
+                if 'D' in gauges and 'E' in gauges: self.average_pairs[prefix] = gauges
+
+    def var_mi(self, kolon):
+        return kolon in self.df.columns or kolon in self.turetilmis
+
+    def kanallari_kaydet(self, plan):
+        """
+        Planı türetilmiş kanal olarak kaydeder. Tanımı değişen kanalların (ve bağımlılarının) hesaplanmış
+        değerleri silinir. Dönüş: (eklenen/güncellenen kanal sayısı, geçersiz kılınan sütunlar kümesi).
+        """
+        yeni, degisen = self.turetilmis.kaydet(plan)
+        etkilenen = self.gecersiz_kil(degisen) if degisen else set()
+        self.tum_sgler.extend(yeni)
+        return len(yeni) + len(degisen), etkilenen
+
+    def gecersiz_kil(self, kolonlar):
+        etkilenen = set(kolonlar) | self.turetilmis.bagimlilar(kolonlar)
+        silinecek = [col for col in self.df.columns if col in etkilenen and col in self.turetilmis]
+        if silinecek: self.df = self.df.drop(columns=silinecek)
+        return etkilenen
+
+    def hesaplamalari_uygula(self, tanimlar):
+        """Hesaplamaların çıktılarını sanal kanal olarak kaydeder; değerler ilk kullanımda hesaplanır."""
+        with self.sure_olc("hesapla_kaydet"):
+            gercek_kolonlar = [col for col in self.df.columns if col not in self.turetilmis]
+            plan, _ = hesaplama_plani(gercek_kolonlar, self.sg_gruplari, tanimlar, sanal_kolonlar=self.turetilmis)
+            return self.kanallari_kaydet(plan)
+
+    def rozet_analizi(self, tip, E=None, nu=None):
+        """Tüm A/B/C rozetleri için asal gerinim/gerilme kanallarını kaydeder. Dönüş: kanallari_kaydet ile aynı."""
+        with self.sure_olc("rozet_kaydet"):
+            plan = [adim for adim in rozet_plani(self.shear_rosettes, tip, E, nu) if adim[0] not in self.df.columns or adim[0] in self.turetilmis]
+            return self.kanallari_kaydet(plan)
+
+    def kolonlari_hazirla(self, kolonlar):
+        """İstenen sanal kanallardan henüz hesaplanmamış olanları hesaplayıp veriye tek bir concat ile ekler."""
+        with self.sure_olc("hesapla"):
+            yeni_df = self.turetilmis.hesapla(self.df, kolonlar)
+            if yeni_df is not None: self.df = pd.concat([self.df, yeni_df], axis=1)
+
+    def goruntu(self, sadece_yukleme=False, x_araligi=None, nokta_sayisi=None, cevrim=None, kol=None):
+        """Tam veri veya kesilmiş/çevrim/yakınlaştırılmış/seyreltilmiş görünüm (slice seçimlerde kopyasız)."""
+        return self.df.iloc[self.satirlar(sadece_yukleme, x_araligi, nokta_sayisi, cevrim, kol)]
+
+    def veri(self, kolonlar, sadece_yukleme=False, x_araligi=None, nokta_sayisi=None, cevrim=None, kol=None):
+        """İstenen sütunlar (sanal olanlar gerekirse hesaplanarak) ve seçilen satırlarla bir DataFrame döner."""
+        self.kolonlari_hazirla(kolonlar)
+        secim = self.satirlar(sadece_yukleme, x_araligi, nokta_sayisi, cevrim, kol)
+        indeksler = self.df.columns.get_indexer(list(kolonlar))
+        # get_indexer bilinmeyen sütunlara -1 verir; iloc bunu sessizce son sütun olarak okurdu.
+        if (indeksler < 0).any(): raise KeyError(f"Veride bulunmayan sütunlar: {[k for k, i in zip(kolonlar, indeksler) if i < 0]}")
+        return self.df.iloc[secim, indeksler]
+
+    def rainflow_say(self, sg_names, parca_satir=None, is_sayisi=None, **secim):
+        """
+        Seçili kanallar (türetilmiş olanlar dahil) için rainflow sayımı: {SG: {'aralik', 'ortalama', 'sayi'}}.
+        parca_satir verilirse kaynak dosya parça parça okunur (seçim yok sayılır, bellekten büyük dosyalar için);
+        türetilmiş kanallar her parçada hesaplanır. Sadece vektörel geçişler (NumPy içinde GIL'i bırakır) kanallar
+        arasında iş parçacıklarında paralel çalışır; GIL'i tutan saf Python yığın adımı gereken kanallarda sırayla yapılır.
+        """
+        sg_names = list(sg_names)
+        sayaclar = {sg: RainflowSayaci() for sg in sg_names}
+        with self.sure_olc("rainflow"), ThreadPoolExecutor(max_workers=is_sayisi) as havuz:
+            if parca_satir: parcalar = dat_parcalari(self.kaynak, self.turetilmis.kaynaklar(sg_names), parca_satir)
+            else: parcalar = [self.veri(sg_names, **secim)]
+            for parca in parcalar:
+                yeni_df = self.turetilmis.hesapla(parca, sg_names)
+                if yeni_df is not None: parca = pd.concat([parca, yeni_df], axis=1)
+                list(havuz.map(lambda sg: sayaclar[sg].ekle_vektorel(parca[sg].to_numpy()), sg_names))
+                for sayac in sayaclar.values(): sayac.tamamla()
+        return {sg: sayac.sonuc() for sg, sayac in sayaclar.items()}
+
+    def histerezis(self, sg_names=None, cevrim=None, nokta_sayisi=200):
+        """
+        Bir çevrimin (cevrim=None: en yüksek tepeyi içeren çevrim) yükleme/boşaltma kolları arasındaki histerezis
+        ve kalıcı gerinim, tüm SG'ler için tek seferde (varsayılan: fiziksel SG'ler). Dönüş: histerezis alanına göre
+        azalan sıralı DataFrame.
+        """
+        sg_names = list(sg_names or self.fiziksel_sgler)
+        if self.cevrimler is None: raise ValueError("Yük verisi sütunu (Load_Ratio) bulunamadı.")
+        # Çevrim verilmezse tüm dosya tepeden bölünmez; önceki tam çevrimler yükleme koluna karışırdı.
+        if cevrim is None: cevrim = self.cevrimler.tepe_cevrimi
+        with self.sure_olc("histerezis"):
+            self.kolonlari_hazirla(sg_names)
+            veriler = self.df[sg_names].to_numpy(dtype=float)
+            olculer = histerezis_analizi(self.df[self.yuk_kolonu].to_numpy(dtype=float), veriler, self.cevrimler.aralik(cevrim, "yukleme"),
+                                         self.cevrimler.aralik(cevrim, "bosaltma"), nokta_sayisi)
+        return pd.DataFrame({"SG": sg_names, "Histerezis Alanı (μstrain·yük)": olculer["alan"], "Göreli Alan (%)": olculer["goreli_alan"],
+                             "Kalıcı Gerinim (μstrain)": olculer["kalici"], "Maks. Kol Farkı (μstrain)": olculer["maks_fark"],
+                             "Maks. Fark Yükü": olculer["maks_fark_yuku"]}).sort_values("Histerezis Alanı (μstrain·yük)", ascending=False, ignore_index=True)
+
+    def dogrusallik(self, sg_names=None, cevrim=None):
+        """
+        Yükleme kolunda (cevrim=None: en yüksek tepeyi içeren çevrim) tüm SG'ler için eğim, kesişim, R² ve en büyük sapma
+        (varsayılan: fiziksel SG'ler). Dönüş: en az doğrusal olandan (en düşük R²) başlayan DataFrame.
+        """
+        sg_names = list(sg_names or self.fiziksel_sgler)
+        if self.cevrimler is None: raise ValueError("Yük verisi sütunu (Load_Ratio) bulunamadı.")
+        if cevrim is None: cevrim = self.cevrimler.tepe_cevrimi  # Önceki çevrimlerin yükleme/boşaltması regresyona karışmasın.
+        with self.sure_olc("dogrusallik"):
+            self.kolonlari_hazirla(sg_names)
+            kol = self.cevrimler.aralik(cevrim, "yukleme")
+            olculer = dogrusallik_analizi(self.df[self.yuk_kolonu].to_numpy(dtype=float)[kol], self.df[sg_names].to_numpy(dtype=float)[kol])
+        aralik = np.abs(olculer["egim"]) * np.ptp(self.df[self.yuk_kolonu].to_numpy()[kol])
+        return pd.DataFrame({"SG": sg_names, "Eğim (μstrain/yük)": olculer["egim"], "Kesişim (μstrain)": olculer["kesisim"], "R²": olculer["r2"],
+                             "Maks. Sapma (μstrain)": olculer["maks_sapma"],
+                             "Maks. Sapma (%)": 100 * np.divide(olculer["maks_sapma"], aralik, out=np.full(len(aralik), np.nan), where=aralik > 0),
+                             "Sapma Yükü": olculer["maks_sapma_yuku"]}).sort_values("R²", ignore_index=True)
+
+    def tahmin_karsilastir(self, sg_names, tahmin_yuku, tahminler, sinir_yuk=None, izgara="olcum", **secim):
+        """
+        Seçili satırlardaki ölçümleri (türetilmiş kanallar dahil) tahminlerle karşılaştırır. tahminler: (nokta,) tek eğri
+        (tüm SG'lere uygulanır) veya (nokta x SG). Dönüş: SG başına RMSE, maks. hata, sınır yükte bağıl hata tablosu.
+        """
+        sg_names = list(sg_names)
+        if not self.yuk_kolonu: raise ValueError("Yük verisi sütunu (Load_Ratio) bulunamadı.")
+        with self.sure_olc("karsilastir"):
+            veri = self.veri([self.yuk_kolonu] + sg_names, **secim)
+            tahminler = np.asarray(tahminler, dtype=float)
+            if tahminler.ndim == 1: tahminler = np.repeat(tahminler[:, None], len(sg_names), axis=1)
+            olculer = karsilastirma_olculeri(veri.iloc[:, 0].to_numpy(dtype=float), veri.iloc[:, 1:].to_numpy(dtype=float),
+                                             tahmin_yuku, tahminler, sinir_yuk, izgara)
+        return karsilastirma_tablosu(sg_names, olculer)
+
+    def rapor_hazirla(self, sg_names, sadece_yukleme=False, grafik_basligi=None, grafik_sg_sayisi=10, x_araligi=None, nokta_sayisi=None,
+                      cevrim=None, kol=None):
+        """Rapor verisi (yük sütunu + seçili SG'ler) ve başlık verilmişse grafik resmi. Dönüş: (DataFrame, BytesIO|None)."""
+        load_column = self.yuk_kolonu
+        if not load_column: raise ValueError("Yük verisi sütunu (Load_Ratio) bulunamadı.")
+        export_df = self.veri([load_column] + list(sg_names), sadece_yukleme, x_araligi, nokta_sayisi, cevrim, kol)
+        grafik = grafik_resmi_olustur(export_df, load_column, list(sg_names)[:grafik_sg_sayisi], grafik_basligi) if grafik_basligi else None
+        return export_df, grafik
+
+    def veri_disa_aktar(self, filepath, sg_names, sikistirma=None, sadece_yukleme=False, x_araligi=None, nokta_sayisi=None,
+                        cevrim=None, kol=None):
+        """Yük sütunu + seçili SG'leri (ham ve türetilmiş) Parquet/Feather/HDF5/CSV olarak yazar."""
+        with self.sure_olc("disa_aktar"):
+            export_df, _ = self.rapor_hazirla(sg_names, sadece_yukleme, x_araligi=x_araligi, nokta_sayisi=nokta_sayisi, cevrim=cevrim, kol=kol)
+            veri_dosyasi_yaz(filepath, export_df, sikistirma)
+
+    def excele_aktar(self, filepath, sg_names, sadece_yukleme=False, grafik_basligi=None, grafik_sg_sayisi=10, ilerleme=None,
+                     x_araligi=None, nokta_sayisi=None, cevrim=None, kol=None):
+        """Yük sütunu + seçili SG'leri Excel'e yazar; başlık verilirse grafiği de ekler. Dönüş: grafik eklendi mi."""
+        with self.sure_olc("disa_aktar"):
+            export_df, grafik = self.rapor_hazirla(sg_names, sadece_yukleme, grafik_basligi, grafik_sg_sayisi, x_araligi, nokta_sayisi,
+                                                   cevrim, kol)
+            excel_raporu_yaz(filepath, export_df, grafik, ilerleme=ilerleme)
+        return grafik is not None
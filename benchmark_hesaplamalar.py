@@ -0,0 +1,71 @@
+##########################################################
+# Hesaplama performans ölçümü: 1000 rozet (3000 SG) üzerinde eski grup-grup döngü ile
+# yeni toplu (satır x grup x harf) değerlendirmeyi karşılaştırır.
+#   python benchmark_hesaplamalar.py [rozet_sayisi] [satir_sayisi]
+##########################################################
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from formul_motoru import hesaplama_tanimi, hesaplamalari_toplu_degerlendir
+
+
+def ornek_veri_olustur(rozet_sayisi, satir_sayisi):
+    """Her rozet için A, B, C ve D, E kanalları içeren sentetik bir ölçüm tablosu ve grup sözlüğü üretir."""
+    rng = np.random.default_rng(0)
+    kolonlar, sg_gruplari = ["Load_Ratio:MON1"], {}
+    for i in range(rozet_sayisi):
+        prefix = str(1001 + i)
+        sg_gruplari[prefix] = {"suffix": "MON1"}
+        for harf in "ABCDE":
+            kolonlar.append(f"{prefix}{harf}:MON1"); sg_gruplari[prefix][harf] = kolonlar[-1]
+    df = pd.DataFrame(rng.normal(size=(satir_sayisi, len(kolonlar))), columns=kolonlar)
+    return df, sg_gruplari
+
+
+def eski_yontem(df, sg_gruplari, tanimlar):
+    """Önceki perform_calculation davranışı: her grup için Series çek, sütunu tek tek ekle."""
+    df = df.copy()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", pd.errors.PerformanceWarning)
+        for tanim in tanimlar.values():
+            for prefix, gauges in sg_gruplari.items():
+                input_data = {inp: df[gauges[inp]] for inp in tanim["inputs"]}
+                df[f"{prefix}{tanim['output_suffix']}:{gauges['suffix']}"] = tanim["formula"](**input_data)
+    return df
+
+
+def yeni_yontem(df, sg_gruplari, tanimlar):
+    yeni_df, _ = hesaplamalari_toplu_degerlendir(df, sg_gruplari, tanimlar)
+    return pd.concat([df, yeni_df], axis=1)
+
+
+def olc(fonksiyon, *args, tekrar=3):
+    sureler = []
+    for _ in range(tekrar):
+        baslangic = time.perf_counter(); sonuc = fonksiyon(*args); sureler.append(time.perf_counter() - baslangic)
+    return min(sureler), sonuc
+
+
+if __name__ == "__main__":
+    rozet_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    satir_sayisi = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    df, sg_gruplari = ornek_veri_olustur(rozet_sayisi, satir_sayisi)
+    tanimlar = {
+        "Shear": hesaplama_tanimi("Shear", "2B - A - C", 'S'),
+        "Average": hesaplama_tanimi("Average", "(D + E)/2", 'Avg'),
+    }
+    print(f"{rozet_sayisi} rozet, {satir_sayisi} satır, {len(df.columns)} sütun")
+    eski_sure, eski_df = olc(eski_yontem, df, sg_gruplari, tanimlar)
+    yeni_sure, yeni_df = olc(yeni_yontem, df, sg_gruplari, tanimlar)
+    # Süreler ancak iki yöntem aynı sütunları aynı değerlerle üretiyorsa anlamlıdır.
+    np.testing.assert_array_equal(sorted(eski_df.columns), sorted(yeni_df.columns))
+    np.testing.assert_allclose(yeni_df.to_numpy(), eski_df[yeni_df.columns].to_numpy(), rtol=1e-12, atol=1e-12,
+                               err_msg="Toplu değerlendirme eski döngüyle aynı sonucu vermiyor")
+    fark = np.abs(eski_df[yeni_df.columns].to_numpy() - yeni_df.to_numpy()).max()
+    print(f"Eski (grup-grup döngü): {eski_sure * 1000:9.1f} ms")
+    print(f"Yeni (toplu tensör)   : {yeni_sure * 1000:9.1f} ms  ({eski_sure / yeni_sure:.1f}x)")
+    print(f"En büyük fark: {fark:.3e}")
@@ -0,0 +1,263 @@
+import ast
+import json
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from gruplama_kurallari import cikti_kolon_adi, hesaplama_uygulanir_mi
+
+try:
+    import numexpr as ne  # Opsiyonel: varsa büyük dizilerde çok çekirdekli değerlendirme yapılır.
+except ImportError:
+    ne = None
+
+# Formüllerde kullanılabilecek fonksiyonlar ve sabitler (başka hiçbir isim çalıştırılmaz).
+IZINLI_FONKSIYONLAR = {
+    "sqrt": np.sqrt, "abs": np.abs, "exp": np.exp, "log": np.log, "log10": np.log10,
+    "sin": np.sin, "cos": np.cos, "tan": np.tan, "arctan": np.arctan, "arctan2": np.arctan2,
+    "degrees": np.degrees, "radians": np.radians, "hypot": np.hypot,
+    "minimum": np.minimum, "maximum": np.maximum, "where": np.where,
+}
+NUMEXPR_FONKSIYONLARI = {"sqrt", "abs", "exp", "log", "log10", "sin", "cos", "tan", "arctan", "arctan2", "where"}
+IZINLI_SABITLER = {"pi": np.pi}
+IZINLI_DUGUMLER = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant, ast.Compare,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.USub, ast.UAdd,
+    ast.Gt, ast.GtE, ast.Lt, ast.LtE,
+)
+ROZET_HARFI = re.compile(r"^[A-Z]$")
+SG_ADI = re.compile(r"`([^`]+)`")
+# "2B" veya "0.5(A+C)" gibi örtük çarpımları "2*B" / "0.5*(A+C)" yapar; "1e3" gibi üstel sayılara dokunmaz.
+ORTUK_CARPIM = re.compile(r"(?<![\w.])(\d+(?:\.\d+)?)(?![eE][+-]?\d)(?=[A-Za-z_(])")
+
+
+class FormulHatasi(ValueError):
+    """Formül ayrıştırılamadığında veya izin verilmeyen bir ifade içerdiğinde fırlatılır."""
+
+
+class Formul:
+    """
+    Kullanıcının yazdığı bir ifadeyi (ör. '(A - C)/2', 'sqrt((A-C)**2 + (2B-A-C)**2)') bir kez ayrıştırır,
+    doğrular ve derler. Rozet harfleri (A, B, C...) ve ters tırnak içindeki tam SG adları
+    (ör. `1001A:MON1`) değişken olarak kullanılabilir. Girdiler (satır x grup) dizileri olduğunda
+    tüm gruplar tek seferde hesaplanır.
+    """
+
+    def __init__(self, ifade):
+        self.ifade = ifade.strip()
+        if not self.ifade: raise FormulHatasi("Formül boş olamaz.")
+        self.sg_adlari = []
+        def sg_yer_tutucu(match):
+            if match.group(1) not in self.sg_adlari: self.sg_adlari.append(match.group(1))
+            return f"_sg{self.sg_adlari.index(match.group(1))}"
+        python_ifadesi = ORTUK_CARPIM.sub(r"\1*", SG_ADI.sub(sg_yer_tutucu, self.ifade))
+        try:
+            agac = ast.parse(python_ifadesi, mode='eval')
+        except SyntaxError as e:
+            raise FormulHatasi(f"Formül ayrıştırılamadı: {self.ifade}") from e
+        harfler, fonksiyonlar = set(), set()
+        for dugum in ast.walk(agac):
+            if not isinstance(dugum, IZINLI_DUGUMLER):
+                raise FormulHatasi(f"İzin verilmeyen ifade: {type(dugum).__name__}")
+            if isinstance(dugum, ast.Call):
+                if not isinstance(dugum.func, ast.Name) or dugum.func.id not in IZINLI_FONKSIYONLAR or dugum.keywords:
+                    raise FormulHatasi(f"İzin verilmeyen fonksiyon çağrısı: {ast.unparse(dugum.func)}")
+                fonksiyonlar.add(dugum.func.id)
+            elif isinstance(dugum, ast.Name):
+                if dugum.id in IZINLI_FONKSIYONLAR or dugum.id in IZINLI_SABITLER or dugum.id.startswith("_sg"): continue
+                if not ROZET_HARFI.match(dugum.id):
+                    raise FormulHatasi(f"Bilinmeyen değişken '{dugum.id}'. Rozet harfi (A-Z) veya `SG_ADI` kullanın.")
+                harfler.add(dugum.id)
+            elif isinstance(dugum, ast.Constant) and not isinstance(dugum.value, (int, float)):
+                raise FormulHatasi(f"Geçersiz sabit: {dugum.value!r}")
+        self.harfler = sorted(harfler)
+        self._python_ifadesi = python_ifadesi
+        self._kod = compile(agac, "<formül>", "eval")
+        self._numexpr_uygun = ne is not None and fonksiyonlar <= NUMEXPR_FONKSIYONLARI
+
+    @property
+    def girdiler(self):
+        """Formülün ihtiyaç duyduğu tüm değişkenler (rozet harfleri ve tam SG adları)."""
+        return self.harfler + self.sg_adlari
+
+    def degerlendir(self, degiskenler):
+        """'degiskenler' sözlüğü harf ve SG adlarını dizilere eşler; sonuç tek bir vektörel işlemdir."""
+        ad_alani = dict(IZINLI_SABITLER)
+        for harf in self.harfler: ad_alani[harf] = degiskenler[harf]
+        for i, sg_adi in enumerate(self.sg_adlari): ad_alani[f"_sg{i}"] = degiskenler[sg_adi]
+        if self._numexpr_uygun and all(isinstance(v, np.ndarray) for v in ad_alani.values() if not np.isscalar(v)):
+            return ne.evaluate(self._python_ifadesi, local_dict=ad_alani)
+        ad_alani.update(IZINLI_FONKSIYONLAR)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return eval(self._kod, {"__builtins__": {}}, ad_alani)
+
+    def __call__(self, **degiskenler):
+        return self.degerlendir(degiskenler)
+
+    def __repr__(self):
+        return f"Formul({self.ifade!r})"
+
+
+@lru_cache(maxsize=256)
+def formulu_derle(ifade):
+    """Aynı ifade tekrar tekrar ayrıştırılmasın diye derlenmiş formülleri önbellekte tutar."""
+    return Formul(ifade)
+
+
+def hesaplama_tanimi(ad, ifade, cikti_eki):
+    """Uygulamanın 'calculations' sözlüğündeki biçimde bir hesaplama tanımı oluşturur."""
+    if not re.match(r"^\w+$", cikti_eki or ""): raise FormulHatasi("Çıktı eki sadece harf, rakam ve '_' içerebilir.")
+    formul = formulu_derle(ifade)
+    if not formul.girdiler: raise FormulHatasi("Formül en az bir rozet harfi veya SG adı içermelidir.")
+    return {"inputs": formul.girdiler, "output_suffix": cikti_eki, "formula": formul, "expression": formul.ifade}
+
+
+def tanimlari_yukle(dosya_yolu):
+    """Kaydedilmiş hesaplama tanımlarını JSON dosyasından okur; hatalı tanımlar atlanır."""
+    if not os.path.exists(dosya_yolu): return {}
+    with open(dosya_yolu, encoding='utf-8') as f: kayitlar = json.load(f)
+    tanimlar = {}
+    for kayit in kayitlar:
+        try: tanimlar[kayit["ad"]] = hesaplama_tanimi(kayit["ad"], kayit["ifade"], kayit["cikti_eki"])
+        except (KeyError, FormulHatasi) as e: print(f"Uyarı: Kayıtlı hesaplama '{kayit.get('ad', '?')}' yüklenemedi: {e}")
+    return tanimlar
+
+
+def tanimlari_kaydet(dosya_yolu, tanimlar):
+    kayitlar = [{"ad": ad, "ifade": t["expression"], "cikti_eki": t["output_suffix"]} for ad, t in tanimlar.items()]
+    with open(dosya_yolu, 'w', encoding='utf-8') as f: json.dump(kayitlar, f, ensure_ascii=False, indent=2)
+
+
+def hesaplama_plani(kolonlar, sg_gruplari, tanimlar, sanal_kolonlar=()):
+    """
+    Hesaplama tanımlarını hangi gruplara uygulanacağını gösteren bir plana çevirir:
+    [(çıktı_sütunu, formül, {değişken: kaynak_sütun}), ...]. 'kolonlar' veride gerçekten bulunan sütunlardır
+    ve bunlarla çakışan çıktılar atlanır; 'sanal_kolonlar' henüz hesaplanmamış türetilmiş kanallardır ve
+    formüllerde kaynak olarak kullanılabilir. Dönüş: (plan, {hesaplama_adı: çıktı_sayısı}).
+    """
+    mevcut, kaynaklar = set(kolonlar), set(kolonlar) | set(sanal_kolonlar)
+    plan, sayilar = [], {}
+    for ad, tanim in tanimlar.items():
+        formul, ek = tanim["formula"], tanim["output_suffix"]
+        if any(sg not in kaynaklar for sg in formul.sg_adlari): sayilar[ad] = 0; continue
+        sg_girdileri = {sg: sg for sg in formul.sg_adlari}
+        if formul.harfler:
+            hedefler = [(cikti_kolon_adi(prefix, gauges, ek), {h: gauges[h] for h in formul.harfler})
+                        for prefix, gauges in sg_gruplari.items()
+                        if hesaplama_uygulanir_mi(gauges, ek) and all(gauges.get(h) in kaynaklar for h in formul.harfler)]
+        else: hedefler = [(f"{ek}:CALC", {})]  # Sadece tam SG adları kullanan formül tek sütun üretir.
+        hedefler = [(col, {**girdiler, **sg_girdileri}) for col, girdiler in hedefler if col not in mevcut]
+        mevcut.update(col for col, _ in hedefler)
+        sayilar[ad] = len(hedefler)
+        plan.extend((col, formul, girdiler) for col, girdiler in hedefler)
+    return plan, sayilar
+
+
+def plani_degerlendir(df, plan, ek_kaynaklar=None):
+    """
+    Planın tüm çıktılarını tek bir (satır x çıktı) matrisinde hesaplar. Gerekli kaynak sütunlar bir kez
+    okunur; aynı formülü paylaşan tüm gruplar, her harf için (satır x grup) dilimi alınarak tek bir vektörel
+    çağrıyla değerlendirilir. 'ek_kaynaklar', df'de olmayan (önceden hesaplanmış) sütunların dizileridir.
+    """
+    ek_kaynaklar = ek_kaynaklar or {}
+    kaynak_kolonlari = list(dict.fromkeys(k for _, _, girdiler in plan for k in girdiler.values() if k not in ek_kaynaklar))
+    ek_kolonlar = list(dict.fromkeys(k for _, _, girdiler in plan for k in girdiler.values() if k in ek_kaynaklar))
+    konum = {k: i for i, k in enumerate(kaynak_kolonlari + ek_kolonlar)}
+    kaynak = df[kaynak_kolonlari].to_numpy(dtype=float) if kaynak_kolonlari else np.empty((len(df), 0))
+    if ek_kolonlar: kaynak = np.column_stack([kaynak] + [ek_kaynaklar[k] for k in ek_kolonlar])
+
+    formul_gruplari = {}
+    for j, (_, formul, girdiler) in enumerate(plan): formul_gruplari.setdefault(id(formul), (formul, []))[1].append((j, girdiler))
+    cikti = np.empty((len(df), len(plan)), dtype=float)
+    for formul, uyeler in formul_gruplari.values():
+        sutunlar = [j for j, _ in uyeler]
+        degiskenler = {h: kaynak[:, [konum[g[h]] for _, g in uyeler]] for h in formul.harfler}
+        for sg in formul.sg_adlari: degiskenler[sg] = kaynak[:, [konum[sg]]]
+        cikti[:, sutunlar] = formul.degerlendir(degiskenler)
+    return cikti
+
+
+def hesaplamalari_toplu_degerlendir(df, sg_gruplari, tanimlar):
+    """
+    Verilen tüm hesaplama tanımlarını tüm uygun gruplar için tek seferde değerlendirir.
+    Dönüş: (yeni sütunların DataFrame'i veya None, {hesaplama_adı: sütun_sayısı}).
+    """
+    plan, sayilar = hesaplama_plani(df.columns, sg_gruplari, tanimlar)
+    if not plan: return None, sayilar
+    return pd.DataFrame(plani_degerlendir(df, plan), index=df.index, columns=[col for col, _, _ in plan], copy=False), sayilar
+
+
+class TuretilmisKanallar:
+    """
+    Sanal (türetilmiş) kanalların kaydı. Kanallar kaydedildiğinde hesaplanmaz; değerleri ilk istendiklerinde
+    (grafik, tablo, dışa aktarma) 'hesapla' ile üretilir. Her kanal, formülünü ve girdi sütunlarını tutar;
+    böylece bir girdi değiştiğinde ona bağlı tüm kanallar bulunup geçersiz kılınabilir.
+    """
+
+    def __init__(self):
+        self.kanallar = {}  # sütun -> (formül, {değişken: kaynak_sütun})
+
+    def __contains__(self, kolon):
+        return kolon in self.kanallar
+
+    def __iter__(self):
+        return iter(self.kanallar)
+
+    def __len__(self):
+        return len(self.kanallar)
+
+    def temizle(self):
+        self.kanallar.clear()
+
+    def kaydet(self, plan):
+        """Plandaki kanalları kaydeder. Dönüş: (yeni kanallar, tanımı değişen kanallar)."""
+        yeni, degisen = [], []
+        for kolon, formul, girdiler in plan:
+            eski = self.kanallar.get(kolon)
+            if eski is None: yeni.append(kolon)
+            elif eski[0] != formul or eski[1] != girdiler: degisen.append(kolon)
+            else: continue
+            self.kanallar[kolon] = (formul, girdiler)
+        return yeni, degisen
+
+    def bagimlilar(self, kolonlar):
+        """Verilen sütunlara doğrudan veya dolaylı olarak bağlı tüm sanal kanallar."""
+        etkilenen, bekleyen = set(), set(kolonlar)
+        while bekleyen:
+            bekleyen = {k for k, (_, girdiler) in self.kanallar.items() if k not in etkilenen and bekleyen.intersection(girdiler.values())}
+            etkilenen |= bekleyen
+        return etkilenen
+
+    def kaynaklar(self, kolonlar):
+        """İstenen sütunları hesaplamak için gereken gerçek (sanal olmayan) sütunlar; sanal girdiler izlenerek bulunur."""
+        gerekli, bekleyen = set(), list(kolonlar)
+        while bekleyen:
+            kolon = bekleyen.pop()
+            if kolon in self.kanallar: bekleyen.extend(self.kanallar[kolon][1].values())
+            else: gerekli.add(kolon)
+        return gerekli
+
+    def hesapla(self, df, kolonlar):
+        """
+        İstenen sanal kanallardan df'de henüz bulunmayanları (ve gerekiyorsa onların sanal girdilerini)
+        hesaplar. Bağımlılıkları hazır olan kanallar seviye seviye, her seviye tek bir planla değerlendirilir.
+        Dönüş: yeni sütunların DataFrame'i veya hesaplanacak bir şey yoksa None.
+        """
+        gerekli, ziyaret = [], set()
+        def ekle(kolon):
+            if kolon in ziyaret or kolon in df.columns or kolon not in self.kanallar: return
+            ziyaret.add(kolon)
+            for girdi in self.kanallar[kolon][1].values(): ekle(girdi)
+            gerekli.append(kolon)
+        for kolon in kolonlar: ekle(kolon)
+        if not gerekli: return None
+        hesaplanan = {}
+        while len(hesaplanan) < len(gerekli):
+            seviye = [k for k in gerekli if k not in hesaplanan and all(g in df.columns or g in hesaplanan for g in self.kanallar[k][1].values())]
+            if not seviye: raise KeyError(f"Türetilmiş kanalların girdileri bulunamadı: {[k for k in gerekli if k not in hesaplanan]}")
+            sonuc = plani_degerlendir(df, [(k, *self.kanallar[k]) for k in seviye], hesaplanan)
+            hesaplanan.update((k, sonuc[:, i]) for i, k in enumerate(seviye))
+        return pd.DataFrame(hesaplanan, index=df.index)
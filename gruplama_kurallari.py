@@ -0,0 +1,89 @@
+import json
+import os
+import re
+
+# Dosya bulunamazsa kullanılan kural: eski sabit '(\d+)([A-Z])' davranışı (ör. 1001A:MON1 -> grup 1001, rol A).
+VARSAYILAN_KURALLAR = [
+    {"ad": "Sayısal önek + harf (ör. 1001A:MON1)", "desen": r"^(?P<grup>\d+)(?P<rol>[A-Z]):(?P<ek>.+)$"},
+]
+ROZET_HARFI = re.compile(r"^[A-Z]$")
+KURAL_GRUP_ADI = re.compile(r"\(\?P([<=])(grup|rol|ek)\b")
+
+
+class KuralHatasi(ValueError):
+    """Gruplama kural dosyası okunamadığında veya bir kural geçersiz olduğunda fırlatılır."""
+
+
+class GruplamaKurallari:
+    """
+    SG adlarını hesaplama gruplarına ayıran kural seti. Her kural bir düzenli ifade ('desen') içerir;
+    desendeki 'grup' yakalaması grup önekini, 'rol' yakalaması gauge'in gruptaki rolünü (A, B, C...),
+    isteğe bağlı 'ek' yakalaması ':' sonrası kanal ekini verir. 'roller' sözlüğü yakalanan rolü formül
+    harfine eşler (ör. {"0": "A", "45": "B", "90": "C"}); 'hesaplamalar' listesi bu gruplara hangi
+    hesaplamaların (çıktı ekleri, ör. "S", "Avg", rozet analizi için "ROZET") uygulanacağını sınırlar.
+    Tüm kurallar tek bir birleşik ifadeye derlenir; her SG adı tek bir eşleştirmeyle sınıflandırılır.
+    """
+
+    def __init__(self, kurallar):
+        if not kurallar: raise KuralHatasi("En az bir gruplama kuralı tanımlanmalıdır.")
+        self.kurallar, parcalar = [], []
+        for i, kural in enumerate(kurallar):
+            desen = kural.get("desen")
+            try: derlenmis = re.compile(desen or "")
+            except re.error as e: raise KuralHatasi(f"Kural '{kural.get('ad', i)}' için geçersiz desen: {e}") from e
+            if not {"grup", "rol"} <= set(derlenmis.groupindex):
+                raise KuralHatasi(f"Kural '{kural.get('ad', i)}' deseni 'grup' ve 'rol' adlı yakalamalar içermelidir.")
+            roller = kural.get("roller")
+            if roller and not all(ROZET_HARFI.match(harf) for harf in roller.values()):
+                raise KuralHatasi(f"Kural '{kural.get('ad', i)}': roller tek büyük harfe (A-Z) eşlenmelidir.")
+            hesaplamalar = kural.get("hesaplamalar")
+            self.kurallar.append({"ad": kural.get("ad", f"Kural {i + 1}"), "roller": roller, "ayirici": kural.get("cikti_ayirici", ""),
+                                  "hesaplamalar": set(hesaplamalar) if hesaplamalar is not None else None,
+                                  "ek_var": "ek" in derlenmis.groupindex})
+            # Yakalama adları her kural için benzersiz yapılır ki tüm kurallar tek bir ifadede birleşebilsin.
+            parcalar.append(f"(?P<k{i}>{KURAL_GRUP_ADI.sub(lambda m, i=i: f'(?P{m.group(1)}{m.group(2)}_{i}', desen)})")
+        self._birlesik = re.compile("|".join(parcalar))
+
+    @classmethod
+    def dosyadan(cls, dosya_yolu):
+        """Kuralları JSON dosyasından ({"kurallar": [...]}) yükler; dosya yoksa varsayılan kural kullanılır."""
+        if not os.path.exists(dosya_yolu): return cls(VARSAYILAN_KURALLAR)
+        try:
+            with open(dosya_yolu, encoding='utf-8') as f: icerik = json.load(f)
+        except (OSError, ValueError) as e:
+            raise KuralHatasi(f"'{os.path.basename(dosya_yolu)}' okunamadı: {e}") from e
+        return cls(icerik.get("kurallar", []) if isinstance(icerik, dict) else icerik)
+
+    def grupla(self, sg_adlari):
+        """
+        SG adlarını gruplar: {grup_anahtarı: {harf: SG adı, 'suffix', 'onek', 'ayirici', 'hesaplamalar'}}.
+        Aynı önek farklı kanal eklerinde (MON1/MON2) ayrı gruplar oluşturur; ilk eşleşen kural geçerlidir.
+        """
+        gruplar = {}
+        eslestir = self._birlesik.match
+        for sg_name in sg_adlari:
+            match = eslestir(sg_name)
+            if match is None: continue
+            i = int(match.lastgroup[1:]); kural = self.kurallar[i]
+            rol = match.group(f"rol_{i}")
+            harf = kural["roller"].get(rol) if kural["roller"] else (rol if ROZET_HARFI.match(rol) else None)
+            if harf is None: continue
+            onek = match.group(f"grup_{i}")
+            ek = (match.group(f"ek_{i}") if kural["ek_var"] else None) or "SG"
+            anahtar = f"{onek}:{ek}"
+            if anahtar not in gruplar:
+                gruplar[anahtar] = {"suffix": ek, "onek": onek, "ayirici": kural["ayirici"], "hesaplamalar": kural["hesaplamalar"]}
+            gruplar[anahtar][harf] = sg_name
+        return gruplar
+
+
+def hesaplama_uygulanir_mi(gauges, cikti_eki):
+    """Grubun kuralı bu hesaplamayı (çıktı ekine göre) kapsıyor mu? Kısıt yoksa tüm hesaplamalar uygulanır."""
+    izinli = gauges.get("hesaplamalar")
+    return izinli is None or cikti_eki in izinli
+
+
+def cikti_kolon_adi(grup_anahtari, gauges, cikti_eki):
+    """Bir grubun hesaplama çıktısının sütun adı, ör. '1001S:MON1' veya 'WING_L_R12_S:MON2'."""
+    onek = gauges.get("onek", grup_anahtari)
+    return f"{onek}{gauges.get('ayirici', '')}{cikti_eki}:{gauges.get('suffix', 'SG')}"
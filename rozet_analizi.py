@@ -0,0 +1,64 @@
+import numpy as np
+
+# Rozet tipleri: A, B, C gauge'lerinin A eksenine göre açıları (derece).
+ROZET_TIPLERI = {
+    "dik": (0.0, 45.0, 90.0),      # Dikdörtgen (0/45/90) rozet
+    "delta": (0.0, 60.0, 120.0),   # Delta (0/60/120) rozet
+}
+# Çıktı sütunu ekleri ve açıklamaları; stres çıktıları sadece E ve ν verildiğinde üretilir.
+GERINIM_CIKTILARI = {"E1": "Asal gerinim ε1 (μstrain)", "E2": "Asal gerinim ε2 (μstrain)",
+                     "GMAX": "Maksimum kayma gerinimi γmax (μstrain)", "THETA": "Asal açı θp (derece, A ekseninden ε1'e)"}
+GERILME_CIKTILARI = {"S1": "Asal gerilme σ1 (MPa)", "S2": "Asal gerilme σ2 (MPa)", "SVM": "von Mises gerilmesi (MPa)"}
+
+
+def rozet_coz(A, B, C, tip="dik", E=None, nu=None):
+    """
+    A, B, C gerinimlerinden (μstrain) asal gerinimleri, maksimum kayma gerinimini ve asal açıyı hesaplar.
+    Girdiler aynı şekilde diziler olabilir (ör. satır x rozet); tüm rozetler ve satırlar tek seferde çözülür.
+    E (MPa) ve nu verilirse düzlem gerilme varsayımıyla asal gerilmeler ve von Mises gerilmesi de eklenir.
+    Dönüş: {çıktı_eki: dizi} sözlüğü.
+    """
+    if tip not in ROZET_TIPLERI: raise ValueError(f"Bilinmeyen rozet tipi: '{tip}'. Seçenekler: {', '.join(ROZET_TIPLERI)}")
+    A, B, C = (np.asarray(x, dtype=float) for x in (A, B, C))
+    # Rozet okumalarını x (A ekseni) - y koordinatlarındaki εx, εy, γxy bileşenlerine dönüştür.
+    if tip == "dik":
+        ex, ey, gxy = A, C, 2 * B - A - C
+    else:
+        ex = A
+        ey = (2 * (B + C) - A) / 3
+        gxy = (2 / np.sqrt(3)) * (B - C)
+    merkez = (ex + ey) / 2
+    yaricap = np.hypot((ex - ey) / 2, gxy / 2)
+    sonuc = {
+        "E1": merkez + yaricap,
+        "E2": merkez - yaricap,
+        "GMAX": 2 * yaricap,
+        "THETA": np.degrees(0.5 * np.arctan2(gxy, ex - ey)),
+    }
+    if E is not None and nu is not None:
+        katsayi = E * 1e-6 / (1 - nu ** 2)  # μstrain -> MPa
+        s1 = katsayi * (sonuc["E1"] + nu * sonuc["E2"])
+        s2 = katsayi * (sonuc["E2"] + nu * sonuc["E1"])
+        sonuc.update({"S1": s1, "S2": s2, "SVM": np.sqrt(s1 ** 2 - s1 * s2 + s2 ** 2)})
+    return sonuc
+
+
+class RozetKanali:
+    """
+    Tek bir rozet çıktısını (ör. 'E1') türetilmiş kanal olarak tanımlar; formül motorundaki Formul ile aynı
+    arayüzü (harfler, sg_adlari, degerlendir) sunar, böylece kanal ancak ilk istendiğinde hesaplanır.
+    """
+    harfler = ["A", "B", "C"]
+    sg_adlari = []
+
+    def __init__(self, ek, tip="dik", E=None, nu=None):
+        self.ek, self.tip, self.E, self.nu = ek, tip, E, nu
+
+    def degerlendir(self, degiskenler):
+        return rozet_coz(degiskenler["A"], degiskenler["B"], degiskenler["C"], tip=self.tip, E=self.E, nu=self.nu)[self.ek]
+
+    def __eq__(self, other):
+        return isinstance(other, RozetKanali) and (self.ek, self.tip, self.E, self.nu) == (other.ek, other.tip, other.E, other.nu)
+
+    def __hash__(self):
+        return hash((self.ek, self.tip, self.E, self.nu))
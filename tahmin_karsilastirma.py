@@ -0,0 +1,139 @@
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from yuk_cevrimleri import izgaraya_tasi
+
+# Hataların hesaplandığı noktalar: ölçülen yük noktaları (tahmin enterpole edilir) veya tahmin yük noktaları (ölçüm enterpole edilir).
+IZGARALAR = ("olcum", "tahmin")
+# Tahmin dosyasında yük sütunu olarak kabul edilen adlar (ilk bulunan) ve eski tek eğrili biçimin tahmin sütunu.
+TAHMIN_YUK_KOLONLARI = ("Load", "Load_Ratio")
+TEK_EGRI_KOLONU = "Predicted_Strain"
+# Model korelasyonu geçti/kaldı bantları: |sınır yükte bağıl hata| (%) üst sınırı, en düşük korelasyon (r), RMSE üst sınırı
+# (μstrain); None olan bant uygulanmaz.
+VARSAYILAN_TOLERANSLAR = {"bagil_hata": 10.0, "korelasyon": 0.95, "rmse": None}
+
+
+class TahminVerisi:
+    """
+    Geniş tahmin dosyası: bir yük sütunu + SG başına bir tahmin sütunu. Tahminler sütun düzenli (Fortran) tek bir
+    matriste tutulur; bir SG'nin eğrisi kopyasız bir sütun görünümüdür. SG'ler önce tam adla, bulunamazsa kanal
+    ekinden önceki adla ('1001A:MON1' -> '1001A') eşleşir. Eski biçimde (sadece 'Predicted_Strain') tek eğri tüm SG'lere uyar.
+    """
+
+    def __init__(self, yuk, matris, adlar):
+        self.yuk = np.asarray(yuk, dtype=float)
+        self.matris = np.asfortranarray(matris, dtype=float)
+        self.adlar = list(adlar)
+        self.tek_egri = self.adlar == [TEK_EGRI_KOLONU]
+        self.indeks = {ad: i for i, ad in enumerate(self.adlar)}
+        kisa = {}
+        for i, ad in enumerate(self.adlar): kisa.setdefault(ad.split(":")[0], []).append(i)
+        self.kisa_indeks = {ad: i[0] for ad, i in kisa.items() if len(i) == 1}  # Belirsiz kısa adlar eşleşmez.
+
+    def __len__(self):
+        return len(self.adlar)
+
+    def sutun_no(self, sg):
+        """SG'nin tahmin sütunu numarası (tahmini yoksa None)."""
+        if self.tek_egri: return 0
+        i = self.indeks.get(sg)
+        return self.kisa_indeks.get(sg.split(":")[0]) if i is None else i
+
+    def eslesenler(self, sg_names):
+        """Tahmini olan SG'ler (sıra korunur)."""
+        return [sg for sg in sg_names if self.sutun_no(sg) is not None]
+
+    def egri(self, sg):
+        """SG'nin tahmin eğrisi (matris sütunu görünümü) veya None."""
+        i = self.sutun_no(sg)
+        return None if i is None else self.matris[:, i]
+
+    def tahminler(self, sg_names):
+        """Verilen (eşleşen) SG'lerin tahminleri, (nokta x SG)."""
+        return self.matris[:, [self.sutun_no(sg) for sg in sg_names]]
+
+
+@lru_cache(maxsize=8)
+def _tahmin_dosyasi_oku(path, _degisim, _boyut):
+    df = pd.read_csv(path, sep=r"\s+")
+    yuk_kolonu = next((k for k in TAHMIN_YUK_KOLONLARI if k in df.columns), None)
+    kolonlar = [k for k in df.select_dtypes("number").columns if k != yuk_kolonu and k not in TAHMIN_YUK_KOLONLARI]
+    if yuk_kolonu is None or not kolonlar:
+        raise ValueError(f"Tahmin dosyası bir yük sütunu ({' / '.join(TAHMIN_YUK_KOLONLARI)}) ve en az bir sayısal tahmin sütunu içermelidir.")
+    return TahminVerisi(df[yuk_kolonu].to_numpy(dtype=float), df[kolonlar].to_numpy(dtype=float), map(str, kolonlar))
+
+
+def tahmin_dosyasi_oku(path):
+    """Tahmin dosyasını TahminVerisi olarak okur; dosya değişmedikçe (yol, değişim zamanı, boyut) önbellekten döner."""
+    bilgi = os.stat(path)
+    return _tahmin_dosyasi_oku(os.path.abspath(path), bilgi.st_mtime_ns, bilgi.st_size)
+
+
+def karsilastirma_olculeri(olcum_yuku, olcumler, tahmin_yuku, tahminler, sinir_yuk=None, izgara="olcum"):
+    """
+    Ölçüm (satır x kanal) ve tahmin (nokta x kanal) eğrilerini ortak yük aralığında karşılaştırır; tüm kanallar
+    aynı enterpolasyon indeksi/ağırlıklarıyla tek seferde işlenir. izgara='olcum' ise tahmin ölçülen yük
+    noktalarına, 'tahmin' ise ölçüm tahmin yük noktalarına enterpole edilir; ortak aralık dışındaki noktalar
+    atlanır. sinir_yuk (varsayılan: en yüksek ortak yük) noktasında iki eğri de enterpole edilip bağıl hata verilir.
+    Dönüş: {ölçü: kanal başına dizi}; hata = ölçüm - tahmin, korelasyon = ortak noktalarda Pearson r.
+    """
+    if izgara not in IZGARALAR: raise ValueError(f"Bilinmeyen ızgara: '{izgara}'. Seçenekler: {', '.join(IZGARALAR)}")
+    olcum_yuku, tahmin_yuku = np.asarray(olcum_yuku, dtype=float), np.asarray(tahmin_yuku, dtype=float)
+    alt, ust = max(olcum_yuku.min(), tahmin_yuku.min()), min(olcum_yuku.max(), tahmin_yuku.max())
+    if not ust > alt: raise ValueError("Ölçüm ve tahmin verilerinin ortak yük aralığı yok.")
+    if izgara == "olcum":
+        icerde = (olcum_yuku >= alt) & (olcum_yuku <= ust)
+        noktalar = olcum_yuku[icerde]
+        olcum, tahmin = olcumler[icerde], izgaraya_tasi(tahmin_yuku, tahminler, noktalar)
+    else:
+        icerde = (tahmin_yuku >= alt) & (tahmin_yuku <= ust)
+        noktalar = tahmin_yuku[icerde]
+        olcum, tahmin = izgaraya_tasi(olcum_yuku, olcumler, noktalar), tahminler[icerde]
+    hata = olcum - tahmin
+    olcum, tahmin = olcum - olcum.mean(axis=0), tahmin - tahmin.mean(axis=0)
+    payda = np.sqrt(np.einsum("ij,ij->j", olcum, olcum) * np.einsum("ij,ij->j", tahmin, tahmin))
+    sinir_yuk = ust if sinir_yuk is None else float(np.clip(sinir_yuk, alt, ust))
+    sinirda_olcum = izgaraya_tasi(olcum_yuku, olcumler, np.array([sinir_yuk]))[0]
+    sinirda_tahmin = izgaraya_tasi(tahmin_yuku, tahminler, np.array([sinir_yuk]))[0]
+    en_buyuk = np.argmax(np.abs(hata), axis=0)
+    return {"rmse": np.sqrt(np.mean(hata ** 2, axis=0)), "maks_hata": hata[en_buyuk, np.arange(hata.shape[1])], "maks_hata_yuku": noktalar[en_buyuk],
+            "ortalama_hata": hata.mean(axis=0),
+            "korelasyon": np.divide(np.einsum("ij,ij->j", olcum, tahmin), payda, out=np.full(len(payda), np.nan), where=payda > 0), "sinir_yuk": sinir_yuk, "sinirda_olcum": sinirda_olcum, "sinirda_tahmin": sinirda_tahmin,
+            "sinirda_bagil_hata": 100 * np.divide(sinirda_olcum - sinirda_tahmin, np.abs(sinirda_tahmin),
+                                                  out=np.full(len(sinirda_tahmin), np.nan), where=sinirda_tahmin != 0),
+            "nokta_sayisi": len(noktalar)}
+
+
+def karsilastirma_tablosu(sg_names, olculer):
+    """karsilastirma_olculeri sonucunu SG başına bir satırlık tabloya çevirir (RMSE'ye göre azalan)."""
+    return pd.DataFrame({"SG": list(sg_names), "RMSE (μstrain)": olculer["rmse"], "Maks. Hata (μstrain)": olculer["maks_hata"],
+                         "Maks. Hata Yükü": olculer["maks_hata_yuku"], "Ort. Hata (μstrain)": olculer["ortalama_hata"],
+                         "Korelasyon (r)": olculer["korelasyon"],
+                         "Sınır Yük": olculer["sinir_yuk"], "Sınırda Ölçüm (μstrain)": olculer["sinirda_olcum"],
+                         "Sınırda Tahmin (μstrain)": olculer["sinirda_tahmin"], "Sınırda Bağıl Hata (%)": olculer["sinirda_bagil_hata"],
+                         "Nokta Sayısı": olculer["nokta_sayisi"]}).sort_values("RMSE (μstrain)", ascending=False, ignore_index=True)
+
+
+def tolerans_degerlendir(tablo, bagil_hata=VARSAYILAN_TOLERANSLAR["bagil_hata"], korelasyon=VARSAYILAN_TOLERANSLAR["korelasyon"],
+                         rmse=VARSAYILAN_TOLERANSLAR["rmse"]):
+    """
+    karsilastirma_tablosu satırlarına 'Sonuç' (GEÇTİ/KALDI) ve aşılan bantları listeleyen 'Aşılan Bantlar' sütunlarını
+    ekler. NaN ölçü (ör. sıfır tahminde bağıl hata) o bandı geçemez.
+    """
+    bantlar = []
+    if bagil_hata is not None: bantlar.append((f"|bağıl hata| > {bagil_hata:g}%", ~(tablo["Sınırda Bağıl Hata (%)"].abs() <= bagil_hata)))
+    if korelasyon is not None: bantlar.append((f"r < {korelasyon:g}", ~(tablo["Korelasyon (r)"] >= korelasyon)))
+    if rmse is not None: bantlar.append((f"RMSE > {rmse:g}", ~(tablo["RMSE (μstrain)"] <= rmse)))
+    asilan = np.column_stack([maske.to_numpy() for _, maske in bantlar]) if bantlar else np.zeros((len(tablo), 0), dtype=bool)
+    tablo = tablo.copy()
+    tablo["Sonuç"] = np.where(asilan.any(axis=1), "KALDI", "GEÇTİ")
+    tablo["Aşılan Bantlar"] = [", ".join(ad for (ad, _), asti in zip(bantlar, satir) if asti) for satir in asilan]
+    return tablo
+
+
+def korelasyon_matrisi(sonuclar, olcu="Korelasyon (r)"):
+    """Uzun biçimli (ID, SG, ölçüler) toplu sonuçtan SG x ID matrisi; tahmini/ölçümü olmayan hücreler NaN."""
+    return sonuclar.pivot_table(index="SG", columns="ID", values=olcu, aggfunc="first").sort_index()
@@ -0,0 +1,296 @@
+##########################################################
+# Tk gerektirmeyen komut satırı toplu işleyici. Arayüzdeki yükleme, gruplama, hesaplama,
+# kesme ve dışa aktarma adımlarını aynı çekirdek fonksiyonlarla, her dosya için ayrı bir
+# süreçte çalıştırır. Örnek:
+#   python toplu_analiz.py /veri/yeni_testler -o /raporlar --hesaplama hepsi --rozet dik -j 4
+#   python toplu_analiz.py "/veri/TEST_*_RESULTS.dat" -o /raporlar --sadece-yukleme --grafik
+#   python toplu_analiz.py /veri/dayanim -o /raporlar --hesaplama hepsi --rainflow --parca-satir 1000000
+#   python toplu_analiz.py /veri/statik -o /raporlar --tahmin /fe/tahminler --sadece-yukleme --tolerans-bagil-hata 15
+##########################################################
+import argparse
+import glob
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from analiz_cekirdegi import (CSV_SIKISTIRMA_UZANTILARI, GRUPLAMA_KURALLARI_DOSYASI, VERI_BICIMLERI, AnalizOturumu, dosya_kimligi,
+                              GRAFIK_BICIMLERI, excel_kitabi_yaz, grafik_resmi_olustur, isi_haritasi_olustur,
+                              kullanici_hesaplamalarini_yukle, varsayilan_hesaplamalar)
+from gruplama_kurallari import GruplamaKurallari
+from rozet_analizi import ROZET_TIPLERI
+from tahmin_karsilastirma import VARSAYILAN_TOLERANSLAR, korelasyon_matrisi, tahmin_dosyasi_oku, tolerans_degerlendir
+from yorulma_analizi import VARSAYILAN_SN_EGIMI, histogram_tablosu, ozet_tablosu
+from yuk_cevrimleri import KOLLAR
+
+
+def girdi_dosyalarini_bul(girdiler):
+    """Klasörler, glob desenleri ve tek tek dosyalardan sıralı, tekrarsız bir .dat listesi çıkarır."""
+    dosyalar = []
+    for girdi in girdiler:
+        if os.path.isdir(girdi): dosyalar.extend(os.path.join(girdi, f) for f in os.listdir(girdi) if f.endswith(".dat"))
+        else: dosyalar.extend(glob.glob(girdi))
+    return sorted(dict.fromkeys(os.path.abspath(f) for f in dosyalar))
+
+
+def tahmin_dosyasi_bul(tahmin, file_id):
+    """tahmin bir dosyaysa tüm ID'ler için odur; klasörse ID'si (dosya_kimligi) file_id olan ilk .dat (ör. TAHMIN_<ID>_FE.dat), yoksa None."""
+    if not os.path.isdir(tahmin): return tahmin
+    return next((os.path.join(tahmin, f) for f in sorted(os.listdir(tahmin)) if f.endswith(".dat") and dosya_kimligi(f) == file_id), None)
+
+
+def varsayilan_ayarlar(**degisiklikler):
+    """dosyayi_isle/toplu_isle için tam ayar sözlüğü; komut satırı dışındaki çağıranlar sadece değişenleri verir."""
+    ayarlar = {"cikti_klasoru": ".", "hesaplamalar": [], "rozet": None, "E": None, "nu": None, "sg": [], "sadece_yukleme": False,
+               "cevrim": None, "kol": None, "nokta_sayisi": None, "grafik": False, "grafik_sg_sayisi": 10,
+               "kural_dosyasi": GRUPLAMA_KURALLARI_DOSYASI, "bicim": "xlsx", "sikistirma": None, "tek_kitap": None, "grafik_dosyasi": None,
+               "rainflow": False, "sn_egimi": VARSAYILAN_SN_EGIMI, "parca_satir": None, "histerezis": False,
+               "dogrusallik": False, "tahmin": None, "toleranslar": dict(VARSAYILAN_TOLERANSLAR)}
+    ayarlar.update(degisiklikler)
+    return ayarlar
+
+
+def dosyayi_isle(filepath, ayarlar):
+    """
+    Tek bir .dat dosyasını arayüzdeki adımlarla işler ve raporunu yazar. Alt süreçte çalıştığı için
+    sadece seçilebilir (picklable) girdiler alır ve bir özet sözlüğü (aşama süreleri dahil) döner.
+    ayarlar['tek_kitap'] verilmişse dosya yazılmaz; veri ve grafik, ana süreçte tek kitaba yazılmak üzere özete eklenir.
+    ayarlar['parca_satir'] verilmişse (bellekten büyük dosyalar) veri belleğe alınmaz: sadece başlık okunur, rainflow
+    sayımı dosyadan parça parça yapılır ve normal rapor yazılmaz.
+    ayarlar['tahmin'] verilmişse (model korelasyonu) rapor yazılmaz; tahmini olan SG'lerin karşılaştırma ve geçti/kaldı
+    tablosu, ana süreçte tek korelasyon raporunda birleştirilmek üzere özete eklenir.
+    """
+    baslangic = time.perf_counter()
+    file_id = dosya_kimligi(filepath) or os.path.splitext(os.path.basename(filepath))[0]
+    kurallar = GruplamaKurallari.dosyadan(ayarlar["kural_dosyasi"])
+    oturum = AnalizOturumu.basliktan(filepath, kurallar) if ayarlar["parca_satir"] else AnalizOturumu.dosyadan(filepath, kurallar)
+    if not oturum.yuk_kolonu: raise ValueError("Yük verisi sütunu (Load_Ratio) bulunamadı.")
+
+    tum_hesaplamalar = {**varsayilan_hesaplamalar(), **kullanici_hesaplamalarini_yukle()}
+    secili = tum_hesaplamalar if "hepsi" in ayarlar["hesaplamalar"] else {ad: tum_hesaplamalar[ad] for ad in ayarlar["hesaplamalar"]}
+    if secili: oturum.hesaplamalari_uygula(secili)
+    if ayarlar["rozet"]: oturum.rozet_analizi(ayarlar["rozet"], ayarlar["E"], ayarlar["nu"])
+
+    sg_listesi = ayarlar["sg"] or oturum.sg_listesi()
+    eksik = [sg for sg in sg_listesi if not oturum.var_mi(sg)]
+    if eksik: print(f"Uyarı [{file_id}]: Bulunamayan SG'ler atlandı: {', '.join(eksik)}")
+    sg_listesi = [sg for sg in sg_listesi if sg not in eksik]
+
+    ozet = {"id": file_id, "cikti": None, "sutun": len(sg_listesi) + 1, "boyut": os.path.getsize(filepath)}
+    # Satır seçimi: kesme, yük çevrimi/kolu (dosyanın çevrim indeksinden) ve seyreltme.
+    secim = {anahtar: ayarlar[anahtar] for anahtar in ("sadece_yukleme", "cevrim", "kol", "nokta_sayisi")}
+    if ayarlar["rainflow"]:
+        # Seyreltme çevrimleri bozacağından rainflow sayımında nokta_sayisi kullanılmaz.
+        sonuclar = oturum.rainflow_say(sg_listesi, ayarlar["parca_satir"], **{k: v for k, v in secim.items() if k != "nokta_sayisi"})
+        rainflow_yolu = os.path.join(ayarlar["cikti_klasoru"], f"Rainflow_{file_id}.xlsx")
+        with oturum.sure_olc("rainflow_yaz"):
+            excel_kitabi_yaz(rainflow_yolu, [("Ozet", ozet_tablosu(sonuclar, ayarlar["sn_egimi"]), None), ("Histogram", histogram_tablosu(sonuclar), None)])
+        if ayarlar["parca_satir"]:
+            ozet.update(cikti=rainflow_yolu, satir=next(iter(sonuclar.values()))["ornek"] if sonuclar else 0)
+            return {**ozet, "sure": time.perf_counter() - baslangic, "asamalar": dict(oturum.sureler)}
+    if ayarlar["tahmin"]:
+        tahmin_yolu, tablo = tahmin_dosyasi_bul(ayarlar["tahmin"], file_id), None
+        if tahmin_yolu is None: print(f"Uyarı [{file_id}]: Tahmin dosyası bulunamadı, korelasyon atlandı.")
+        else:
+            tahmin = tahmin_dosyasi_oku(tahmin_yolu)
+            eslesen = tahmin.eslesenler(sg_listesi)
+            if not eslesen: print(f"Uyarı [{file_id}]: Tahmini olan SG yok, korelasyon atlandı.")
+            else:
+                # Seyreltme hataları değiştireceğinden karşılaştırma her zaman tam çözünürlükte yapılır.
+                tablo = oturum.tahmin_karsilastir(eslesen, tahmin.yuk, tahmin.tahminler(eslesen), **{k: v for k, v in secim.items() if k != "nokta_sayisi"})
+                tablo = tolerans_degerlendir(tablo, **ayarlar["toleranslar"])
+        ozet.update(korelasyon=tablo, satir=len(oturum.goruntu(**secim)), karsilastirilan=0 if tablo is None else len(tablo),
+                    gecen=0 if tablo is None else int((tablo["Sonuç"] == "GEÇTİ").sum()))
+        return {**ozet, "sure": time.perf_counter() - baslangic, "asamalar": dict(oturum.sureler)}
+    baslik = f"Yük Oranına Karşı Strain ({file_id})" if ayarlar["grafik"] else None
+    if ayarlar["histerezis"]:
+        # Seçili çevrimin (yoksa en yüksek tepenin) kolları; --sg verilmemişse tüm fiziksel SG'ler.
+        tablo = oturum.histerezis(sg_listesi if ayarlar["sg"] else None, ayarlar["cevrim"])
+        excel_kitabi_yaz(os.path.join(ayarlar["cikti_klasoru"], f"Histerezis_{file_id}.xlsx"), [("Histerezis", tablo, None)])
+    if ayarlar["dogrusallik"]:
+        tablo = oturum.dogrusallik(sg_listesi if ayarlar["sg"] else None, ayarlar["cevrim"])
+        excel_kitabi_yaz(os.path.join(ayarlar["cikti_klasoru"], f"Dogrusallik_{file_id}.xlsx"), [("Dogrusallik", tablo, None)])
+    if ayarlar["tek_kitap"]:
+        with oturum.sure_olc("rapor_hazirla"):
+            export_df, grafik = oturum.rapor_hazirla(sg_listesi, grafik_basligi=baslik, grafik_sg_sayisi=ayarlar["grafik_sg_sayisi"], **secim)
+        ozet.update(veri=export_df, grafik=grafik.getvalue() if grafik else None, satir=len(export_df))
+        return {**ozet, "sure": time.perf_counter() - baslangic, "asamalar": dict(oturum.sureler)}
+
+    dosya_adi = f"Analiz_Raporu_{file_id}.{ayarlar['bicim']}"
+    if ayarlar["bicim"] == "csv" and ayarlar["sikistirma"] not in (None, "none"):
+        dosya_adi += next(uzanti for uzanti, ad in CSV_SIKISTIRMA_UZANTILARI.items() if ad == ayarlar["sikistirma"])
+    cikti_yolu = os.path.join(ayarlar["cikti_klasoru"], dosya_adi)
+    if ayarlar["bicim"] == "xlsx":
+        oturum.excele_aktar(cikti_yolu, sg_listesi, grafik_basligi=baslik, grafik_sg_sayisi=ayarlar["grafik_sg_sayisi"], **secim)
+    else:
+        oturum.veri_disa_aktar(cikti_yolu, sg_listesi, ayarlar["sikistirma"], **secim)
+    if ayarlar["grafik_dosyasi"]:
+        # Ayrı grafik dosyası (ör. vektörel SVG/PDF); rapordaki grafikle aynı havuz figürüyle çizilir.
+        with oturum.sure_olc("grafik_dosyasi"):
+            export_df = oturum.veri([oturum.yuk_kolonu] + sg_listesi, **secim)
+            grafik = grafik_resmi_olustur(export_df, oturum.yuk_kolonu, sg_listesi[:ayarlar["grafik_sg_sayisi"]],
+                                          f"Yük Oranına Karşı Strain ({file_id})", bicim=ayarlar["grafik_dosyasi"])
+            if grafik:
+                with open(os.path.join(ayarlar["cikti_klasoru"], f"Analiz_Grafigi_{file_id}.{ayarlar['grafik_dosyasi']}"), "wb") as f: f.write(grafik.getvalue())
+    ozet.update(cikti=cikti_yolu, satir=len(oturum.goruntu(**secim)))
+    return {**ozet, "sure": time.perf_counter() - baslangic, "asamalar": dict(oturum.sureler)}
+
+
+def toplu_isle(dosyalar, ayarlar, is_sayisi, bildir=None, mp_context=None):
+    """
+    Dosyaları süreç havuzunda işler (grafikler alt süreçlerde pyplot/Tk olmadan Agg ile çizilir). Her dosya bitince
+    bildir(dosya, özet, hata) çağrılır. ayarlar['tek_kitap'] verilmişse tüm ID'ler sonunda o çalışma kitabına
+    ID başına bir sayfa olarak yazılır. Dönüş: (özetler, {dosya: hata}, verim_metrikleri).
+    """
+    baslangic, ozetler, hatalar = time.perf_counter(), [], {}
+    with ProcessPoolExecutor(max_workers=max(1, is_sayisi), mp_context=mp_context) as havuz:
+        isler = {havuz.submit(dosyayi_isle, dosya, ayarlar): dosya for dosya in dosyalar}
+        for is_ in as_completed(isler):
+            dosya, ozet, hata = isler[is_], None, None
+            try: ozet = is_.result(); ozetler.append(ozet)
+            except Exception as e: hata = hatalar[dosya] = e
+            if bildir: bildir(dosya, ozet, hata)
+    if ayarlar["tek_kitap"] and ozetler:
+        ozetler.sort(key=lambda ozet: ozet["id"])
+        sayfalar = []
+        for ozet in ozetler:
+            grafik = ozet.pop("grafik")
+            sayfalar.append((ozet["id"][:31], ozet.pop("veri"), io.BytesIO(grafik) if grafik else None))
+            ozet["cikti"] = ayarlar["tek_kitap"]
+        excel_kitabi_yaz(ayarlar["tek_kitap"], sayfalar)
+    if ayarlar["tahmin"] and ozetler:
+        yol = korelasyon_raporu_yaz(os.path.join(ayarlar["cikti_klasoru"], "Korelasyon_Raporu.xlsx"), ozetler)
+        for ozet in ozetler: ozet["cikti"] = yol
+    return ozetler, hatalar, verim_metrikleri(ozetler, time.perf_counter() - baslangic)
+
+
+def korelasyon_raporu_yaz(filepath, ozetler):
+    """
+    Model korelasyonu özetlerini tek çalışma kitabına yazar: ID başına geçti/kaldı özeti, tüm (ID, SG) sonuçları
+    (önce kalanlar), SG x ID korelasyon matrisi (ısı haritasıyla) ve sınır yükte bağıl hata matrisi. Karşılaştırılacak
+    SG olmayan ID'ler atlanır; hiç sonuç yoksa dosya yazılmaz ve None döner.
+    """
+    tablolar = [ozet.pop("korelasyon").assign(ID=ozet["id"]) for ozet in ozetler if ozet.get("korelasyon") is not None]
+    for ozet in ozetler: ozet.pop("korelasyon", None)
+    if not tablolar: return None
+    sonuclar = pd.concat(tablolar, ignore_index=True)
+    sonuclar = sonuclar[["ID"] + [k for k in sonuclar.columns if k != "ID"]].sort_values(["Sonuç", "ID", "RMSE (μstrain)"], ascending=[False, True, False],
+                                                                                         ignore_index=True)
+    gruplar = sonuclar.groupby("ID")
+    id_ozeti = pd.DataFrame({"SG Sayısı": gruplar.size(), "Geçen": gruplar["Sonuç"].apply(lambda s: int((s == "GEÇTİ").sum())),
+                                 "Min. r": gruplar["Korelasyon (r)"].min(), "Maks. |Bağıl Hata| (%)": gruplar["Sınırda Bağıl Hata (%)"].apply(lambda s: s.abs().max()),
+                                 "Maks. RMSE (μstrain)": gruplar["RMSE (μstrain)"].max()}).reset_index()
+    id_ozeti.insert(3, "Kalan", id_ozeti["SG Sayısı"] - id_ozeti["Geçen"])
+    korelasyon = korelasyon_matrisi(sonuclar)
+    harita = isi_haritasi_olustur(korelasyon, "Model Korelasyonu (Pearson r)", "r", vmax=1.0)
+    excel_kitabi_yaz(filepath, [("Ozet", id_ozeti, None), ("Sonuclar", sonuclar, None), ("Korelasyon", korelasyon.reset_index(), harita),
+                                ("Bagil_Hata", korelasyon_matrisi(sonuclar, "Sınırda Bağıl Hata (%)").reset_index(), None)])
+    return filepath
+
+
+def verim_metrikleri(ozetler, toplam_sure):
+    """Toplu işlemin verimi: dosya/s, satır/s, girdi MB/s ve aşama başına (tüm süreçlerde) toplam süre."""
+    asamalar = {}
+    for ozet in ozetler:
+        for asama, sure in ozet["asamalar"].items(): asamalar[asama] = asamalar.get(asama, 0.0) + sure
+    toplam_sure = max(toplam_sure, 1e-9)
+    return {"dosya": len(ozetler), "sure": toplam_sure, "dosya_hizi": len(ozetler) / toplam_sure,
+            "satir_hizi": sum(ozet["satir"] for ozet in ozetler) / toplam_sure,
+            "mb_hizi": sum(ozet["boyut"] for ozet in ozetler) / 1e6 / toplam_sure, "asamalar": asamalar}
+
+
+def metrik_metni(metrikler):
+    asamalar = ", ".join(f"{asama}: {sure:.2f} s" for asama, sure in metrikler["asamalar"].items())
+    return (f"{metrikler['dosya']} dosya, {metrikler['sure']:.1f} s | {metrikler['dosya_hizi']:.2f} dosya/s, "
+            f"{metrikler['satir_hizi']:,.0f} satır/s, {metrikler['mb_hizi']:.1f} MB/s\nAşama toplamları: {asamalar}")
+
+
+def arguman_ayristirici():
+    parser = argparse.ArgumentParser(description="Strain gauge .dat dosyalarını arayüz olmadan toplu olarak işler ve rapor üretir.")
+    parser.add_argument("girdiler", nargs="+", help="Klasör, glob deseni (ör. 'veri/TEST_*.dat') veya .dat dosyaları")
+    parser.add_argument("-o", "--cikti-klasoru", required=True, help="Raporların yazılacağı klasör")
+    parser.add_argument("--hesaplama", action="append", default=[], dest="hesaplamalar",
+                        help="Uygulanacak hesaplamanın adı (birden çok kez verilebilir; 'hepsi' tümünü uygular)")
+    parser.add_argument("--rozet", choices=list(ROZET_TIPLERI), help="Rozet analizi (asal gerinim/gerilme) için rozet tipi")
+    parser.add_argument("--E", type=float, help="Rozet gerilmeleri için elastisite modülü (MPa)")
+    parser.add_argument("--nu", type=float, default=0.33, help="Rozet gerilmeleri için Poisson oranı (varsayılan: 0.33)")
+    parser.add_argument("--bicim", choices=["xlsx"] + [uzanti[1:] for uzanti in VERI_BICIMLERI], default="xlsx",
+                        help="Çıktı biçimi (varsayılan: xlsx; diğerleri sadece veri yazar)")
+    parser.add_argument("--sikistirma", help="Parquet/Feather/HDF5/CSV sıkıştırması (ör. zstd, lz4, gzip; varsayılan: biçimin varsayılanı)")
+    parser.add_argument("--sg", action="append", default=[], help="Rapora alınacak SG (birden çok kez verilebilir; varsayılan: tümü)")
+    parser.add_argument("--sadece-yukleme", action="store_true", help="Veriyi maksimum yüke kadar kes (--cevrim ile: o çevrimin yükleme kolu)")
+    parser.add_argument("--cevrim", type=int, help="Sadece bu yük çevrimini raporla (1 tabanlı; çevrimler dosya başına bir kez bulunur)")
+    parser.add_argument("--kol", choices=KOLLAR, help="Sadece yükleme veya boşaltma kolu (--cevrim yoksa en yüksek tepeye göre)")
+    parser.add_argument("--tek-kitap", metavar="DOSYA", help="Tüm ID'leri tek bir Excel çalışma kitabına (ID başına bir sayfa) yaz")
+    parser.add_argument("--nokta-sayisi", type=int, help="Raporu SG başına en fazla N noktaya seyrelt (eşit aralıklı)")
+    parser.add_argument("--grafik", action="store_true", help="Rapora yük-strain grafiği ekle")
+    parser.add_argument("--grafik-dosyasi", choices=GRAFIK_BICIMLERI, help="Her ID için ayrı bir grafik dosyası da yaz (svg/pdf vektöreldir)")
+    parser.add_argument("--grafik-sg-sayisi", type=int, default=10, help="Grafiğe çizilecek en fazla SG sayısı (varsayılan: 10)")
+    parser.add_argument("--rainflow", action="store_true", help="Her ID için SG'lerin rainflow çevrim sayımı ve hasar toplamını da yaz (Rainflow_<ID>.xlsx)")
+    parser.add_argument("--sn-egimi", type=float, default=VARSAYILAN_SN_EGIMI, help=f"Hasar toplamı için S-N eğimi m (varsayılan: {VARSAYILAN_SN_EGIMI:g})")
+    parser.add_argument("--parca-satir", type=int, help="Bellekten büyük dosyalar: rainflow'u N satırlık parçalarla akışla say (normal rapor yazılmaz)")
+    parser.add_argument("--histerezis", action="store_true", help="Her ID için SG'lerin histerezis/kalıcı gerinim tablosunu da yaz (Histerezis_<ID>.xlsx)")
+    parser.add_argument("--dogrusallik", action="store_true", help="Her ID için yükleme kolunda SG eğim/R²/sapma sıralamasını da yaz (Dogrusallik_<ID>.xlsx)")
+    parser.add_argument("--tahmin", metavar="YOL", help="Model korelasyonu: tüm ID'ler için tek tahmin dosyası veya ID başına tahmin dosyaları "
+                                                        "(ör. TAHMIN_<ID>_FE.dat) içeren klasör; normal rapor yerine Korelasyon_Raporu.xlsx yazılır")
+    parser.add_argument("--tolerans-bagil-hata", type=float, default=VARSAYILAN_TOLERANSLAR["bagil_hata"],
+                        help=f"Geçti/kaldı: sınır yükte izin verilen |bağıl hata| %% (varsayılan: {VARSAYILAN_TOLERANSLAR['bagil_hata']:g})")
+    parser.add_argument("--tolerans-korelasyon", type=float, default=VARSAYILAN_TOLERANSLAR["korelasyon"],
+                        help=f"Geçti/kaldı: en düşük korelasyon r (varsayılan: {VARSAYILAN_TOLERANSLAR['korelasyon']:g})")
+    parser.add_argument("--tolerans-rmse", type=float, default=VARSAYILAN_TOLERANSLAR["rmse"], help="Geçti/kaldı: en büyük RMSE, μstrain (varsayılan: uygulanmaz)")
+    parser.add_argument("--kurallar", default=GRUPLAMA_KURALLARI_DOSYASI, help="Gruplama kuralları JSON dosyası")
+    parser.add_argument("-j", "--is-sayisi", type=int, default=os.cpu_count() or 1, help="Paralel işlenecek dosya sayısı")
+    parser.add_argument("--sureler", action="store_true", help="Her dosya için aşama sürelerini (yükle, grupla, hesapla, dışa aktar) yaz")
+    return parser
+
+
+def main(argv=None):
+    args = arguman_ayristirici().parse_args(argv)
+    dosyalar = girdi_dosyalarini_bul(args.girdiler)
+    if not dosyalar: print("Hata: İşlenecek .dat dosyası bulunamadı.", file=sys.stderr); return 2
+    bilinen = {**varsayilan_hesaplamalar(), **kullanici_hesaplamalarini_yukle()}
+    bilinmeyen = [ad for ad in args.hesaplamalar if ad != "hepsi" and ad not in bilinen]
+    if bilinmeyen:
+        print(f"Hata: Bilinmeyen hesaplama(lar): {', '.join(bilinmeyen)}. Seçenekler: {', '.join(bilinen)}", file=sys.stderr); return 2
+    if args.tek_kitap and args.bicim != "xlsx": print("Hata: --tek-kitap sadece xlsx biçimiyle kullanılabilir.", file=sys.stderr); return 2
+    if args.parca_satir and (not args.rainflow or args.tek_kitap):
+        print("Hata: --parca-satir sadece --rainflow ile ve --tek-kitap olmadan kullanılabilir.", file=sys.stderr); return 2
+    if args.tahmin and (args.tek_kitap or args.parca_satir):
+        print("Hata: --tahmin, --tek-kitap ve --parca-satir ile birlikte kullanılamaz.", file=sys.stderr); return 2
+    if args.tahmin and not os.path.exists(args.tahmin): print(f"Hata: Tahmin yolu bulunamadı: {args.tahmin}", file=sys.stderr); return 2
+    os.makedirs(args.cikti_klasoru, exist_ok=True)
+    if args.sikistirma and args.bicim != "xlsx" and args.sikistirma not in VERI_BICIMLERI[f".{args.bicim}"][1]:
+        print(f"Hata: {args.bicim} için geçersiz sıkıştırma: {args.sikistirma}. Seçenekler: {', '.join(VERI_BICIMLERI[f'.{args.bicim}'][1])}",
+              file=sys.stderr); return 2
+    tek_kitap = os.path.join(args.cikti_klasoru, args.tek_kitap) if args.tek_kitap else None
+    ayarlar = varsayilan_ayarlar(cikti_klasoru=args.cikti_klasoru, hesaplamalar=args.hesaplamalar, rozet=args.rozet, E=args.E,
+                                 nu=args.nu if args.E else None, sg=args.sg, sadece_yukleme=args.sadece_yukleme,
+                                 cevrim=args.cevrim - 1 if args.cevrim else None, kol=args.kol,
+                                 nokta_sayisi=args.nokta_sayisi, grafik=args.grafik, grafik_sg_sayisi=args.grafik_sg_sayisi,
+                                 kural_dosyasi=args.kurallar, bicim=args.bicim, sikistirma=args.sikistirma, tek_kitap=tek_kitap,
+                                 grafik_dosyasi=args.grafik_dosyasi, rainflow=args.rainflow, sn_egimi=args.sn_egimi,
+                                 parca_satir=args.parca_satir, histerezis=args.histerezis,
+                                 dogrusallik=args.dogrusallik, tahmin=args.tahmin,
+                                 toleranslar={"bagil_hata": args.tolerans_bagil_hata, "korelasyon": args.tolerans_korelasyon, "rmse": args.tolerans_rmse})
+
+    def bildir(dosya, ozet, hata):
+        if hata: print(f"  [HATA] {os.path.basename(dosya)}: {hata}", file=sys.stderr); return
+        if args.tahmin:
+            print(f"  [OK]   {ozet['id']}: {ozet['gecen']}/{ozet['karsilastirilan']} SG toleransta ({ozet['sure']:.1f} s)"); return
+        print(f"  [OK]   {ozet['id']}: {ozet['satir']} satır x {ozet['sutun']} sütun -> {ozet['cikti'] or '(tek kitap)'} ({ozet['sure']:.1f} s)")
+        if args.sureler: print("         " + ", ".join(f"{asama}: {sure * 1000:.0f} ms" for asama, sure in ozet["asamalar"].items()))
+
+    print(f"{len(dosyalar)} dosya işlenecek ({args.is_sayisi} paralel iş)...")
+    ozetler, hatalar, metrikler = toplu_isle(dosyalar, ayarlar, args.is_sayisi, bildir)
+    if tek_kitap and ozetler: print(f"Tek çalışma kitabı yazıldı: {tek_kitap}")
+    if args.tahmin and ozetler: print(f"Korelasyon raporu yazıldı: {ozetler[0]['cikti']}" if ozetler[0]["cikti"] else "Uyarı: Karşılaştırılacak SG bulunamadı, korelasyon raporu yazılmadı.")
+    print(f"Tamamlandı: {len(ozetler)} başarılı, {len(hatalar)} hatalı.")
+    print(metrik_metni(metrikler))
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
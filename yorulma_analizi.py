@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+
+# Hasar için varsayılan S-N (Basquin) eğimi; referans verilmezse hasar göreli (sözde) hasardır: Σ n·Δε^m.
+VARSAYILAN_SN_EGIMI = 5.0
+# Bir vektörel geçiş kalan noktaların bu oranından azını çıkarırsa (iç içe daralan diziler) sıralı yığına geçilir.
+MIN_GECIS_VERIMI = 0.01
+
+
+def donus_noktalari(x):
+    """Sinyalin dönüş noktaları (yerel tepe/çukurlar + ilk ve son örnek); düzlükler ve ara noktalar vektörel olarak atılır."""
+    x = np.asarray(x, dtype=float)
+    if len(x) < 3: return x.copy()
+    fark = np.diff(x)
+    hareket = np.flatnonzero(fark)
+    if not len(hareket): return x[:1].copy()
+    yon = np.sign(fark[hareket])
+    uclar = hareket[np.flatnonzero(yon[1:] != yon[:-1])] + 1
+    return x[np.concatenate(([0], uclar, [len(x) - 1]))]
+
+
+def _dort_nokta_vektorel(r, araliklar, ortalamalar):
+    """
+    Dört nokta yöntemi: iç aralığı (r1-r2) iki komşu aralığından büyük olmayan her çift kapalı bir çevrimdir ve
+    çıkarılır. Her geçişte pencereleri çakışmayan tüm çiftler birlikte çıkarılır (NumPy içinde, GIL bırakılır).
+    Çevrimler listelere eklenir; dönüş: (artık dizi, geçiş verimi düştüğü için sıralı yığın gerekiyor mu).
+    """
+    while len(r) >= 4:
+        d = np.abs(np.diff(r))
+        aday = (d[1:-1] <= d[:-2]) & (d[1:-1] <= d[2:])
+        secim = aday.copy(); secim[1:] &= ~aday[:-1]; secim[2:] &= ~aday[:-2]
+        i = np.flatnonzero(secim)
+        if not len(i): return r, False
+        a, b = r[i + 1], r[i + 2]
+        araliklar.append(np.abs(a - b)); ortalamalar.append((a + b) / 2)
+        tut = np.ones(len(r), dtype=bool); tut[i + 1] = False; tut[i + 2] = False
+        r = r[tut]
+        if 2 * len(i) < MIN_GECIS_VERIMI * len(r): return r, True
+    return r, False
+
+
+def _dort_nokta_sirali(r, araliklar, ortalamalar):
+    """Kalan diziyi sıralı yığınla işler (sonuç sıraya bağlı değildir); saf Python olduğundan GIL'i tutar. Dönüş: artık dizi."""
+    yigin, sirali_aralik, sirali_ortalama = [], [], []
+    for deger in r.tolist():
+        yigin.append(deger)
+        while len(yigin) >= 4 and abs(yigin[-3] - yigin[-2]) <= abs(yigin[-4] - yigin[-3]) and abs(yigin[-3] - yigin[-2]) <= abs(yigin[-2] - yigin[-1]):
+            sirali_aralik.append(abs(yigin[-3] - yigin[-2])); sirali_ortalama.append((yigin[-3] + yigin[-2]) / 2)
+            del yigin[-3:-1]
+    if sirali_aralik: araliklar.append(np.array(sirali_aralik)); ortalamalar.append(np.array(sirali_ortalama))
+    return np.array(yigin)
+
+
+class RainflowSayaci:
+    """
+    Parça parça (akış halinde) rainflow çevrim sayımı. Parçalar arasında sadece artık (henüz kapanmamış dönüş
+    noktaları) taşınır, böylece bellekten büyük dosyalar tek parça ile aynı sonucu verir. Kapalı çevrimler tam,
+    sonda kalan artık aralıklar yarım çevrim sayılır. ekle = ekle_vektorel + tamamla; ikisi ayrı çağrılarak
+    vektörel kısım birden çok kanal için iş parçacıklarında, saf Python kısım sırayla çalıştırılabilir.
+    """
+
+    def __init__(self):
+        self.artik = np.empty(0)
+        self._araliklar, self._ortalamalar = [], []
+        self.ornek_sayisi = 0
+        self._sirali_gerekli = False
+
+    def ekle(self, x):
+        return self.ekle_vektorel(x).tamamla()
+
+    def ekle_vektorel(self, x):
+        """Parçanın dönüş noktaları ve vektörel dört nokta geçişleri; sonraki ekle_vektorel/sonuc'tan önce tamamla() çağrılmalı."""
+        self.ornek_sayisi += len(x)
+        # Artığın son noktası parça sınırında kesilmiş olabilir; yeni parçayla birlikte dönüşler yeniden çıkarılır.
+        r = donus_noktalari(np.concatenate((self.artik, np.asarray(x, dtype=float))))
+        self.artik, self._sirali_gerekli = _dort_nokta_vektorel(r, self._araliklar, self._ortalamalar)
+        return self
+
+    def tamamla(self):
+        """Vektörel geçişlerin verimi düştüyse artığı sıralı yığınla bitirir."""
+        if self._sirali_gerekli: self.artik = _dort_nokta_sirali(self.artik, self._araliklar, self._ortalamalar); self._sirali_gerekli = False
+        return self
+
+    def sonuc(self):
+        """Dönüş: {'aralik', 'ortalama', 'sayi'} dizileri (tam çevrim 1, artıktan gelen yarım çevrim 0.5) ve 'ornek' sayısı."""
+        artik = self.artik
+        tam_aralik = np.concatenate(self._araliklar) if self._araliklar else np.empty(0)
+        tam_ortalama = np.concatenate(self._ortalamalar) if self._ortalamalar else np.empty(0)
+        return {"aralik": np.concatenate((tam_aralik, np.abs(np.diff(artik)))),
+                "ortalama": np.concatenate((tam_ortalama, (artik[1:] + artik[:-1]) / 2)),
+                "sayi": np.concatenate((np.ones(len(tam_aralik)), np.full(max(len(artik) - 1, 0), 0.5))), "ornek": self.ornek_sayisi}
+
+
+def rainflow(x):
+    """Tek bir dizinin rainflow sayımı (bkz. RainflowSayaci.sonuc)."""
+    return RainflowSayaci().ekle(x).sonuc()
+
+
+def hasar_toplami(aralik, sayi, m=VARSAYILAN_SN_EGIMI, referans_aralik=None, referans_cevrim=None):
+    """
+    Palmgren-Miner hasar toplamı, S-N eğrisi N = N_ref·(Δ_ref/Δ)^m ile. Referans verilmezse göreli (sözde)
+    hasar Σ n·Δ^m döner; bu durumda değerler sadece kanallar arasında karşılaştırma içindir.
+    """
+    hasar = float(np.sum(sayi * np.power(aralik, m)))
+    if referans_aralik and referans_cevrim: hasar /= referans_cevrim * referans_aralik ** m
+    return hasar
+
+
+def ozet_tablosu(sonuclar, m=VARSAYILAN_SN_EGIMI, referans_aralik=None, referans_cevrim=None):
+    """Kanal başına çevrim sayıları, en büyük aralık, ortalama aralığı ve hasar toplamı (hasara göre azalan)."""
+    satirlar = []
+    for sg, sonuc in sonuclar.items():
+        aralik, ortalama, sayi = sonuc["aralik"], sonuc["ortalama"], sonuc["sayi"]
+        satirlar.append({"SG": sg, "Tam Çevrim": int(np.sum(sayi == 1)), "Yarım Çevrim": int(np.sum(sayi == 0.5)),
+                         "Maks. Aralık (μstrain)": float(aralik.max()) if len(aralik) else 0.0,
+                         "Ort. Min (μstrain)": float(ortalama.min()) if len(ortalama) else 0.0,
+                         "Ort. Maks (μstrain)": float(ortalama.max()) if len(ortalama) else 0.0,
+                         "Hasar": hasar_toplami(aralik, sayi, m, referans_aralik, referans_cevrim)})
+    return pd.DataFrame(satirlar).sort_values("Hasar", ascending=False, ignore_index=True) if satirlar else pd.DataFrame()
+
+
+def histogram_tablosu(sonuclar, aralik_kutu=32, ortalama_kutu=16):
+    """Kanal başına aralık x ortalama histogramı; sadece dolu kutular, uzun biçimde (SG, kutu sınırları, çevrim sayısı)."""
+    parcalar = []
+    for sg, sonuc in sonuclar.items():
+        if not len(sonuc["aralik"]): continue
+        sayim, aralik_sinir, ortalama_sinir = np.histogram2d(sonuc["aralik"], sonuc["ortalama"], bins=(aralik_kutu, ortalama_kutu), weights=sonuc["sayi"])
+        i, j = np.nonzero(sayim)
+        parcalar.append(pd.DataFrame({"SG": sg, "Aralık Alt": aralik_sinir[i], "Aralık Üst": aralik_sinir[i + 1],
+                                      "Ortalama Alt": ortalama_sinir[j], "Ortalama Üst": ortalama_sinir[j + 1], "Çevrim": sayim[i, j]}))
+    return pd.concat(parcalar, ignore_index=True) if parcalar else pd.DataFrame()
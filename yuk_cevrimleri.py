@@ -0,0 +1,166 @@
+import numpy as np
+
+# Segment türleri: yük artıyor, azalıyor veya sabit (bekleme).
+YUKLEME, BOSALTMA, BEKLEME = 1, -1, 0
+SEGMENT_TURLERI = {YUKLEME: "yükleme", BOSALTMA: "boşaltma", BEKLEME: "bekleme"}
+KOLLAR = ("yukleme", "bosaltma")
+
+
+def donum_noktalari(yuk, tolerans):
+    """
+    Histerezisli tepe/çukur tespiti: yön, son uç değerden 'tolerans'tan fazla geri dönüldüğünde değişmiş sayılır
+    (gürültü kaynaklı küçük geri dönüşler yok sayılır). Yerel uç noktalar önce vektörel olarak bulunur; döngü sadece
+    bu adaylar üzerinde çalışır. Dönüş: dönüm noktalarının konumları (ilk ve son örnek dahil, sıralı).
+    """
+    n = len(yuk)
+    if n < 3: return np.arange(n)
+    yon = np.sign(np.diff(yuk))
+    hareket = np.flatnonzero(yon)  # Düzlükler atlanır; uç değer düzlüğe ilk ulaşılan örnektir.
+    if len(hareket) < 2: return np.array([0, n - 1])
+    adaylar = hareket[:-1][yon[hareket[1:]] != yon[hareket[:-1]]] + 1
+    noktalar, en_kucuk, en_buyuk = [0], (yuk[0], 0), (yuk[0], 0)
+    tepe_araniyor = None  # İlk anlamlı hareketin yönü belli olana kadar bilinmiyor
+    for i in np.append(adaylar, n - 1):
+        deger = yuk[i]
+        if deger > en_buyuk[0]: en_buyuk = (deger, i)
+        if deger < en_kucuk[0]: en_kucuk = (deger, i)
+        if tepe_araniyor is None:
+            if deger > en_kucuk[0] + tolerans: tepe_araniyor = True
+            elif deger < en_buyuk[0] - tolerans: tepe_araniyor = False
+        elif tepe_araniyor and deger < en_buyuk[0] - tolerans:
+            noktalar.append(en_buyuk[1]); en_kucuk = (deger, i); tepe_araniyor = False
+        elif not tepe_araniyor and deger > en_kucuk[0] + tolerans:
+            noktalar.append(en_kucuk[1]); en_buyuk = (deger, i); tepe_araniyor = True
+    noktalar.append(n - 1)
+    return np.unique(noktalar)
+
+
+def bekleme_bolgeleri(yuk, esik, min_ornek):
+    """Ardışık farkları 'esik' içinde kalan ve en az 'min_ornek' örnek süren bölgeler: (başlangıç, bitiş) dizileri."""
+    sabit = np.abs(np.diff(yuk)) <= esik
+    kenarlar = np.diff(np.concatenate(([0], sabit.astype(np.int8), [0])))
+    baslangic, bitis = np.flatnonzero(kenarlar == 1), np.flatnonzero(kenarlar == -1)  # bitis: son sabit farkın bir sonrası
+    uzun = (bitis - baslangic + 1) >= min_ornek
+    return baslangic[uzun], bitis[uzun]
+
+
+class YukCevrimIndeksi:
+    """
+    Yük sütunu bir kez taranarak çıkarılan segment ve çevrim indeksi. Segmentler yükleme, boşaltma veya bekleme
+    türündedir; her çevrim bir çukurdan sonraki çukura kadar sürer ve tepe noktası yükleme ile boşaltma kollarını
+    ayırır. Seçimler (aralik) sadece saklanan konumlardan üretilir, veri yeniden taranmaz.
+    tolerans: dönüm noktası histerezisi (varsayılan: yük aralığının %2'si);
+    bekleme_esigi / bekleme_min_ornek: ardışık farkı eşik içinde kalan en az bu kadar örnek bekleme sayılır
+    (varsayılan eşik aralığın 1e-9 katıdır, yani sadece sayısal olarak sabit yük).
+    """
+
+    def __init__(self, yuk, tolerans=None, bekleme_esigi=None, bekleme_min_ornek=5):
+        yuk = np.asarray(yuk, dtype=float)
+        self.n = n = len(yuk)
+        aralik = float(np.ptp(yuk)) if n else 0.0
+        self.tolerans = tolerans if tolerans is not None else 0.02 * aralik
+        # Varsayılan bekleme: yük sayısal olarak sabit; gürültülü beklemeler için eşik açıkça verilmelidir.
+        esik = bekleme_esigi if bekleme_esigi is not None else 1e-9 * aralik
+        self.en_yuksek_tepe = int(np.argmax(yuk)) if n else 0
+
+        donumler = donum_noktalari(yuk, self.tolerans)
+        bekleme_bas, bekleme_son = bekleme_bolgeleri(yuk, esik, bekleme_min_ornek) if n > 1 else (np.array([], int), np.array([], int))
+        sinirlar = np.unique(np.concatenate((donumler, bekleme_bas, bekleme_son)))
+        self.segment_baslangic, self.segment_bitis = sinirlar[:-1], sinirlar[1:]
+        # Segment bir bekleme bölgesinin içindeyse bekleme, değilse net yük değişimine göre yükleme/boşaltma.
+        bolge = np.searchsorted(bekleme_bas, self.segment_baslangic, side="right") - 1
+        beklemede = np.zeros(len(bolge), dtype=bool)
+        if len(bekleme_son): beklemede = (bolge >= 0) & (self.segment_bitis <= bekleme_son[np.maximum(bolge, 0)])
+        degisim = yuk[self.segment_bitis] - yuk[self.segment_baslangic]
+        self.segment_turu = np.where(beklemede | (np.abs(degisim) <= max(esik, self.tolerans)), BEKLEME, np.sign(degisim)).astype(np.int8)
+
+        # Çevrim sınırları: iç çukurlar (dönüm noktalarında iki komşusundan düşük olanlar) + ilk ve son örnek.
+        degerler = yuk[donumler]
+        cukurlar = donumler[1:-1][(degerler[1:-1] < degerler[:-2]) & (degerler[1:-1] < degerler[2:])] if len(donumler) > 2 else donumler[:0]
+        cevrim_sinirlari = np.unique(np.concatenate(([0], cukurlar, [max(n - 1, 0)])))
+        self.cevrim_baslangic, self.cevrim_bitis = cevrim_sinirlari[:-1], cevrim_sinirlari[1:]
+        self.cevrim_tepe = np.array([b + int(np.argmax(yuk[b:e + 1])) for b, e in zip(self.cevrim_baslangic, self.cevrim_bitis)], dtype=int)
+        self.tepe_yuku = yuk[self.cevrim_tepe] if len(self.cevrim_tepe) else np.array([])
+        self.segment_cevrimi = np.searchsorted(self.cevrim_baslangic, self.segment_baslangic, side="right") - 1
+        # En yüksek tepeyi içeren çevrim: çevrim seçilmemiş analizlerin (histerezis, doğrusallık) varsayılanı.
+        self.tepe_cevrimi = int(np.searchsorted(self.cevrim_baslangic, self.en_yuksek_tepe, side="right") - 1) if len(self.cevrim_baslangic) else None
+
+    def __len__(self):
+        return len(self.cevrim_baslangic)
+
+    def aralik(self, cevrim=None, kol=None):
+        """
+        Satır aralığı (slice): cevrim=None tüm veri, aksi halde 0 tabanlı çevrim numarası; kol 'yukleme' çukurdan
+        tepeye, 'bosaltma' tepeden sonraki çukura kadardır. cevrim=None ile kol verilirse en yüksek tepe kullanılır.
+        """
+        if kol is not None and kol not in KOLLAR: raise ValueError(f"Bilinmeyen kol: '{kol}'. Seçenekler: {', '.join(KOLLAR)}")
+        if cevrim is None:
+            baslangic, tepe, bitis = 0, self.en_yuksek_tepe, self.n - 1
+        else:
+            if not 0 <= cevrim < len(self): raise IndexError(f"Çevrim {cevrim + 1} yok; veride {len(self)} çevrim var.")
+            baslangic, tepe, bitis = self.cevrim_baslangic[cevrim], self.cevrim_tepe[cevrim], self.cevrim_bitis[cevrim]
+        if kol == "yukleme": return slice(int(baslangic), int(tepe) + 1)
+        if kol == "bosaltma": return slice(int(tepe), int(bitis) + 1)
+        return slice(int(baslangic), int(bitis) + 1)
+
+    def segmentler(self):
+        """Segment tablosu: [{'cevrim', 'tur', 'baslangic', 'bitis'}] (çevrim 1 tabanlı)."""
+        return [{"cevrim": int(c) + 1, "tur": SEGMENT_TURLERI[int(t)], "baslangic": int(b), "bitis": int(e)}
+                for b, e, t, c in zip(self.segment_baslangic, self.segment_bitis, self.segment_turu, self.segment_cevrimi)]
+
+
+def izgaraya_tasi(yuk, veriler, izgara):
+    """Bir kolun tüm kanallarını (satır x kanal) ortak yük ızgarasına tek bir indeks/ağırlık hesabıyla doğrusal enterpole eder."""
+    sira = np.argsort(yuk, kind="stable"); x = yuk[sira]
+    i = np.clip(np.searchsorted(x, izgara), 1, len(x) - 1)
+    x0, x1 = x[i - 1], x[i]
+    agirlik = np.clip(np.divide(izgara - x0, x1 - x0, out=np.zeros(len(izgara)), where=x1 > x0), 0, 1)[:, None]
+    return veriler[sira[i - 1]] * (1 - agirlik) + veriler[sira[i]] * agirlik
+
+
+def histerezis_analizi(yuk, veriler, yukleme, bosaltma, nokta_sayisi=200):
+    """
+    Yükleme ve boşaltma kollarını (slice) ortak yük ızgarasına taşıyıp tüm kanallar için birlikte hesaplar:
+    histerezis alanı |∫(ε_boşaltma - ε_yükleme) dL|, yükleme eğrisi altındaki alana göre yüzdesi, en düşük ortak
+    yükteki kalıcı gerinim (boşaltma - yükleme) ve en büyük kol farkı ile oluştuğu yük. veriler: (satır x kanal).
+    Dönüş: {ölçü: kanal başına dizi}.
+    """
+    yuk_yukleme, yuk_bosaltma = yuk[yukleme], yuk[bosaltma]
+    if len(yuk_yukleme) < 2 or len(yuk_bosaltma) < 2: raise ValueError("Yükleme ve boşaltma kollarının her biri en az iki nokta içermelidir.")
+    alt, ust = max(yuk_yukleme.min(), yuk_bosaltma.min()), min(yuk_yukleme.max(), yuk_bosaltma.max())
+    if not ust > alt: raise ValueError("Yükleme ve boşaltma kollarının ortak yük aralığı yok.")
+    izgara = np.linspace(alt, ust, nokta_sayisi)
+    artan = izgaraya_tasi(yuk_yukleme, veriler[yukleme], izgara)
+    fark = izgaraya_tasi(yuk_bosaltma, veriler[bosaltma], izgara) - artan
+    adim = np.diff(izgara)[:, None]
+    alan = np.abs(np.sum((fark[1:] + fark[:-1]) / 2 * adim, axis=0))
+    yukleme_alani = np.abs(np.sum(((artan[1:] + artan[:-1]) / 2 - artan[0]) * adim, axis=0))
+    en_buyuk = np.argmax(np.abs(fark), axis=0)
+    return {"alan": alan, "goreli_alan": 100 * np.divide(alan, yukleme_alani, out=np.full(len(alan), np.nan), where=yukleme_alani > 0),
+            "kalici": fark[0], "maks_fark": np.abs(fark[en_buyuk, np.arange(fark.shape[1])]), "maks_fark_yuku": izgara[en_buyuk]}
+
+
+def dogrusallik_analizi(yuk, veriler, parca_satir=100_000):
+    """
+    Tüm kanallar için ε = eğim·L + kesişim en küçük kareler uyumu tek bir matris çözümüyle: merkezlenmiş yükle
+    X = [L - L̄, 1] için (XᵀX)β = XᵀY (2x2 sistem, tüm kanallar sağ taraf). R² kapalı formdan, en büyük sapma satır
+    parçalarında bulunur (satır x kanal boyutunda ek dizi oluşturulmaz). veriler: (satır x kanal).
+    Dönüş: {'egim', 'kesisim', 'r2', 'maks_sapma', 'maks_sapma_yuku'} (kanal başına diziler).
+    """
+    yuk = np.asarray(yuk, dtype=float)
+    if len(yuk) < 2 or np.ptp(yuk) == 0: raise ValueError("Doğrusallık için en az iki farklı yük değeri gerekir.")
+    merkez = yuk - yuk.mean()
+    X = np.column_stack((merkez, np.ones(len(yuk))))
+    egim, ortalama = np.linalg.solve(X.T @ X, X.T @ veriler)
+    kesisim = ortalama - egim * yuk.mean()
+    toplam_kare = np.einsum("ij,ij->j", veriler, veriler) - len(yuk) * ortalama ** 2
+    artik_kare = np.maximum(toplam_kare - egim ** 2 * (merkez @ merkez), 0)
+    r2 = 1 - np.divide(artik_kare, toplam_kare, out=np.zeros_like(artik_kare), where=toplam_kare > 0)
+    maks_sapma, sapma_konumu = np.full(veriler.shape[1], -1.0), np.zeros(veriler.shape[1], dtype=int)
+    for i in range(0, len(yuk), parca_satir):
+        artik = veriler[i:i + parca_satir] - (yuk[i:i + parca_satir, None] * egim + kesisim)
+        np.abs(artik, out=artik)
+        j = np.argmax(artik, axis=0); deger = artik[j, np.arange(len(j))]
+        buyuk = deger > maks_sapma
+        maks_sapma[buyuk], sapma_konumu[buyuk] = deger[buyuk], j[buyuk] + i
+    return {"egim": egim, "kesisim": kesisim, "r2": r2, "maks_sapma": maks_sapma, "maks_sapma_yuku": yuk[sapma_konumu]}